@@ -0,0 +1,104 @@
+from lwe_with_hints import *
+from lwe_with_hints.lwe_gen import implementedSchemes
+from lwe_with_hints.modular_linalg import gaussianElimination
+
+import numpy as np
+import argparse
+import time
+
+
+def parseArguments():
+  parser = argparse.ArgumentParser()
+
+  parser.add_argument("benchmark", type=str, choices=["basis", "elimination", "sublattice"])
+  parser.add_argument("-schemes", type=str, default=",".join(implementedSchemes), help="Comma-separated list of schemes to benchmark.")
+  parser.add_argument("-hints", type=int, default=700, help="Number of mod-q hints for the elimination benchmark.")
+  parser.add_argument("-counts", type=str, default="200,400,600,900", help="Comma-separated list of numbers of perfect hints for the sublattice benchmark.")
+  parser.add_argument("-engines", type=str, default="scaled,kernel,dual", help="Comma-separated list of sublattice constructions to benchmark.")
+  parser.add_argument("-file", type=str, default="output_benchmarks.txt", help="Output is written into file with name -file.")
+
+  args, unknown = parser.parse_known_args()
+
+  if len(unknown) > 0:
+    print("Unknown arguments " + str(unknown) + " will be ignored.")
+
+  return vars(args)
+
+def report(output, fileName):
+  print( "\033[94m" + output + "\033[0m" )
+  with open(fileName, "a+") as f:
+    print(output, file=f)
+
+"""
+  Measures the time for constructing the Kannan embedding of an LWE instance without hints.
+"""
+def benchmarkBasis(scheme, fileName):
+  A,b,q,s,e = generateLWEInstance(scheme)
+  lattice = LWELattice(A,b,q)
+
+  start = time.time()
+  basis = lattice._LWELattice__constructBasis()
+  stop = time.time()
+
+  report( "Basis construction.\tScheme: %s\tDimension: %d\tTime: %fs" % (scheme, basis.nrows, (stop-start)), fileName )
+
+"""
+  Measures the time for eliminating one coordinate of the secret per mod-q hint,
+  as done for dimension reduction, both row by row and blockwise.
+"""
+def benchmarkElimination(scheme, ctrHints, fileName):
+  A,b,q,s,e = generateLWEInstance(scheme)
+  n = len(s)
+
+  V = np.random.randint( 0, q, (ctrHints, n) )
+  L = V.dot(s) % q
+
+  M = np.hstack( [V.T, A] )
+  y = np.concatenate( [L, b] )
+
+  for blockSize in [None, 32]:
+    start = time.time()
+    gaussianElimination( M, y, ctrHints, q, ctrHints, blockSize=blockSize )
+    stop = time.time()
+
+    report( "Elimination.\tScheme: %s\tHints: %d\tBlock size: %s\tTime: %fs" % (scheme, ctrHints, blockSize, (stop-start)), fileName )
+
+"""
+  Measures the time for constructing the sublattice orthogonal to ctrHints perfect hints,
+  by LLL-reducing scaled hint columns, via the integer kernel and via the dual side, respectively.
+"""
+def benchmarkSublattice(scheme, ctrHints, engines, fileName):
+  A,b,q,s,e = generateLWEInstance(scheme)
+  n = len(s)
+
+  if ctrHints >= n:
+    report( "Sublattice construction.\tScheme: %s\tHints: %d\tSkipped, since n = %d." % (scheme, ctrHints, n), fileName )
+    return
+
+  V = np.random.randint( 0, q, (ctrHints, n) )
+  L = V.dot(s)
+
+  for engine in engines:
+    lattice = LWELattice( A,b,q, kernelSublattice = (engine == "kernel"), dualSublattice = (engine == "dual") )
+    lattice.integratePerfectHints(V, L)
+
+    start = time.time()
+    basis = lattice._LWELattice__constructBasis()
+    lattice._LWELattice__constructSubLattice(basis)
+    stop = time.time()
+
+    report( "Sublattice construction.\tScheme: %s\tHints: %d\tEngine: %s\tTime: %fs" % (scheme, ctrHints, engine, (stop-start)), fileName )
+
+args = parseArguments()
+
+schemes = args["schemes"].split(",")
+fileName = args["file"]
+
+for scheme in schemes:
+  if args["benchmark"] == "basis":
+    benchmarkBasis(scheme, fileName)
+  elif args["benchmark"] == "elimination":
+    benchmarkElimination(scheme, args["hints"], fileName)
+  elif args["benchmark"] == "sublattice":
+    for ctrHints in map( int, args["counts"].split(",") ):
+      benchmarkSublattice(scheme, ctrHints, args["engines"].split(","), fileName)
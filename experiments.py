@@ -18,6 +18,7 @@ def parseArguments():
   parser.add_argument("-file", type=str, default="output_experiments.txt", help="Output is written into file with name -file.")
   parser.add_argument("-hints_centered", action="store_true", help="If set, then hints are drawn from {-(q-1)/2,...,(q-1)/2}^n. Otherwise from {0,...,q-1}^n.")
   parser.add_argument("-modular", action="store_true", help="If set, then generate mod-q hints. Otherwise perfect hints.")
+  parser.add_argument("-sweep", action="store_true", help="If set, then all numbers of hints of an instance are processed by a single sweep, which reuses reduced bases.")
   parser.add_argument("-verbose", action="store_true")
 
   args, unknown = parser.parse_known_args()
@@ -55,11 +56,12 @@ def experiment( A,b,q,hints,modular,fileName,verbose ):
   try:
     start = time.time()
     
-    for i in range(ctrHints):
+    #The random hints are consistent, and independent with overwhelming probability, so they are not validated.
+    if ctrHints > 0:
       if modular:
-        lattice.integrateModularHint( V[i], L[i] % q, q )
+        lattice.integrateModularHints( np.array(V), np.array(L) % q, q, validate = False )
       else:
-        lattice.integratePerfectHint( V[i], L[i] )
+        lattice.integratePerfectHints( np.array(V), np.array(L), validate = False )
     
     lattice.reduce(maxBlocksize=40)
     stop = time.time()
@@ -78,6 +80,35 @@ def experiment( A,b,q,hints,modular,fileName,verbose ):
     with open(fileName, "a+") as f:
       print(output, file=f)
 
+def sweepExperiment( A,b,q,hints,counts,modular,fileName,verbose ):
+  
+  lattice = LWELattice(A,b,q,verbose=verbose)
+  V, L = hints
+  
+  try:
+    start = time.time()
+    
+    if modular:
+      blocksizes = lattice.sweep( np.array(V), np.array(L) % q, counts, moduli=q, ascending=True, maxBlocksize=40 )
+    else:
+      blocksizes = lattice.sweep( np.array(V), np.array(L), counts, ascending=True, maxBlocksize=40 )
+    
+    stop = time.time()
+    
+    output = "\n".join( "Finished experiment.\tHints: %d\tBlocksize: %s" % (k, blocksizes[k] if blocksizes[k] is not None else "-") for k in sorted(blocksizes) )
+    output += "\nFinished sweep.\tTime: %fs" % (stop-start)
+    print( "\033[94m" + output + "\033[0m" )
+    print(lattice.s)
+    with open(fileName, "a+") as f:
+      print(output, file=f)
+      
+  except Exception:
+    #Print exceptions manualy, because Pool may hide them.
+    output = traceback.format_exc()
+    print(output)
+    with open(fileName, "a+") as f:
+      print(output, file=f)
+
 args = parseArguments()
 
 scheme = args["scheme"]
@@ -91,6 +122,7 @@ range_hints = range( hints_min, hints_max + 1, hints_step )
 hints_centered = args["hints_centered"]
 modular = args["modular"]
 
+sweep = args["sweep"]
 trials = args["trials"]
 fileName = args["file"]
 verbose = args["verbose"]
@@ -109,9 +141,17 @@ for i in range(trials):
   
   hints = generateHints(s, q, hints_max + hints_step, hints_centered)
   
+  if sweep:
+    instances.append( (A, b, q, hints, list(range_hints), modular, fileName, verbose) )
+    continue
+  
   for j in range_hints:
     hints = tuple( [  y for y in x[:-hints_step] ] for x in hints )
     instances.append( (A, b, q, hints, modular, fileName,verbose) )
 
 pool = Pool()
-pool.starmap( experiment, instances )
\ No newline at end of file
+
+if sweep:
+  pool.starmap( sweepExperiment, instances )
+else:
+  pool.starmap( experiment, instances )
\ No newline at end of file
@@ -1,4 +1,6 @@
 from numpy import array as vec
 
-from lwe_with_hints.lwe_gen import generateLWEInstance, loadLWEInstanceFromFile, generateToyInstance
-from lwe_with_hints.lwe_lattice import LWELattice
\ No newline at end of file
+from lwe_with_hints.lwe_gen import generateLWEInstance, loadLWEInstanceFromFile, generateToyInstance, ringHints
+from lwe_with_hints.lwe_lattice import LWELattice
+from lwe_with_hints.bkz_schedule import BKZSchedule
+from lwe_with_hints.lwe_decoder import LWEDecoder
@@ -0,0 +1,118 @@
+from fpylll import BKZ as BKZ_FPYLLL
+from fpylll.tools.bkz_simulator import simulate as simulateBKZ
+
+import time
+
+class BKZSchedule:
+
+  """
+    Schedule for Progressive-BKZ, as run by LWELattice.reduce().
+    The default schedule increases the blocksize by 1, starting at 2,
+    and runs 8 calls of BKZ with at most 8 loops each per blocksize.
+    Params:
+      startBlocksize: First blocksize (optional).
+      step: Increase of the blocksize after every step (optional). The maximal blocksize is always run.
+      tours: Maximal number of calls of BKZ per blocksize (optional).
+      loops: Maximal number of BKZ loops per call (optional).
+      autoAbort: If True, then a call of BKZ stops as soon as the slope of the GSO profile stagnates,
+        and no further calls are made for the current blocksize, if the slope did not improve (optional).
+      timePerStep: Time budget in seconds per blocksize (optional). BKZ is interrupted after this time,
+        and no further calls are made for the current blocksize.
+      simulate: If True, then the blocksize, at which the secret is found, is predicted by running the BKZ simulator
+        of Chen and Nguyen on the GSO profile after LLL, and BKZ starts simulationOffset blocksizes below the prediction (optional).
+      simulationOffset: See simulate (optional).
+      expectedLength: Expected norm of the shortest vector, i.e., of (e,s,1), for the prediction (optional).
+        If not set, then the target length of reduce() is used, which usually overestimates the blocksize,
+        or else sqrt((m+n)*secretVariance + 1) for the secretVariance of the lattice. Without both, no prediction is made.
+  """
+  def __init__(
+    self,
+    startBlocksize = 2,
+    step = 1,
+    tours = 8,
+    loops = 8,
+    autoAbort = False,
+    timePerStep = None,
+    simulate = False,
+    simulationOffset = 3,
+    expectedLength = None
+  ):
+
+    if startBlocksize < 2 or step < 1 or tours < 1 or loops < 1:
+      raise ValueError("Expected startBlocksize >= 2 and step, tours, loops >= 1.")
+
+    self.startBlocksize = startBlocksize
+    self.step = step
+    self.tours = tours
+    self.loops = loops
+    self.autoAbort = autoAbort
+    self.timePerStep = timePerStep
+    self.simulate = simulate
+    self.simulationOffset = simulationOffset
+    self.expectedLength = expectedLength
+
+  """
+    Blocksizes from max(startBlocksize, reachedBlocksize) to maxBlocksize.
+  """
+  def blocksizes(self, reachedBlocksize, maxBlocksize):
+    beta = max( self.startBlocksize, reachedBlocksize )
+
+    while beta <= maxBlocksize:
+      yield beta
+
+      if beta == maxBlocksize:
+        break
+
+      beta = min( beta + self.step, maxBlocksize )
+
+  """
+    Parameters for the next call of BKZ with blocksize beta, where the current step started at time stepStart.
+    Returns None, if the time budget of the step is exhausted.
+  """
+  def parameters(self, beta, stepStart):
+    flags = BKZ_FPYLLL.MAX_LOOPS
+    maxTime = 0
+
+    if self.autoAbort:
+      flags |= BKZ_FPYLLL.AUTO_ABORT
+
+    if self.timePerStep is not None:
+      maxTime = self.timePerStep - ( time.time() - stepStart )
+
+      if maxTime <= 0:
+        return None
+
+      flags |= BKZ_FPYLLL.MAX_TIME
+
+    return BKZ_FPYLLL.Param(
+      beta,
+      strategies=BKZ_FPYLLL.DEFAULT_STRATEGY,
+      max_loops=self.loops,
+      max_time=maxTime,
+      flags=flags
+    )
+
+  """
+    Decides after a call of BKZ, whether the step is finished,
+    given the slopes of the GSO profile before and after the call.
+  """
+  def stagnates(self, slopeBefore, slopeAfter):
+    return self.autoAbort and slopeAfter <= slopeBefore
+
+  """
+    Predicts the blocksize, at which a vector of norm targetLength is found, when running this schedule
+    on a basis with squared GSO norms r. This is the first blocksize beta, for which the projection of the vector
+    orthogonally to the first d-beta basis vectors, expected to be of norm sqrt(beta/d)*targetLength,
+    is shorter than the (d-beta)-th simulated GSO vector. Returns None, if there is no such blocksize up to maxBlocksize.
+  """
+  def predictBlocksize(self, r, targetLength, maxBlocksize):
+    d = len(r)
+    r = list(r)
+
+    for beta in self.blocksizes(2, maxBlocksize):
+      r, _ = simulateBKZ( r, BKZ_FPYLLL.Param( beta, max_loops=self.tours*self.loops ) )
+
+      if beta/d * targetLength**2 <= r[d-beta]:
+        return beta
+
+    return None
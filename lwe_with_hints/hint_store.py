@@ -0,0 +1,92 @@
+import numpy as np
+
+class HintStore:
+
+  """
+    Growable, contiguous storage for hints of a single type.
+    Every hint (v,l) occupies one row [v | l] of a preallocated matrix,
+    whose capacity is doubled whenever it is exhausted.
+    Additionally, every hint has a modulus (0 for hints over the integers).
+    Params:
+      n: Dimension of the hint vectors.
+      capacity: Number of hints, for which space is allocated initially (optional).
+  """
+  def __init__(self, n, capacity = 16):
+    self.__n = n
+    self.__size = 0
+    self.__hints = np.zeros( (capacity, n+1), dtype=int )
+    self.__moduli = np.zeros( capacity, dtype=int )
+
+  def __len__(self):
+    return self.__size
+
+  """
+    Appends the hints (V[i], L[i]) with modulus moduli[i].
+    Params:
+      V: Hint vectors, given as the rows of a two-dimensional numpy array.
+      L: Hint values.
+      moduli: Hint moduli, either one per hint or a single one for all hints (optional).
+  """
+  def append(self, V, L, moduli = 0):
+    k = len(V)
+    self.__reserve( self.__size + k )
+
+    rows = slice( self.__size, self.__size + k )
+    self.__hints[rows,:-1] = V
+    self.__hints[rows,-1] = L
+    self.__moduli[rows] = moduli
+
+    self.__size += k
+
+  """
+    Matrix, whose rows are the hints [v | l].
+  """
+  @property
+  def hints(self):
+    return self.__hints[:self.__size]
+
+  """
+    Matrix, whose rows are the hint vectors v.
+  """
+  @property
+  def vectors(self):
+    return self.__hints[:self.__size,:-1]
+
+  """
+    Vector of the hint values l.
+  """
+  @property
+  def values(self):
+    return self.__hints[:self.__size,-1]
+
+  @property
+  def moduli(self):
+    return self.__moduli[:self.__size]
+
+  """
+    Substitutes s_i = value - <f,s>, where f_i = 0, in all hints, and removes coordinate i.
+    Every hint (v,l) becomes (v - v_i*f, l - v_i*value) without coordinate i.
+  """
+  def substitute(self, i, f, value):
+    H = self.__hints[:self.__size]
+    c = H[:,i].copy()
+
+    H[:,:-1] -= np.outer( c, f )
+    H[:,-1] -= c * value
+
+    self.__hints = np.delete( self.__hints, i, axis=1 )
+    self.__n -= 1
+
+  def __reserve(self, size):
+    capacity = len(self.__moduli)
+
+    if size > capacity:
+      capacity = max( size, 2*capacity )
+
+      hints = np.zeros( (capacity, self.__n+1), dtype=int )
+      hints[:self.__size] = self.hints
+      self.__hints = hints
+
+      moduli = np.zeros( capacity, dtype=int )
+      moduli[:self.__size] = self.moduli
+      self.__moduli = moduli
@@ -0,0 +1,165 @@
+import numpy as np
+from math import gcd
+
+from lwe_with_hints.modular_linalg import modInverse
+
+#Prime, modulo which perfect hints are checked. Hints, that are independent over the rationals,
+#become dependent modulo this prime only with negligible probability.
+PERFECT_HINT_PRIME = 2**31 - 1
+
+#Moduli below this bound are reduced with int64 (see _dotMod), larger moduli with Python integers.
+INT64_MODULUS_BOUND = 2**31
+
+class HintValidator:
+
+  """
+    Incremental check of hints (v,l) for linear dependency and consistency, separately for every modulus.
+    Perfect hints (modulus 0) are checked modulo PERFECT_HINT_PRIME. Since a perfect hint also holds modulo
+    every modulus, it is further added to the hints of every modulus in use, including moduli of later hints.
+    For every modulus, the independent hints [v | l] are kept in reduced row echelon form mod the modulus,
+    whose pivots are invertible mod the modulus. The rows are preallocated for rank n, and filled in place.
+    A new hint is reduced by these rows, which costs O(n*rank) <= O(n^2). If v vanishes, then the hint is implied
+    by the previous ones, if also l vanishes, and contradicts them otherwise. For composite moduli, a reduced v
+    without invertible entry can neither be used as a row nor rejected, and such hints are accepted unchecked.
+    Params:
+      n: Dimension of the hint vectors.
+  """
+  def __init__(self, n):
+    self.__n = n
+    self.__rows = {}
+    self.__pivots = {}
+    self.__perfectHints = []
+
+  """
+    Number of independent hints with modulus m (0 for perfect hints), that have been accepted.
+    For m != 0, perfect hints count as hints mod m.
+  """
+  def rank(self, m = 0):
+    return len( self.__pivots.get(m, []) )
+
+  """
+    Checks the hints (V[i], L[i]) with modulus moduli[i] one after another, against the accepted hints
+    and the previous hints of V.
+    Params:
+      V: Hint vectors, given as the rows of a two-dimensional numpy array.
+      L: Hint values.
+      moduli: Hint moduli, either one per hint or a single one for all hints, where 0 denotes perfect hints (optional).
+    Returns:
+      Boolean array, which is False for every hint, that is implied by the other hints.
+    Raises:
+      ValueError, if a hint contradicts the other hints. Then none of the hints is accepted.
+  """
+  def append(self, V, L, moduli = 0):
+    moduli = np.broadcast_to( moduli, len(V) )
+    independent = np.ones( len(V), dtype=bool )
+
+    #The hints of V are inserted into copies, which are kept only if no hint contradicts the others.
+    rows = { m: self.__copyRows(m) for m in self.__rows }
+    pivots = { m: list(self.__pivots[m]) for m in self.__pivots }
+    perfectHints = list(self.__perfectHints)
+
+    for i in range(len(V)):
+      m = int(moduli[i])
+      v = np.array( V[i] )
+      l = int( L[i] )
+
+      if m not in rows:
+        p = m if m != 0 else PERFECT_HINT_PRIME
+        rows[m] = np.zeros( (self.__n, self.__n+1), dtype=np.int64 if p < INT64_MODULUS_BOUND else object )
+        pivots[m] = []
+
+        for u, k in perfectHints:
+          if self.__insert( rows, pivots, m, u, k ) is None:
+            raise ValueError("Hint %d contradicts the previous perfect hints mod %d." % (i, m))
+
+      status = self.__insert( rows, pivots, m, v, l )
+
+      if status is None:
+        raise ValueError("Hint %d contradicts the previous hints%s." % (i, " mod %d" % m if m != 0 else ""))
+
+      independent[i] = status
+
+      if m == 0 and status:
+        perfectHints.append( (v,l) )
+
+        for modulus in rows:
+          if modulus != 0 and self.__insert( rows, pivots, modulus, v, l ) is None:
+            raise ValueError("Hint %d contradicts the previous hints mod %d." % (i, modulus))
+
+    self.__rows = rows
+    self.__pivots = pivots
+    self.__perfectHints = perfectHints
+
+    return independent
+
+  """
+    Copy of the preallocated rows of modulus m, which copies only the rows filled so far.
+  """
+  def __copyRows(self, m):
+    R = self.__rows[m]
+    r = len( self.__pivots[m] )
+
+    C = np.zeros( R.shape, dtype=R.dtype )
+    C[:r] = R[:r]
+
+    return C
+
+  """
+    Reduces the hint (v,l) by the rows of modulus m and adds it as a new row, if possible.
+    Returns False, if the hint is implied by the rows, None, if it contradicts them, and True otherwise.
+  """
+  def __insert(self, rows, pivots, m, v, l):
+    p = m if m != 0 else PERFECT_HINT_PRIME
+
+    #Rows of reduced row echelon form have a unit at their pivot and zeros at all other pivots.
+    R = rows[m][:len(pivots[m])]
+
+    h = np.zeros( self.__n+1, dtype=R.dtype )
+    h[:-1] = np.array(v, dtype=R.dtype) % p
+    h[-1] = l % p
+
+    if len(R) > 0:
+      h = ( h - _dotMod( h[pivots[m]], R, p ) ) % p
+
+    candidates = np.flatnonzero( h[:-1] )
+
+    if len(candidates) == 0:
+      if h[-1] != 0:
+        return None
+
+      return False
+
+    invertible = [ j for j in candidates if gcd( int(h[j]), p ) == 1 ]
+
+    if len(invertible) == 0:
+      return True
+
+    pivot = invertible[0]
+    h = h * modInverse( int(h[pivot]), p ) % p
+
+    #R is a view of the preallocated rows, which are updated in place.
+    if len(R) > 0:
+      R -= np.outer( R[:,pivot], h ) % p
+      R %= p
+
+    rows[m][len(R)] = h
+    pivots[m].append(pivot)
+
+    return True
+
+"""
+  Returns x*R mod p for entries in [0,p). For p < 2^31, x is split into 16-bit halves,
+  such that all sums of products fit into 64 bits for up to 2^15 rows of R.
+  Larger moduli require Python integers, i.e., R of dtype object.
+"""
+def _dotMod(x, R, p):
+  if p >= INT64_MODULUS_BOUND:
+    if R.dtype != object:
+      raise ValueError("Expected Python integers for modulus %d >= 2^31." % p)
+
+    return x.dot(R) % p
+
+  high = x >> 16
+  low = x & 0xFFFF
+
+  return ( ( high.dot(R) % p ) * 2**16 + low.dot(R) % p ) % p
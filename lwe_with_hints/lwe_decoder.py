@@ -0,0 +1,229 @@
+from fpylll import BKZ as BKZ_FPYLLL, LLL, GSO, IntegerMatrix
+
+import numpy as np
+from math import sqrt, pi, e, ceil, exp
+
+import time
+
+class LWEDecoder:
+
+  """
+    Decoder for many LWE instances b = s*A + e mod q, which share the matrix A, e.g., several ciphertexts under one public key.
+    The lattice of all vectors (s*A mod q, w*(s*V mod moduli), s) is reduced once, where the columns of V are the hint vectors,
+    scaled by a large weight w. Then every b with hint values l is decoded in the closest vector problem with target (b, w*l, 0),
+    whose distance to the lattice vector of s is the norm of (e, 0, -s), whereas every vector violating a hint is at distance >= w.
+    Params:
+      A, q: Matrix and modulus of the LWE instances.
+      hintVectors: Hint vectors v, given as the rows of a two-dimensional numpy array (optional).
+        The hint values <s,v> are passed to solve() / solveMany() for every instance.
+      hintModuli: Hint moduli, either one per hint or a single one for all hints, where 0 denotes perfect hints (optional).
+      blocksize: BKZ blocksize for the reduction of the lattice (optional).
+      radius: Bound on the norm of (e,s) (optional). Decoding fails, if no lattice vector within this distance is found.
+        Defaults to the gaussian heuristic of the sublattice of vectors, which satisfy the hints.
+      enumerate: If True, then targets, for which Babai's nearest plane algorithm does not find a lattice vector
+        within distance radius, are decoded via bounded enumeration (optional). Like nearest plane, the enumeration runs
+        through the Gram-Schmidt vectors from last to first, but tries the three nearest coefficients for every vector,
+        and keeps the beamWidth partial solutions closest to the target.
+      beamWidth: Number of partial solutions kept by the bounded enumeration (optional).
+      verbose: If True, then the decoder prints its progress (optional).
+  """
+  def __init__(
+    self,
+    A,
+    q,
+    hintVectors = None,
+    hintModuli = 0,
+    blocksize = 20,
+    radius = None,
+    enumerate = False,
+    beamWidth = 64,
+    verbose = False
+  ):
+
+    if blocksize < 2:
+      raise ValueError("Expected blocksize >= 2.")
+
+    self.__A = A
+    self.__q = q
+    self.__n, self.__m = A.shape
+    self.__enumerate = enumerate
+    self.__beamWidth = beamWidth
+    self.__verbose = verbose
+
+    if hintVectors is None:
+      hintVectors = np.zeros( (0, self.__n), dtype=int )
+
+    if np.ndim(hintVectors) != 2 or np.shape(hintVectors)[1] != self.__n:
+      raise ValueError("Expected hint vectors of dimension %d as rows of a two-dimensional array." % self.__n)
+
+    self.__V = np.array(hintVectors, dtype=int)
+    self.__h = len(self.__V)
+    self.__moduli = np.zeros( self.__h, dtype=int ) + hintModuli
+
+    #Any vector, that violates a hint, is longer than every (e,s) of interest.
+    d = self.__m + self.__h + self.__n
+    self.__weight = ceil( sqrt(d) * q )
+
+    start = time.time()
+    self.basis = self.__reduceBasis(blocksize)
+    self.reductionTime = time.time() - start
+
+    self.__vPrint("Finished reduction. Time: %fs." % self.reductionTime)
+
+    if radius is None:
+      M = GSO.Mat( IntegerMatrix.from_matrix( self.basis.tolist() ) )
+      M.update_gso()
+
+      #The last h Gram-Schmidt vectors belong to the scaled hint columns.
+      dim = len(self.basis) - self.__h
+      radius = sqrt( dim / ( 2*pi*e ) ) * exp( M.get_log_det(0,dim) / ( 2*dim ) )
+
+    self.radius = radius
+
+    #Gram-Schmidt orthogonalization as basis = L*Q^T with lower triangular L, cached for nearest plane.
+    Q, R = np.linalg.qr( self.basis.T.astype(float) )
+    self.__Q = Q
+    self.__L = R.T
+
+  """
+    Decodes a single LWE instance with the right-hand side b and hint values l.
+    Returns the secret s, or None if decoding fails.
+  """
+  def solve(self, b, l = None):
+    if l is not None:
+      l = np.array( [l] )
+
+    return self.solveMany( np.array( [b] ), l )[0]
+
+  """
+    Decodes the LWE instances with right-hand sides given by the rows of B, and hint values given by the rows of L.
+    Nearest plane is run for all targets at once. Targets, for which it fails, are enumerated one by one, if enabled.
+    Values of modular hints are reduced mod their moduli, which keeps the weighted hint values of the targets small.
+    Returns a list of secrets, where failed decodings are None.
+    Raises:
+      ValueError, if a weighted hint value exceeds 64 bits.
+  """
+  def solveMany(self, B, L = None):
+    m, h = self.__m, self.__h
+    B = np.array(B, dtype=int) % self.__q
+    k = len(B)
+
+    if L is None:
+      L = np.zeros( (k, h), dtype=int )
+
+    #Python integers, since the weighted hint values may exceed 64 bits.
+    L = np.array(L, dtype=object).reshape( k, h )
+    modular = np.flatnonzero( self.__moduli != 0 )
+    L[:,modular] %= self.__moduli[modular].astype(object)
+    W = self.__weight * L
+
+    if W.size > 0 and np.max( np.abs(W) ) > np.iinfo(np.int64).max:
+      raise ValueError("Weighted hint values exceed 64 bits. Expected perfect hint values of at most %d." % ( np.iinfo(np.int64).max // self.__weight ))
+
+    T = np.zeros( (k, m + h + self.__n), dtype=int )
+    T[:,:m] = B
+    T[:,m:m+h] = W
+
+    V = self.__nearestPlane(T)
+    success = np.linalg.norm( T - V, axis=1 ) < self.radius
+
+    self.__vPrint("Nearest plane decoded %d of %d targets." % (np.count_nonzero(success), k))
+
+    if self.__enumerate:
+      for i in np.flatnonzero(~success):
+        v = self.__closestVector(T[i])
+
+        if v is not None:
+          V[i] = v
+          success[i] = True
+
+    S = V[:,m+h:]
+
+    return [ S[i] if success[i] else None for i in range(k) ]
+
+  """
+    Reduces the lattice spanned by the rows of
+      [ qI 0      0 ]
+      [ 0  w*P    0 ]
+      [ A  w*V^T  I ],
+    where P is the diagonal matrix of the moduli of the modular hints. Perfect hints have no row in P.
+  """
+  def __reduceBasis(self, blocksize):
+    n, m, h = self.__n, self.__m, self.__h
+    modular = np.flatnonzero( self.__moduli != 0 )
+    r = m + len(modular)
+
+    B = np.zeros( (r + n, m + h + n), dtype=int )
+    B[range(m),range(m)] = self.__q
+    B[range(m,r),m+modular] = self.__weight * self.__moduli[modular]
+    B[r:,:m] = self.__A
+    B[r:,m:m+h] = self.__weight * self.__V.T
+    B[r:,m+h:] = np.identity( n, dtype=int )
+
+    basis = IntegerMatrix.from_matrix( B.tolist() )
+
+    self.__vPrint("Starting LLL.")
+    LLL.reduction(basis)
+
+    self.__vPrint("Starting BKZ with blocksize %d." % blocksize)
+    BKZ_FPYLLL.reduction( basis, BKZ_FPYLLL.Param(
+      blocksize,
+      strategies=BKZ_FPYLLL.DEFAULT_STRATEGY,
+      max_loops=8,
+      flags=BKZ_FPYLLL.MAX_LOOPS | BKZ_FPYLLL.AUTO_ABORT
+    ) )
+
+    return np.array( [ list(v) for v in basis ], dtype=int )
+
+  """
+    Babai's nearest plane algorithm for all rows of T at once.
+    Returns the lattice vectors found as rows of a matrix.
+  """
+  def __nearestPlane(self, T):
+    L = self.__L
+    Y = T.dot(self.__Q)
+    X = np.zeros( Y.shape, dtype=int )
+
+    for i in reversed( range(len(L)) ):
+      c = np.rint( Y[:,i] / L[i,i] )
+      Y -= np.outer( c, L[i] )
+      X[:,i] = c
+
+    return X.dot(self.basis)
+
+  """
+    Bounded enumeration for the target t. Starting from the last Gram-Schmidt vector, every partial solution is extended
+    by the three integers closest to its projected coefficient, and only the beamWidth extensions closest to t are kept.
+    Returns the closest lattice vector to t within distance radius, that has been found, or None.
+  """
+  def __closestVector(self, t):
+    L = self.__L
+    offsets = np.array( [0, 1, -1] )
+
+    Y = t.dot(self.__Q)[np.newaxis]
+    X = np.zeros( Y.shape, dtype=int )
+    distances = np.zeros(1)
+
+    for i in reversed( range(len(L)) ):
+      Z = np.rint( Y[:,i] / L[i,i] )[:,np.newaxis] + offsets
+      D = distances[:,np.newaxis] + ( Y[:,i,np.newaxis] - Z*L[i,i] )**2
+
+      keep = np.argsort( D, axis=None )[:self.__beamWidth]
+      parents, children = np.unravel_index( keep, D.shape )
+      z = Z[parents,children]
+
+      Y = Y[parents] - np.outer( z, L[i] )
+      X = X[parents]
+      X[:,i] = z
+      distances = D[parents,children]
+
+    v = X[0].dot(self.basis)
+
+    if np.linalg.norm( t - v ) < self.radius:
+      return v
+
+    return None
+
+  def __vPrint(self, s):
+    if self.__verbose:
+      print(str(s))
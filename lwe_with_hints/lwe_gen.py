@@ -7,14 +7,14 @@ from falcon_gen.ntt import div_zq
 
 from lwe_with_hints.ntru_gen import NTRUKeyGenerator
 
-def generateLWEInstance(scheme):
-  implementedSchemes = [
-    "Kyber512", "Kyber768", "Kyber1024",
-    "Dilithium2", "Dilithium3", "Dilithium5",
-    "Falcon2", "Falcon4", "Falcon8", "Falcon16", "Falcon32", "Falcon64", "Falcon128", "Falcon256", "Falcon512", "Falcon1024",
-    "NTRU-HPS-509", "NTRU-HPS-677", "NTRU-HPS-821", "NTRU-HRSS"
-  ]
+implementedSchemes = [
+  "Kyber512", "Kyber768", "Kyber1024",
+  "Dilithium2", "Dilithium3", "Dilithium5",
+  "Falcon2", "Falcon4", "Falcon8", "Falcon16", "Falcon32", "Falcon64", "Falcon128", "Falcon256", "Falcon512", "Falcon1024",
+  "NTRU-HPS-509", "NTRU-HPS-677", "NTRU-HPS-821", "NTRU-HRSS"
+]
 
+def generateLWEInstance(scheme):
   if scheme not in implementedSchemes:
     raise NotImplementedError( "Scheme " + scheme + " is not supported." )
 
@@ -130,7 +130,46 @@ def module( polys, rows, cols ):
     blocks.append(row)
   
   return np.block( blocks )
-  
+
+"""
+  Returns the hints on s = (s_1, ..., s_k), which are implied by the polynomial relation
+    c_1*s_1 + ... + c_k*s_k = l
+  modulo X^n-1, where s is the secret of an instance, whose matrix is built from rotation matrices via rotMatrix() or module().
+  If cyclotomic = True, then reduction mod X^n+1 is applied, instead of X^n-1.
+  Coefficient i of c_j*s_j is the inner product of s_j with column i of the rotation matrix of c_j,
+  i.e., with (c_j[i], c_j[i-1], ..., c_j[i-n+1]), where wrapped indices are negated, if cyclotomic = True.
+  Thus, every known coefficient of l yields one hint, and the hint vectors are built at once from the index matrix (i-t) mod n.
+  Params:
+    c: Polynomial c_1, or list of polynomials c_1, ..., c_k, if s consists of k polynomials.
+    l: Known coefficients of l.
+    cyclotomic: If True, then the relation holds mod X^n+1, as for Kyber, Dilithium and Falcon. Otherwise mod X^n-1, as for NTRU (optional).
+    coefficients: Indices of the known coefficients of l (optional). Defaults to all n coefficients.
+  Returns:
+    V,L, where the rows of V are the hint vectors and L are the hint values.
+"""
+def ringHints( c, l, cyclotomic=False, coefficients=None ):
+  C = np.array(c, dtype=int).reshape( -1, np.shape(c)[-1] )
+  k, n = C.shape
+
+  if coefficients is None:
+    coefficients = np.arange(n)
+
+  i = np.array(coefficients, dtype=int)[:,np.newaxis]
+  L = np.array(l, dtype=int)
+
+  if len(L) != len(i):
+    raise ValueError("Got %d coefficients of l, but %d indices of coefficients." % (len(L), len(i)))
+
+  t = np.arange(n)
+  V = C[:,(i-t) % n]
+
+  if cyclotomic:
+    V = np.where( i < t, -V, V )
+
+  V = V.transpose(1,0,2).reshape( len(i), k*n )
+
+  return V,L
+
 """
   Returns A,s,e, where
   A is a random (n x m)-matrix mod q and
@@ -1,15 +1,58 @@
-from fpylll import BKZ as BKZ_FPYLLL, LLL, GSO, IntegerMatrix, FPLLL
+from fpylll import LLL, GSO, IntegerMatrix, FPLLL
 from fpylll.algorithms.bkz2 import BKZReduction
+from fpylll.config import float_types
+from fpylll.util import ReductionError
+
+from lwe_with_hints.bkz_schedule import BKZSchedule
+from lwe_with_hints.hint_store import HintStore
+from lwe_with_hints.hint_validator import HintValidator
+from lwe_with_hints.lwe_decoder import LWEDecoder
+from lwe_with_hints.lwe_gen import ringHints, rotMatrix
+from lwe_with_hints.modular_linalg import gaussianElimination, mulMod, wordPrimes, crt, eliminateModPrimes
 
 import numpy as np
-from math import sqrt, pi, e, log, ceil
+from math import sqrt, pi, e, log, log2, ceil, exp, gcd
 
 import time
 from copy import deepcopy
+from fractions import Fraction
 import warnings
+import json
+import os
+import sys
+import resource
+from multiprocessing import Pool
+from itertools import product
 
 FPLLL.set_precision(120)
 
+#Float types for the GSO, ordered by cost, together with the maximal dimension and the maximal bit size
+#of the basis entries, for which they are used. mpfr uses the precision set above.
+FLOAT_TYPES = [
+  ( "double", 160, 400 ),
+  ( "long double", 1100, None ),
+  ( "dd", 1500, 400 ),
+  ( "qd", 2000, 400 ),
+  ( "mpfr", None, None )
+]
+
+#Names of the float types in fpylll.config.float_types, which lists the types available in the fplll build.
+FLOAT_TYPE_NAMES = { "double": "d", "long double": "ld", "dd": "dd", "qd": "qd", "mpfr": "mpfr" }
+
+#Maximal number of non-zero coefficients of perfect hints, which are substituted into the LWE instance.
+SPARSE_HINT_SUPPORT = 4
+
+#Number of primes, modulo which the dual sublattice construction eliminates the hints at once.
+DUAL_PRIME_BATCH = 8
+
+#Minimal integer weight of an approximate hint with a variance, and minimal scaling of the other columns of the lattice.
+#The weights are rounded with relative error <= 1/(2*WEIGHT_PRECISION).
+WEIGHT_PRECISION = 16
+
+#Number of blocksizes below the blocksize reached by the previous reduction, at which BKZ starts after a warm start.
+#The new hints reduce the dimension, which leaves the derived basis slightly less reduced than the previous one.
+WARM_START_OFFSET = 2
+
 class LWELattice:
   
   """
@@ -17,11 +60,26 @@ class LWELattice:
     Params:
       A,b,q: LWE instance. A and b have to be numpy arrays.
       verbose: If True, then runs in verbose mode (optional).
+      warmStart: If True, then reduce() keeps the reduced basis, and a subsequent call of reduce()
+        derives the lattice with the newly integrated hints from it, instead of starting from scratch, and BKZ resumes
+        WARM_START_OFFSET blocksizes below the blocksize, up to which the previous basis has been reduced (optional).
+      kernelSublattice: If True, then the sublattice orthogonal to the hints is constructed from the exact integer kernel
+        of the hint columns, instead of LLL-reducing the basis with scaled hint columns (optional).
+      dualSublattice: If True, then the integer kernel of the hint columns is computed on the dual side: every hint
+        is a rank-1 update of the hint columns modulo word-size primes, and the kernel basis is built in the dimension
+        of the final sublattice, where it is LLL-reduced at the end, and before only if its entries exceed 32 bits (optional).
+        This pays off, if there are more than about n/2 hints.
+        For fewer hints, the integer kernel is used as for kernelSublattice.
+      secretVariance: Variance of the coordinates of s and e (optional). Required for approximate hints with a variance.
   """
   def __init__(
     self,
     A,b,q,
-    verbose = False
+    verbose = False,
+    warmStart = False,
+    kernelSublattice = False,
+    dualSublattice = False,
+    secretVariance = None
   ):
   
     
@@ -31,19 +89,80 @@ class LWELattice:
     
     self.__n, self.__m = A.shape
     
-    self.__perfectHints = []
-    self.__modHints = []
-    self.__approximateHints = []
+    self.__perfectHints = HintStore(self.__n)
+    self.__modHints = HintStore(self.__n)
+    self.__approximateHints = HintStore(self.__n)
+    
+    #Approximate hints with a variance, which are weighted in the embedding
+    self.__weightedHints = HintStore(self.__n)
+    self.__hintVariances = []
+    self.__secretVariance = secretVariance
+    
+    #Dependency and consistency check of perfect and modular hints
+    self.__validator = HintValidator(self.__n)
+    
+    #NTRU instances, whose key is determined only up to rotation (see __detectNTRURing), and the rotation of the key,
+    #which has been found by the last reduction, if the vector found is not the one of s.
+    self.__ntruRing = self.__detectNTRURing(A, b, q)
+    self.__rotatedKey = None
     
     self.basis = None
     self.successBlocksize = 0
+    self.predictedBlocksize = None
+    self.reductionTime = 0
     self.s = None
     self.shortestVector = None
     
-    #Speed-up, when given mod-q hints only
-    self.__modQHintsOnly = True
+    #Float and int type used by fplll in the last reduction
+    self.floatType = None
+    self.intType = None
+    self.__floatTypes = []
+    
+    #Speed-up, when given modular hints only, at least one of which is a mod-q hint
+    self.__modularHintsOnly = True
     self.__modQTransformationMatrix = None
     self.__modQEliminatedCoordinates = None
+    self.__modQRemainingCoordinates = None
+    self.__modQEmbeddedHints = 0
+    
+    #Warm start. Every row of the tracking matrix contains the coefficients
+    #of the corresponding basis vector w.r.t. the rows of the Kannan embedding,
+    #which belong to s and b, respectively.
+    self.__warmStart = warmStart
+    self.__tracking = None
+    self.__reducedHintCounts = None
+    self.__reducedBlocksize = 0
+    
+    #Basis, tracking matrix and blocksize of the last reduction after the last blocksize, at which the secret had not appeared yet.
+    #sweep() reuses them, since a basis, which contains the secret, would yield it for every neighbouring count of hints.
+    self.__unsolvedReduction = None
+    
+    #Numbers of perfect and approximate hints, whose columns replace the first coordinates of s
+    #in the basis, which was constructed last (see __exactTracking).
+    self.__trackingLayout = None
+    
+    #Sublattice construction
+    self.__kernelSublattice = kernelSublattice
+    self.__dualSublattice = dualSublattice
+    
+    #Sweep mode
+    self.__sweepCount = 0
+    
+    #Checkpoints
+    self.__checkpointPath = None
+    self.__resumePoint = None
+    
+    #Budgets
+    self.__deadline = None
+    self.__maxRss = None
+    
+    #Coordinate hints. The coordinates of s, which are not eliminated by perfect hints, are stored in
+    #remainingCoordinates, and the secret of the full instance is s*substitutionMatrix + substitutionOffset.
+    self.__substituteHints = True
+    self.__fullDimension = self.__n
+    self.__remainingCoordinates = np.arange(self.__n)
+    self.__substitutionMatrix = None
+    self.__substitutionOffset = np.zeros( self.__n, dtype=int )
     
     #Verbose mode
     self.__verbose = verbose
@@ -55,15 +174,42 @@ class LWELattice:
     Params:
       v: Hint vector, has to be a numpy array.
       l: Hint value.
+      validate: As in integratePerfectHints() (optional).
   """
-  def integratePerfectHint(self, v, l ):
-    self.__checkHintFormat(v)
+  def integratePerfectHint(self, v, l, validate = True ):
+    self.integratePerfectHints( np.array([v]), [l], validate )
+  
+  """
+    Integrates several perfect hints at once.
+    Hints, which are implied by the previously integrated perfect hints, are ignored with a warning.
+    Params:
+      V: Hint vectors, given as the rows of a two-dimensional numpy array.
+      L: Hint values.
+      validate: If False, then the hints are neither checked nor taken into account, when later hints are checked (optional).
+        This saves O(n^2) operations per hint for hints, which are known to be independent and consistent.
+    Raises:
+      ValueError, if there would be more than n perfect hints, or if a hint contradicts the previously integrated
+      perfect hints, or modular hints modulo their modulus. Then none of the hints is integrated.
+  """
+  def integratePerfectHints(self, V, L, validate = True ):
+    self.__checkHintsFormat(V, L)
     
-    if len(self.__perfectHints) < self.__n:
-      self.__perfectHints.append( np.append(v,l) )
-      self.__modQHintsOnly = False
-    else:
+    if len(self.__perfectHints) + len(V) > self.__n:
       raise ValueError("Can't integrate more than n perfect hints.")
+    
+    if validate:
+      V, L, moduli = self.__validateHints(V, L, 0)
+    
+    V, L = self.__toRemainingCoordinates(V, L)
+    
+    if self.__substituteHints:
+      V, L = self.__substituteSparseHints(V, L)
+    
+    if len(V) == 0:
+      return
+    
+    self.__perfectHints.append( V, L )
+    self.__modularHintsOnly = False
   
   """
     Integrates modular hint.
@@ -71,518 +217,2332 @@ class LWELattice:
       v: Hint vector, has to be a numpy array.
       l: Hint value.
       m: Hint modulus.
+      validate: As in integrateModularHints() (optional).
   """
-  def integrateModularHint(self, v, l, m ):
-    self.__checkHintFormat(v)
-    self.__modHints.append( [m, np.append(v,l)] )
+  def integrateModularHint(self, v, l, m, validate = True ):
+    self.integrateModularHints( np.array([v]), [l], m, validate )
+  
+  """
+    Integrates several modular hints at once.
+    Hints, which are implied by the previously integrated perfect hints and hints with the same modulus, are ignored with a warning.
+    Params:
+      V: Hint vectors, given as the rows of a two-dimensional numpy array.
+      L: Hint values.
+      moduli: Hint moduli, either one per hint or a single one for all hints.
+      validate: If False, then the hints are neither checked nor taken into account, when later hints are checked (optional).
+        This saves O(n^2) operations per hint for hints, which are known to be independent and consistent.
+    Raises:
+      ValueError, if a hint contradicts the previously integrated perfect hints and hints with the same modulus.
+      Then none of the hints is integrated.
+  """
+  def integrateModularHints(self, V, L, moduli, validate = True ):
+    self.__checkHintsFormat(V, L)
+    
+    if validate:
+      V, L, moduli = self.__validateHints(V, L, moduli)
+    
+    V, L = self.__toRemainingCoordinates(V, L)
+    self.__modHints.append( V, L, moduli )
+    
+  """
+    Integrates the hints implied by the polynomial relation c_1*s_1 + ... + c_k*s_k = l, if the matrix of the instance
+    is built from rotation matrices, e.g., by rotMatrix() or module(). Every known coefficient of l yields one hint,
+    whose vector is a rotation of c (see ringHints), and all of them are integrated at once.
+    Params:
+      c, l, cyclotomic, coefficients: As in ringHints().
+      modulus: If set, then the relation holds modulo modulus, and the hints are modular hints. Otherwise perfect hints (optional).
+      validate: As in integratePerfectHints() (optional).
+  """
+  def integrateRingHint(self, c, l, cyclotomic = False, modulus = None, coefficients = None, validate = True ):
+    V, L = ringHints( c, l, cyclotomic, coefficients )
     
-    if m != self.__q:
-      self.__modQHintsOnly = False
+    if modulus is None:
+      self.integratePerfectHints( V, L, validate )
+    else:
+      self.integrateModularHints( V, L, modulus, validate )
     
   """
-    Integrates approximate hint.
+    Integrates approximate hint, i.e., <v,s> = l + epsilon for a small error epsilon.
+    Without a variance, the hint replaces a coordinate of s in the lattice vector by epsilon.
     This feature of our algorithm is not documented in our paper,
     because it is inferior to DDGR's approach for integrating approximate hints.
+    With a variance, the hint is integrated as in DDGR's approach: The coordinate w*epsilon is appended to the lattice vector,
+    where the weight w = sqrt(secretVariance / variance) rescales the error to the variance of the coordinates of s and e.
+    This keeps the dimension, and multiplies the volume by sqrt(1 + w^2*|v|^2), just as the ellipsoid of the secret shrinks
+    in DDGR's approach. Since the basis has to be integral, all other coordinates are scaled by a common integer factor,
+    and the weights are rounded (see WEIGHT_PRECISION).
     Params:
       v: Hint vector, has to be a numpy array.
       l: Hint value.
+      variance: Variance of the error epsilon (optional).
   """
-  def integrateApproximateHint( self, v, l ):
+  def integrateApproximateHint( self, v, l, variance = None ):
     self.__checkHintFormat(v)
-    if len(self.__approximateHints) < self.__n:
-      self.__approximateHints.append( np.append(v,l) )
-      self.__modQHintsOnly = False
+    V, L = self.__toRemainingCoordinates( np.array([v]), [l] )
+    
+    if variance is not None:
+      if self.__secretVariance is None:
+        raise ValueError("Approximate hints with a variance require the secretVariance of the lattice.")
+      if variance <= 0:
+        raise ValueError("Expected a positive variance, but got %s." % variance)
+      
+      self.__weightedHints.append( V, L )
+      self.__hintVariances.append( float(variance) )
+      self.__modularHintsOnly = False
+      
+    elif len(self.__approximateHints) < self.__n:
+      self.__approximateHints.append( V, L )
+      self.__modularHintsOnly = False
     else:
       raise ValueError("Can't integrate more than n approximate hints.")
-  
+
   """
-    Run Progressive-BKZ on the lattice with integrated hints.
+    Restricts the LWE instance to its first samples columns of A and b, which lowers the dimension of the lattice.
+    If samples is not set, then the number of samples is chosen, that minimizes the predicted cost d * 2^(0.292*beta)
+    of the reduction, where d is the dimension of the lattice after integrating the hints, and beta is the blocksize,
+    at which the secret is predicted to be found (see __predictBlocksize). The number of samples is reported by reduce().
     Params:
-      terminateAtGH: If True, then terminate as soon as vector of norm < gaussian heuristic is found.
-      targetLength: Terminate, when vector of norm < targetLength is found (optional). If set, terminateAtGH will be ignored.
-      maxBlocksize: Terminate at maxBlocksize (optional). terminateAtGH / targetLength won't be ignored.
-      bkzTours: BKZ tours per blocksize (optional).
+      sigma: Standard deviation of the coordinates of s and e (optional). Required, if samples is not set.
+      samples: Number of samples to keep (optional).
+    Returns:
+      The number of samples kept.
   """
-  def reduce(self, terminateAtGH = True, targetLength = None, maxBlocksize = None, bkzTours = 8 ):
-    self.__vPrint("Constructing basis.")
-    self.__clock()
-    basis = self.__constructBasis()
-    self.__clock()
-    self.__vPrint("Finished basis construction. Time: %fs." % self.__time)
-    
-    noKannanEmbedding = ( np.array(basis[-1])[:-1] == 0 ).all()
-    
-    if noKannanEmbedding:
-      basis = basis.submatrix(0,0,self.__m+self.__n,self.__m+self.__n)
-      
-    else:
-      self.__vPrint("Constructing sublattice.")
-      self.__clock()
-      basis = self.__constructSubLattice(basis)
-      self.__clock()
-      self.__vPrint("Finished sublattice construction. Time: %fs." % self.__time)
-    
-    if maxBlocksize == None:
-      maxBlocksize = basis.nrows
-
-    if terminateAtGH and targetLength == None:
-      targetLength = sqrt( basis.ncols / ( 2*pi*e ) * self.__q )
-    
-    foundSecret = False
-    
-    i = 0
-    while not foundSecret and i < basis.nrows:
-      candidate = basis[i]
-      foundSecret = self.__checkCandidateShortest(candidate, targetLength)
-      i += 1
-    
-    if foundSecret:
-      self.__vPrint("Found secret while constructing sublattice.")
-      self.shortestVector = np.array(basis[i-1])
-      
-    else:
-      M = GSO.Mat( basis, float_type="mpfr" )
-      M.update_gso()
-      bkz = BKZReduction(M)
+  def selectSamples(self, sigma = None, samples = None):
+    if samples is None:
+      if sigma is None:
+        raise ValueError("Expected sigma or samples.")
 
-      self.__vPrint("Starting LLL.")
-      self.__clock()
-      bkz.lll_obj()
-      self.__clock()
-      self.__vPrint("Finished LLL. Time: %fs." % self.__time)
+      dims, logVols = self.__latticeParameters( np.arange(1, self.__m+1) )
+      betas = self.__predictBlocksize( dims, logVols, sigma )
 
-      beta = 2
+      if np.isnan(betas).all():
+        samples = self.__m
+      else:
+        logCosts = 0.292 * betas + np.log2(dims)
+        samples = int( np.nanargmin(logCosts) ) + 1
 
-      
-      while not foundSecret and beta < maxBlocksize + 1:
-        
-        self.__vPrint("Starting BKZ with blocksize %d." % beta)
-        
-        par = BKZ_FPYLLL.Param(
-          beta,
-          strategies=BKZ_FPYLLL.DEFAULT_STRATEGY,
-          max_loops=8,
-          flags=BKZ_FPYLLL.MAX_LOOPS
-        )
+      self.__vPrint("Predicted blocksize %s for %d samples." % (betas[samples-1], samples))
 
-        self.__clock()
+    if samples < 1 or samples > self.__m:
+      raise ValueError("Expected 1 <= samples <= %d, but got %d." % (self.__m, samples))
 
-        for tour in range(bkzTours):
-          bkz(par)
+    self.__A = self.__A[:,:samples]
+    self.__b = self.__b[:samples]
+    self.__m = samples
 
-          foundSecret = self.__checkCandidateShortest(basis[0], targetLength)
+    #A previously reduced basis belongs to the full instance.
+    self.__tracking = None
 
-          if foundSecret:
-            self.successBlocksize = beta
+    return samples
 
-            self.__vPrint("Found secret at blocksize %d." % beta)
+  """
+    Predicts the blocksize, at which reduce() finds the secret, from the dimension and the volume of the lattice,
+    that reduce() would construct from the integrated hints (see __latticeParameters). No basis is built.
+    Params:
+      sigma: Standard deviation of the coordinates of s and e.
+      counts: Numbers of perfect hints (optional). If set, then the lattice with the first k integrated perfect hints
+        (and all modular hints) is estimated for every k in counts, as sweep() builds it for the first k hints.
+    Returns:
+      Dictionary with the entries
+        dimension, logVolume: Dimension and natural logarithm of the volume of the lattice.
+        blocksize: Blocksize predicted by the estimate of Alkim, Ducas, Poeppelmann and Schwabe, or NaN if no blocksize suffices.
+        logCost: Base 2 logarithm of the cost d * 2^(0.292*blocksize) of the reduction.
+      If counts is set, then every entry is an array with one value per count.
+  """
+  def estimate(self, sigma, counts = None):
+    if counts is not None and ( np.min(counts) < 0 or np.max(counts) > len(self.__perfectHints) ):
+      raise ValueError("Expected counts between 0 and %d." % len(self.__perfectHints))
 
-            break
+    dims, logVols = self.__latticeParameters( self.__m, counts )
+    betas = self.__predictBlocksize( dims, logVols, sigma )
+    logCosts = 0.292 * betas + np.log2(dims)
 
-        self.__clock()
+    if counts is None:
+      return { "dimension": int(dims), "logVolume": float(logVols), "blocksize": float(betas[0]), "logCost": float(logCosts[0]) }
 
-        self.__vPrint("Finished BKZ with blocksize %d. Time: %fs." % (beta, self.__time))
+    return { "dimension": dims, "logVolume": logVols, "blocksize": betas, "logCost": logCosts }
 
-        beta += 1
-        
-      self.shortestVector = np.array(basis[0])
+  """
+    Run Progressive-BKZ on the lattice with integrated hints.
+    Params:
+      terminateAtGH: If True, then terminate as soon as the secret appears in the basis, i.e., a vector shorter than
+        the gaussian heuristic of the lattice with all hints, from which (s,e) is reconstructed with small s and e = b - s*A mod q.
+      targetLength: Terminate, when vector of norm < targetLength is found (optional). If set, terminateAtGH will be ignored.
+      maxBlocksize: Terminate at maxBlocksize (optional). terminateAtGH / targetLength won't be ignored.
+      bkzTours: BKZ tours per blocksize (optional).
+      schedule: BKZSchedule, that controls blocksizes, tours, auto-abort and time budgets (optional). If set, bkzTours will be ignored.
+      checkpoint: Path of a file, to which the state of the reduction is written after LLL and after every BKZ tour (optional).
+        An interrupted reduction can be continued via LWELattice.resume(checkpoint).
+      deadline: Point in time (as returned by time.time()), after which the reduction stops (optional).
+      maxSeconds: Number of seconds after the call of reduce(), after which the reduction stops (optional).
+      maxRss: Maximal resident set size of the process in bytes, beyond which the reduction stops (optional).
+        Budgets are checked after LLL and after every BKZ tour. If a budget is exhausted, then the shortest vector
+        found so far is returned, and s is recovered from it.
+    Returns:
+      Dictionary with the entries
+        success: Whether the secret, or a vector shorter than targetLength, has been found.
+        budgetExhausted: "time" or "memory", if the reduction stopped due to a budget, and None otherwise.
+        s, shortestVector, successBlocksize: As stored in the attributes of the same name.
+        reachedBlocksize: Largest blocksize, for which BKZ has been completed.
+        reductionTime: Time spent in LLL and BKZ.
+        timings: Times spent in LLL and in BKZ for every blocksize.
+        samples: Number of LWE samples, i.e., columns of A, in the lattice (see selectSamples()).
+  """
+  def reduce(self, terminateAtGH = True, targetLength = None, maxBlocksize = None, bkzTours = 8, schedule = None, checkpoint = None, deadline = None, maxSeconds = None, maxRss = None ):
+    if schedule is None:
+      schedule = BKZSchedule( tours = bkzTours )
     
-    if noKannanEmbedding:
-      self.s = self.shortestVector[self.__m:]
-    else:
-      self.s = self.__recoverRemainingCoordinates()
+    self.__checkpointPath = checkpoint
+    self.__setBudget(deadline, maxSeconds, maxRss)
     
-  def __checkCandidateShortest(self, candidate, targetLength):
-    if targetLength is not None:
-      return candidate.norm() < targetLength
-    else:
-      return False
-  
-  def __constructBasis(self):
-        
-    if not self.__modQHintsOnly:
-      A = self.__A
-      b = self.__b
-      
-      m = self.__m
-      n = self.__n
+    if self.__n == 0:
+      return self.__substitutedResult()
     
-      ctrModHints = len(self.__modHints)
-      ctrPerfectHints = len(self.__perfectHints)
-      ctrApproximateHints = len(self.__approximateHints)
-      
-    else:
-      self.__vPrint("Only mod-q hints have been integrated. Going to smaller LWE dimension.")
-      A,b = self.__modQOnlyDimRed()
-      
-      n,m = A.shape
-      
-      ctrModHints = 0
-      ctrPerfectHints = 0
-      ctrApproximateHints = 0
+    if self.__tracking is not None and self.__canWarmStart():
+      self.__vPrint("Deriving lattice from previously reduced basis.")
+      self.__clock()
+      basis, tracking = self.__deriveFromReducedBasis()
+      self.__clock()
+      self.__vPrint("Finished sublattice construction. Time: %fs." % self.__time)
       
-    dim = m + ctrModHints + n + 1
-    
-    B = IntegerMatrix.identity(dim)
-    
-    #q-block
-    for i in range(m):
-      B[i,i] = self.__q
-    
-    #A
-    for i in range(n):
-      for j in range(m):
-        B[i+m+ctrModHints,j] = int(A[i][j])
-    
-    #Modular hints
-    for i in range(ctrModHints):
-      for j in range(n+2):
-          if j<=n:
-            B[j+m+ctrModHints,i+m] = int(self.__modHints[i][1][j])
-          else:
-            B[i+m,i+m] =  self.__modHints[i][0]
-          
-    #Perfect hints
-    for i in range(ctrPerfectHints):
-      for j in range(n+1):
-          B[j+m+ctrModHints,i+m+ctrModHints] = int(self.__perfectHints[i][j])
-              
-    #Approximate hints
-    for i in range(ctrApproximateHints):
-      for j in range(n+1):
-          if i + ctrPerfectHints < n:
-            B[j+m+ctrModHints,i+m+ctrModHints+ctrPerfectHints] = int(self.__approximateHints[i][j])
-          else:
-            warnings.warn("Ignoring approximate hint, since there are already enough many perfect hints.", RuntimeWarning)
+      #BKZ resumes slightly below the blocksize, up to which the previous basis has been reduced.
+      reachedBlocksize = max( 0, self.__reducedBlocksize - WARM_START_OFFSET )
       
-    #b  
-    for i in range(m):
-      B[m+ctrModHints+n,i] = int(b[i])
-    
-    return B
-    
-  def __constructSubLattice(self,basis):
-    ctrModHints = len(self.__modHints)
-    ctrPerfectHints = len(self.__perfectHints)
-    ctrHints = ctrModHints + ctrPerfectHints
-    
-    if ctrHints == 0 or self.__modQHintsOnly:
-      return basis
+      return self.__reduceBasis( basis, tracking, False, reachedBlocksize, terminateAtGH, targetLength, maxBlocksize, schedule )
       
     else:
-      m = self.__m
-      n = self.__n
-      q = self.__q
+      basis, tracking, noKannanEmbedding = self.__prepareBasis()
       
-      #Split basis as
-      #  [
-      #    top
-      #    bottom_left | bottom_right
-      #  ].
-      top = basis[:m]
-      bottom = basis[m:]
-      bottom_left = bottom.submatrix(0,0,n+ctrModHints+1,m)
-      bottom_right = bottom.submatrix(0,m,n+ctrModHints+1,m+ctrModHints+n+1)
-    
-      dim_bottom = bottom.nrows
-    
-      #Scale bottom_right for zero forcing
-      gh = self.__gaussianHeuristic(bottom_right)
-      scaling = ceil( (2)**((dim_bottom-1)/2) * gh )
+      return self.__reduceBasis( basis, tracking, noKannanEmbedding, 0, terminateAtGH, targetLength, maxBlocksize, schedule )
+  
+  """
+    Runs several randomized reductions of the lattice concurrently in a process pool.
+    The basis is constructed once. Every worker reduces a copy of it, which is multiplied by a random unimodular matrix
+    (except for the first copy), with its own schedule. As soon as one worker finds a vector shorter than the target length,
+    all other workers are terminated. Afterwards, the lattice holds the state of the winning worker,
+    or of the worker with the shortest vector, if no worker succeeded.
+    Params:
+      workers: Number of randomized copies and worker processes (optional).
+      schedules: One BKZSchedule per worker (optional). By default, the workers alternate between
+        the default schedule and a schedule with blocksize step 2 and auto-abort.
+      seed: Seed for the randomization (optional).
+      terminateAtGH, targetLength, maxBlocksize, bkzTours: As in reduce() (optional).
+    Returns:
+      Dictionary as returned by reduce(), with the additional entry variant, the index of the winning worker.
+  """
+  def reduceParallel(self, workers = 4, schedules = None, seed = None, terminateAtGH = True, targetLength = None, maxBlocksize = None, bkzTours = 8 ):
+    if schedules is None:
+      schedules = [
+        BKZSchedule( tours = bkzTours ) if i % 2 == 0 else BKZSchedule( tours = bkzTours, step = 2, autoAbort = True )
+        for i in range(workers)
+      ]
+    
+    if len(schedules) != workers:
+      raise ValueError("Expected %d schedules, but got %d." % (workers, len(schedules)))
+    
+    if self.__n == 0:
+      result = self.__substitutedResult()
+      result["variant"] = 0
+      return result
+    
+    basis, tracking, noKannanEmbedding = self.__prepareBasis()
+    
+    self.__checkpointPath = None
+    self.__setBudget(None, None, None)
+    
+    rng = np.random.default_rng(seed)
+    params = ( terminateAtGH, targetLength, maxBlocksize )
+    
+    tasks = []
+    for variant in range(workers):
+      if variant == 0:
+        variantBasis, variantTracking = basis, tracking
+      else:
+        variantBasis, variantTracking = self.__randomize(basis, tracking, rng)
       
-      for i in range(dim_bottom):
-        for j in range(ctrHints):
-          bottom_right[i,j] *= scaling
-          
-      #LLL reduce bottom_right
-      U = IntegerMatrix.identity(dim_bottom)
-      LLL.reduction(bottom_right, U)
-        
-      #Check if heuristics hold
-      zero_block = bottom_right.submatrix(0,0,dim_bottom-ctrHints,ctrHints)
-      for v in zero_block:
-        if not v.is_zero():
-          raise RuntimeError("Heuristics for Construct-Sublattice failed.")
+      tasks.append( ( self, variant, variantBasis, variantTracking, noKannanEmbedding, params, schedules[variant] ) )
     
-      #Construct new basis
-      bottom_left = U * bottom_left
-      bottom_left = bottom_left[:-ctrHints]
-      bottom_left = bottom_left % q
+    best = None
     
-      dim_bottom = bottom_left.nrows
+    with Pool(workers) as pool:
+      for lattice, result in pool.imap_unordered(_reduceVariant, tasks):
+        self.__vPrint("Variant %d finished. Success: %s." % (result["variant"], result["success"]))
+        
+        if best is None or result["success"] or np.linalg.norm(result["shortestVector"]) < np.linalg.norm(best[1]["shortestVector"]):
+          best = ( lattice, result )
+        
+        if result["success"]:
+          pool.terminate()
+          break
     
-      B = IntegerMatrix.identity(m+dim_bottom)
+    lattice, result = best
+    verbose = self.__verbose
+    self.__dict__.update( lattice.__dict__ )
+    self.__verbose = verbose
     
-      for i in range(m):
-        B[i,i] = q
+    self.__vPrint("Variant %d won." % result["variant"])
     
-      for i in range(dim_bottom):
-        for j in range(m):
-          B[m+i,j] = bottom_left[i,j]
-        for j in range(dim_bottom):
-          B[m+i,m+j] = bottom_right[i,j+ctrHints]
-      
-      return B
+    return result
   
-  def __recoverRemainingCoordinates(self):
-    sV = self.shortestVector
-    m = self.__m
+  """
+    Hybrid attack, that guesses the coordinates of s at the given indices.
+    The lattice of the remaining coordinates of s, together with the perfect and modular hints restricted to them,
+    is reduced once by an LWEDecoder. The guesses are distributed in chunks over a process pool. For every guess g,
+    a worker subtracts g from b and from the hint values, decodes all guesses of its chunk at once,
+    and checks, whether s and e = b - s*A mod q are small. As soon as one guess succeeds, all other workers are terminated.
+    Approximate hints are ignored.
+    Params:
+      coordinates: Indices of the coordinates of s to guess. Coordinates, which have been substituted by perfect hints, can't be guessed.
+      values: Values, that are guessed for every coordinate (optional). Guesses are tried in ascending order of their norm.
+      workers: Number of worker processes (optional).
+      chunkSize: Number of guesses per task (optional).
+      blocksize, beamWidth: As for LWEDecoder (optional). Decoding always uses bounded enumeration.
+    Returns:
+      Dictionary with the entries
+        success: Whether the secret has been found.
+        s: As stored in the attribute s. None, if no guess succeeded.
+        guess: Values of the guessed coordinates of s, or None.
+        guesses: Number of guesses, that have been decoded.
+        reductionTime: Time spent in the reduction of the lattice of the remaining coordinates.
+  """
+  def reduceHybrid(self, coordinates, values = (0, 1, -1), workers = 4, chunkSize = 256, blocksize = 20, beamWidth = 64 ):
     n = self.__n
     q = self.__q
-    ctrPerfectHints = len(self.__perfectHints)
-    ctrModHints = len(self.__modHints)
-    ctrApproximateHints = len(self.__approximateHints)
-    
-    if sV[-1]==1:
-      sV *= -1
-    
-    if self.__modQHintsOnly:
-      s_1 = sV[m:]
-      s_2 = (-s_1.dot(self.__modQTransformationMatrix)) % q
-      
-      s = np.zeros(n, dtype=int)
-      
-      ctrS1 = 0
-      ctrS2 = 0
-      
-      for i in range(n):
-        if i in self.__modQEliminatedCoordinates:
-          s[i] = s_2[ctrS2]
-          ctrS2 += 1
-        else:
-          s[i] = s_1[ctrS1]
-          ctrS1 += 1
-      
-    else:
-      #Collect all available v, l, such that s*v = l,
-      #and then construct linear system of equations  s*M = y.
-  
-      cols = m+n+ctrModHints
-      M = np.zeros( (n, cols), dtype=int )
-      y = np.array( [0]*cols, dtype=int )
-  
-      for i in range( cols ):
-    
-        #LWE samples
-        if i < m:
-          v = self.__A[:,i]
-          l = self.__b[i] + sV[i]
-    
-        #Approximate hints
-        elif i < m + ctrApproximateHints and i < m + n -ctrPerfectHints:
-          v,l = self.__splitHint( self.__approximateHints[i-m] )
-          l += sV[i]
-          l %= q
-    
-        #Coordinates recovered by lattice reduction
-        elif i < m + n - ctrPerfectHints:
-          v = np.zeros(n,dtype=int)
-          v[i-m+ctrPerfectHints] = 1
-          l = sV[i]
-    
-        #Perfect hints
-        elif i < m + n:
-          v,l = self.__splitHint( self.__perfectHints[i+ctrPerfectHints-m-n] )
-          l %= q
-    
-        #Mod-q hints
-        else:
-          m_, v_ = self.__modHints[i-m-n]
-          if m_ == q:
-            v,l = self.__splitHint( v_ )
-          else:
-            v = np.zeros(n, dtype=int)
-            l = 0
     
-        M[:,i] = v
-        y[i] = l
-    
-      #Solve via Gaussian elimination
-      M,y = self.__gaussianElimination(M,y,n,q)
-      
-      s = np.array( [ y[i] for i in range(n) ] )
-      
-        
-    for i in range(n):
-      if s[i] > q/2:
-        s[i] -= q
-      
-    return s
-  
-  def __modQOnlyDimRed(self):
-    n = self.__n
-    m = self.__m
-    k = len(self.__modHints)
+    if not np.isin( coordinates, self.__remainingCoordinates ).all():
+      raise ValueError("Can't guess coordinates, which have been substituted by perfect hints.")
     
-    cols = k+m
+    coordinates = np.searchsorted( self.__remainingCoordinates, coordinates )
+    remaining = np.delete( np.arange(n), coordinates )
     
-    M = np.zeros( (n,cols), dtype=int )
-    y = np.array( [0]*cols )
+    if len(self.__approximateHints) + len(self.__weightedHints) > 0:
+      warnings.warn("Ignoring approximate hints in the hybrid attack.", RuntimeWarning)
     
-    for i in range(k):
-      v,l = self.__splitHint( self.__modHints[i][1] )
-      M[:,i] = v
-      y[i] = l
+    V = np.vstack( [ self.__perfectHints.vectors, self.__modHints.vectors ] )
+    L = np.concatenate( [ self.__perfectHints.values, self.__modHints.values ] )
+    moduli = np.concatenate( [ np.zeros( len(self.__perfectHints), dtype=int ), self.__modHints.moduli ] )
     
-    for i in range(m):
-      M[:,k+i] = self.__A[:,i]
-      y[k+i] = self.__b[i]
+    self.__vPrint("Reducing lattice of %d remaining coordinates." % len(remaining))
+    decoder = LWEDecoder( self.__A[remaining], q, V[:,remaining], moduli, blocksize = blocksize, enumerate = True, beamWidth = beamWidth )
+    self.reductionTime = decoder.reductionTime
+    self.__vPrint("Finished reduction. Time: %fs." % self.reductionTime)
     
-    M,y = self.__gaussianElimination(M,y,k,self.__q,k)
+    guesses = np.array( list( product( values, repeat = len(coordinates) ) ), dtype=int ).reshape( -1, len(coordinates) )
+    guesses = guesses[ np.argsort( np.linalg.norm( guesses, axis=1 ), kind="stable" ) ]
     
-    eliminatedCoordinates = []
+    instance = ( self.__A, self.__b, q, coordinates, remaining, V, L )
+    tasks = [ ( decoder, instance, guesses[i:i+chunkSize] ) for i in range(0, len(guesses), chunkSize) ]
     
-    i = 0
+    result = { "success": False, "s": None, "guess": None, "guesses": 0, "reductionTime": self.reductionTime }
     
-    while i < n and len(eliminatedCoordinates) < k:
-      
-      isEliminated = True
-      
-      j = 0
-      
-      while isEliminated and j < cols:
-        if j==len(eliminatedCoordinates):
-          if  M[i,j] != 1:
-            isEliminated = False
-        elif M[i,j] != 0:
-          isEliminated = False
-
-        j += 1
+    with Pool(workers) as pool:
+      for decoded, s in pool.imap_unordered(_decodeGuesses, tasks):
+        result["guesses"] += decoded
         
-      if isEliminated:
-        eliminatedCoordinates.append( i )
-      
-      i += 1
+        if s is not None:
+          result.update( success = True, s = s, guess = s[coordinates] )
+          pool.terminate()
+          break
     
-    transformationMatrix = [ M[i,0:k] for i in range(n) if i not in eliminatedCoordinates ]
-    transformationMatrix.append( y[0:k] )
-    transformationMatrix = np.array(transformationMatrix)
-    A = [ M[i,k:] for i in range(n) if i not in eliminatedCoordinates ]
-    A = np.array(A)
-    b = y[k:]
+    self.__vPrint("Decoded %d of %d guesses. Success: %s." % (result["guesses"], len(guesses), result["success"]))
     
-    self.__modQEliminatedCoordinates = eliminatedCoordinates
-    self.__modQTransformationMatrix = transformationMatrix
+    if result["success"]:
+      result["s"] = self.__fullSecret( result["s"] )
     
-    return A,b
+    self.s = result["s"]
     
+    return result
   
-  def __checkHintFormat(self, v):
-    if len(v) != self.__n:
-      raise ValueError("Expected hint of dimension %d, but got %d." % (self.__n, len(v)))
-    
-  def __splitHint(self, v_):
-    v = v_[:-1]
-    l = v_[-1]
-    return (v,l)
-   
-  def __gaussianHeuristic(self, basis):
-    dim = basis.nrows
-    
-    M = GSO.Mat(basis)
-    M.update_gso()
+  """
+    Returns copies of basis and tracking, which are multiplied by the same random unimodular matrix.
+    The matrix permutes the rows, and adds to every row the sum of up to three other rows with random signs.
+  """
+  def __randomize(self, basis, tracking, rng):
+    rows = basis.nrows
     
-    root_det = M.get_root_det(0,-1) #Appears to be buggy. May result in NaN.
+    U = np.identity( rows, dtype=object )[ rng.permutation(rows) ]
+    for i in range(1, rows):
+      others = rng.choice( i, size=min(3,i), replace=False )
+      U[i] += rng.choice( [-1,1], size=len(others) ).dot( U[others] )
     
-    if np.isnan(root_det):
-      self.__vPrint("fpylll failed to compute root_det. Resort to approximation via Hadamard bound.")
-      
-      #Approximate root_det by Hadamard bound.
-      log_root_hadamard = 0
-      for v in basis:
-        log_root_hadamard += log(v.norm()) / dim
-      log_root_hadamard = ceil(log_root_hadamard)
-      root_det = e**log_root_hadamard
+    B = U.dot( np.array( [ list(v) for v in basis ], dtype=object ) )
+    B = IntegerMatrix.from_matrix( B.tolist() )
     
-    gh = sqrt( dim / (2*pi*e) ) * root_det
+    if tracking is not None:
+      T = U.dot( np.array( [ list(v) for v in tracking ], dtype=object ) )
+      tracking = IntegerMatrix.from_matrix( T.tolist() )
     
-    return gh
+    return B, tracking
   
   """
-      Extended Euclidean Algorithm
+    Continues a reduction, that was interrupted, from the checkpoint written by reduce(checkpoint=path).
+    The reduction resumes after the last completed BKZ tour and keeps writing checkpoints to path.
+    Params:
+      path: Path of the checkpoint file.
+      verbose: If True, then runs in verbose mode (optional).
+    Returns:
+      The LWELattice, on which the reduction has been finished.
   """
-  def __egcd(self,a, b):
-    if a == 0:
-        return (b, 0, 1)
-    else:
-        g, y, x = self.__egcd(b % a, a)
-        return (g, x - (b // a) * y, y)
-        
+  @staticmethod
+  def resume(path, verbose = False):
+    with open(path) as f:
+      data = json.load(f)
+    
+    lattice = LWELattice(
+      np.array(data["A"]), np.array(data["b"]), data["q"],
+      verbose = verbose,
+      warmStart = data["warmStart"],
+      kernelSublattice = data["kernelSublattice"],
+      dualSublattice = data["dualSublattice"],
+      secretVariance = data["secretVariance"]
+    )
+    
+    perfectHints, modHints, approximateHints = data["perfectHints"], data["modHints"], data["approximateHints"]
+    
+    #The hints are stored w.r.t. the remaining coordinates, after coordinate hints have been substituted.
+    lattice.__substituteHints = False
+    
+    if len(perfectHints["values"]) > 0:
+      lattice.integratePerfectHints( np.array(perfectHints["vectors"]), perfectHints["values"] )
+    if len(modHints["values"]) > 0:
+      lattice.integrateModularHints( np.array(modHints["vectors"]), modHints["values"], np.array(modHints["moduli"]) )
+    for v, l in zip( approximateHints["vectors"], approximateHints["values"] ):
+      lattice.integrateApproximateHint( np.array(v), l )
+    for v, l, variance in zip( data["weightedHints"]["vectors"], data["weightedHints"]["values"], data["weightedHints"]["variances"] ):
+      lattice.integrateApproximateHint( np.array(v), l, variance )
+    
+    substitution = data["substitution"]
+    lattice.__substituteHints = True
+    lattice.__fullDimension = substitution["fullDimension"]
+    lattice.__remainingCoordinates = np.array( substitution["remainingCoordinates"], dtype=int )
+    lattice.__substitutionOffset = np.array( substitution["offset"], dtype=int )
+    if substitution["matrix"] is not None:
+      lattice.__substitutionMatrix = np.array( substitution["matrix"], dtype=int ).reshape( lattice.__n, lattice.__fullDimension )
+    
+    #Hints integrated after resuming are checked against each other only.
+    lattice.__validator = HintValidator(lattice.__fullDimension)
+    lattice.__ntruRing = data["ntruRing"]
+    
+    #Transformation for recovering the eliminated coordinates
+    if lattice.__useModQDimRed():
+      lattice.__modQDimRed()
+    
+    basis = IntegerMatrix.from_matrix( data["basis"] )
+    tracking = None
+    if data["tracking"] is not None:
+      tracking = IntegerMatrix.from_matrix( data["tracking"] )
+    
+    if data["trackingLayout"] is not None:
+      lattice.__trackingLayout = tuple( data["trackingLayout"] )
+    
+    lattice.predictedBlocksize = data["predictedBlocksize"]
+    lattice.reductionTime = data["reductionTime"]
+    lattice.__checkpointPath = path
+    lattice.__resumePoint = ( data["blocksize"], data["tours"] )
+    
+    lattice.__vPrint("Resuming at blocksize %d after %d tours." % lattice.__resumePoint)
+    
+    lattice.__reduceBasis(
+      basis, tracking, data["noKannanEmbedding"], data["blocksize"],
+      data["terminateAtGH"], data["targetLength"], data["maxBlocksize"], BKZSchedule( **data["schedule"] )
+    )
+    
+    return lattice
+  
   """
-    Run Gaussian elimination over Z_q on a linear system of equations
-        x*M = y
-    to eliminate k coordinates of x.
-    If the optional parameter restrictColumns is set,
-    then the algorithm uses only the first restrictColumns columns
-    to eliminate coordinates.
-    
-    Returns M', y', such that
-        x * M' = y',
-    where k rows of M' are eliminated.
+    Runs reduce() for several numbers of hints, reusing the reduced basis of the neighbouring number of hints.
+    For every k in counts, the lattice consists of all hints integrated so far, plus the first k hints of (V,L).
+    A reduced basis, which contains the secret, would contain it for the neighbouring count as well,
+    such that the secret would be found without reduction. Hence, the basis is reused, which has been reduced
+    up to the blocksize before successBlocksize.
+    In ascending order, this basis is intersected with the additional hints, as in warm start mode, after failed and
+    successful reductions. A sweep over counts, which mostly succeed, then costs about one full reduction for the smallest count.
+    In descending order, the lattice for k hints is spanned by the reduced basis for the next larger count and a few
+    additional vectors. The reduced vectors are long in the coordinates of s, which the additional hints of the larger count
+    have replaced, and their reduction is mostly lost. Hence, a descending sweep reuses only the bases of failed reductions,
+    and costs about one full reduction per count, which succeeds.
+    In both cases, BKZ starts again at the first blocksize of the schedule, such that successBlocksize
+    is the blocksize, at which the secret is found for k hints. If the reused basis already yields the secret before BKZ,
+    then the lattice is reduced from scratch instead.
+    Afterwards, s, shortestVector and successBlocksize belong to the last processed count.
+    Params:
+      V,L: Hint vectors and values, as for integratePerfectHints / integrateModularHints.
+      counts: Numbers of hints to integrate.
+      moduli: If set, then (V,L) are modular hints with these moduli. Otherwise perfect hints (optional).
+      ascending: If True, then process counts in ascending order. Otherwise in descending order (optional).
+      terminateAtGH, targetLength, maxBlocksize, bkzTours, schedule: As in reduce() (optional).
+    Returns:
+      Dictionary, that maps every count to its success blocksize, or to None, if the secret was not found.
   """
-  def __gaussianElimination(self,M,y,k,q,restrictColumns = None):
-    rows, cols = M.shape
-    
-    if k > rows:
-      raise IndexError("Value of k has to be <= than dimension of unknown. Got k=%d, but was expecting k<%d" % (k,rows))
+  def sweep(self, V, L, counts, moduli = None, ascending = False, terminateAtGH = True, targetLength = None, maxBlocksize = None, bkzTours = 8, schedule = None ):
+    if schedule is None:
+      schedule = BKZSchedule( tours = bkzTours )
     
-    if restrictColumns == None:
-      restrictColumns = cols
-    
-    M_ = np.zeros( (rows+1,cols), dtype=int )
-    for i in range(rows):
-      for j in range(cols):
-        M_[i,j] = M[i,j]
-    
-    for j in range(cols):
-      M_[rows,j] = y[j]
-    
-    rowCtr = 0
-    eliminatedCoordinates = 0
-
-    while rowCtr < rows and eliminatedCoordinates < k:
+    params = ( terminateAtGH, targetLength, maxBlocksize )
     
-        colCtr = eliminatedCoordinates
-        foundInvertible = False
-        while colCtr < restrictColumns and not foundInvertible:
-            g,s,t = self.__egcd(M_[rowCtr,colCtr], q)
-            if g==1:
-                foundInvertible = True
-            else:
-                colCtr += 1
+    blocksizes = {}
+    previous = None
+    result = None
     
-        if foundInvertible:
+    for k in sorted( set(counts), reverse = not ascending ):
+      self.__vPrint("Sweep: Reducing lattice with %d hints." % k)
+      
+      #After a success, an ascending sweep reuses the basis before the secret appeared (see __unsolvedReduction).
+      reuse = previous is not None and previous.__unsolvedReduction is not None and ( ascending or not result["success"] )
+      
+      if reuse:
+        previous.basis, previous.__tracking, _ = previous.__unsolvedReduction
+      
+      #The intersection is LLL-reduced again by __reduceBasis, which makes the faster kernel construction sufficient.
+      if ascending and reuse:
+        lattice = previous
+        lattice.__integrateSweepHints( V, L, moduli, lattice.__sweepCount, k )
+        lattice.__sweepCount = k
+        
+        lattice.__vPrint("Deriving lattice from previously reduced basis.")
+        basis, tracking = lattice.__deriveFromReducedBasis( kernel = True )
+        result = lattice.__reduceBasis( basis, tracking, False, 0, *params, schedule )
         
-            M_[:,colCtr] *= s
-            M_[:,colCtr] %= q
+      else:
+        lattice = self.__sweepLattice( V, L, moduli, k )
+        extension = None
         
-            if colCtr != eliminatedCoordinates:
-                M_[:,[eliminatedCoordinates,colCtr]] = M_[:,[colCtr,eliminatedCoordinates]]
+        if reuse:
+          extension = lattice.__extendReducedBasis(previous)
         
-            for colCtr in range(cols):
-                if colCtr != eliminatedCoordinates:
-                    M_[:,colCtr] -= M_[rowCtr,colCtr]*M_[:,eliminatedCoordinates]
-                    M_[:,colCtr] %= q
+        if extension is None:
+          result = lattice.reduce( *params, schedule = schedule )
+        else:
+          result = lattice.__reduceBasis( *extension, False, 0, *params, schedule )
+      
+      if reuse and result["success"] and result["successBlocksize"] == 0:
+        self.__vPrint("Sweep: Reused basis contains the secret. Reducing lattice with %d hints from scratch." % k)
         
-            eliminatedCoordinates += 1
+        lattice = self.__sweepLattice( V, L, moduli, k )
+        result = lattice.reduce( *params, schedule = schedule )
+      
+      if result["success"]:
+        blocksizes[k] = lattice.successBlocksize
+        self.__vPrint("Sweep: %d hints require blocksize %d." % (k, blocksizes[k]))
+      else:
+        blocksizes[k] = None
+        self.__vPrint("Sweep: Secret not found with %d hints." % k)
+      
+      previous = lattice
     
-        rowCtr += 1
-
-    if eliminatedCoordinates < k:
-        #Arises when columns are not linearly independent.
-        raise RuntimeError("Gaussian elimination failed. Could only eliminate %d coordinates, instead of %d." % (eliminatedCoordinates,k))
+    if previous is not None:
+      self.basis = previous.basis
+      self.s = previous.s
+      self.shortestVector = previous.shortestVector
+      self.successBlocksize = previous.successBlocksize
     
-    return M_[:-1], M_[-1]
+    return blocksizes
   
-  def __clock(self):
-    if self.__clockTicking:
-      self.__time = time.time() - self.__time
-      self.__clockTicking = False
-    else:
-      self.__time = time.time()
-      self.__clockTicking = True
+  """
+    Returns a new lattice in warm start mode with the hints of self and the first k hints of (V,L).
+  """
+  def __sweepLattice(self, V, L, moduli, k):
+    lattice = LWELattice( self.__A, self.__b, self.__q, verbose = self.__verbose, warmStart = True, kernelSublattice = self.__kernelSublattice, dualSublattice = self.__dualSublattice, secretVariance = self.__secretVariance )
+    lattice.__integrateHintsOf(self)
+    lattice.__integrateSweepHints( V, L, moduli, 0, k )
+    lattice.__sweepCount = k
+    
+    return lattice
+  
+  """
+    Constructs the Kannan embedding and its sublattice w.r.t. the integrated hints.
+    The tracking matrix is kept only for warm start. Otherwise, the coefficients of the lattice vectors
+    are recovered from the vectors themselves (see __vectorTracking), which keeps the entries of the basis small.
+    Returns the basis, its tracking matrix (or None) and whether the Kannan embedding is omitted.
+  """
+  def __prepareBasis(self):
+    self.__vPrint("Constructing basis.")
+    self.__clock()
+    basis = self.__constructBasis()
+    self.__clock()
+    self.__vPrint("Finished basis construction. Time: %fs." % self.__time)
+    
+    noKannanEmbedding = ( np.array(basis[-1])[:-1] == 0 ).all()
+    
+    #Only the row and the column of b are dropped. The columns of weighted hints remain.
+    if noKannanEmbedding:
+      basis = basis.submatrix(0,0,basis.nrows-1,basis.ncols-1)
+      tracking = None
+      
+    else:
+      k = len(self.__perfectHints)
+      self.__trackingLayout = ( k, min( len(self.__approximateHints), self.__n - k ) )
+      
+      self.__vPrint("Constructing sublattice.")
+      self.__clock()
+      basis, tracking = self.__constructSubLattice(basis)
+      self.__clock()
+      self.__vPrint("Finished sublattice construction. Time: %fs." % self.__time)
+      
+      if not self.__warmStart:
+        tracking = None
+    
+    return basis, tracking, noKannanEmbedding
+  
+  """
+    Runs LLL and Progressive-BKZ on basis, and recovers the secret.
+    BKZ starts at the blocksize reachedBlocksize, up to which basis has already been reduced,
+    unless the schedule starts at a larger blocksize or the simulator predicts a larger blocksize.
+    The tours of a blocksize end, as soon as a BKZ call leaves the basis unchanged.
+  """
+  def __reduceBasis(self, basis, tracking, noKannanEmbedding, reachedBlocksize, terminateAtGH, targetLength, maxBlocksize, schedule):
+    self.successBlocksize = 0
+    
+    #The tracking matrix of warm start is recovered from the reduced basis, if possible, such that the reduction runs with long.
+    keepTracking = self.__warmStart and not noKannanEmbedding and not self.__useModQDimRed()
+    if keepTracking and self.__recoversTracking():
+      tracking = None
+    
+    startBlocksize = reachedBlocksize
+    start = time.time() - self.reductionTime
+    
+    resumePoint = self.__resumePoint
+    self.__resumePoint = None
+    
+    if resumePoint is None:
+      self.predictedBlocksize = None
+      self.reductionTime = 0
+      start = time.time()
+    
+    if maxBlocksize == None:
+      maxBlocksize = basis.nrows
+    
+    #Lengths refer to the lattice without weighted approximate hints, whose columns are scaled (see __hintWeights).
+    scaling = self.__hintWeights()[0]
+    checkpointState = [ noKannanEmbedding, terminateAtGH, targetLength, maxBlocksize, schedule ]
+    
+    if targetLength is not None:
+      targetLength *= scaling
+
+    foundSecret = False
+    exhausted = None
+    self.__rotatedKey = None
+    timings = { "lll": 0, "bkz": {} }
+    
+    secretBound = None
+    if terminateAtGH and targetLength == None:
+      secretBound = self.__gaussianHeuristic(basis)
+    
+    secretIndex = self.__findSecret( basis, tracking, noKannanEmbedding, range(basis.nrows), targetLength, secretBound )
+    foundSecret = secretIndex is not None
+    unsolved = None
+    
+    if foundSecret:
+      self.__vPrint("Found secret while constructing sublattice.")
+      
+      #The secret was found by BKZ before the checkpoint was written.
+      if resumePoint is not None and resumePoint[1] > 0:
+        self.successBlocksize = resumePoint[0]
+      
+      self.shortestVector = np.array(basis[secretIndex])
+      shortestIndex = secretIndex
+      
+    else:
+      basis, tracking = self.__selectNumericTypes(basis, tracking)
+      bkz = self.__bkzReduction(basis, tracking)
+
+      self.__vPrint("Starting LLL.")
+      self.__clock()
+      bkz, basis, tracking, _ = self.__runWithFallback( bkz, basis, tracking, lambda bkz: bkz.lll_obj() )
+      self.__clock()
+      self.__vPrint("Finished LLL. Time: %fs." % self.__time)
+      timings["lll"] = self.__time
+      
+      secretIndex = self.__findSecret( basis, tracking, noKannanEmbedding, self.__candidateRows(bkz, targetLength, secretBound), targetLength, secretBound )
+      foundSecret = secretIndex is not None
+      
+      if foundSecret:
+        #LLL is BKZ with blocksize 2.
+        self.successBlocksize = 2
+        
+        self.__vPrint("Found secret after LLL.")
+      
+      #Copy of the reduced basis, before the secret appears (see __unsolvedReduction)
+      if keepTracking and not foundSecret:
+        unsolved = self.__copyReduction( basis, tracking, reachedBlocksize )
+      
+      #The budget is exhausted only, if the reduction stops without the secret.
+      exhausted = None if foundSecret else self.__checkBudget()
+      
+      expectedLength = schedule.expectedLength
+      
+      if expectedLength is not None:
+        expectedLength *= scaling
+      
+      #Without an expected length, the norm of (e,s,1) is bounded by the target length or estimated from the variance of s and e.
+      #The gaussian heuristic is no estimate, since it is the length of the shortest vector of a random lattice, not of (e,s,1).
+      if expectedLength is None:
+        if targetLength is not None:
+          expectedLength = targetLength
+        elif self.__secretVariance is not None:
+          expectedLength = scaling * sqrt( ( self.__m + self.__n ) * self.__secretVariance + 1 )
+      
+      if schedule.simulate and expectedLength is not None and resumePoint is None:
+        self.predictedBlocksize = schedule.predictBlocksize( bkz.M.r(), expectedLength, maxBlocksize )
+        self.__vPrint("Simulator predicts blocksize %s." % self.predictedBlocksize)
+        
+        if self.predictedBlocksize is not None:
+          startBlocksize = max( startBlocksize, self.predictedBlocksize - schedule.simulationOffset )
+      
+      firstTour = 0
+      
+      if resumePoint is not None:
+        startBlocksize, firstTour = resumePoint
+      
+      self.reductionTime = time.time() - start
+      self.__writeCheckpoint( basis, tracking, startBlocksize, firstTour, *checkpointState )
+
+      for beta in schedule.blocksizes(startBlocksize, maxBlocksize):
+        
+        if foundSecret or exhausted is not None:
+          break
+        
+        self.__vPrint("Starting BKZ with blocksize %d." % beta)
+        
+        self.__clock()
+        stepStart = time.time()
+        
+        for tour in range(firstTour, schedule.tours):
+          par = schedule.parameters(beta, stepStart)
+          
+          if par is None:
+            self.__vPrint("Time budget for blocksize %d exhausted." % beta)
+            break
+          
+          slope = bkz.M.get_current_slope(0, basis.nrows)
+          bkz, basis, tracking, clean = self.__runWithFallback( bkz, basis, tracking, lambda bkz: bkz(par) )
+          
+          secretIndex = self.__findSecret( basis, tracking, noKannanEmbedding, self.__candidateRows(bkz, targetLength, secretBound), targetLength, secretBound )
+          foundSecret = secretIndex is not None
+          
+          self.reductionTime = time.time() - start
+          self.__writeCheckpoint( basis, tracking, beta, tour+1, *checkpointState )
+          
+          if foundSecret:
+            self.successBlocksize = beta
+            
+            self.__vPrint("Found secret at blocksize %d." % beta)
+            
+            break
+          
+          exhausted = self.__checkBudget()
+          
+          if exhausted is not None:
+            break
+          
+          #Further tours don't change a basis, which is already reduced with blocksize beta, e.g., after a warm start.
+          if clean:
+            self.__vPrint("Basis is reduced with blocksize %d." % beta)
+            break
+          
+          if schedule.stagnates( slope, bkz.M.get_current_slope(0, basis.nrows) ):
+            self.__vPrint("GSO profile stagnates at blocksize %d." % beta)
+            break
+        
+        self.__clock()
+        
+        self.__vPrint("Finished BKZ with blocksize %d. Time: %fs." % (beta, self.__time))
+        timings["bkz"][beta] = self.__time
+        
+        if exhausted is None:
+          reachedBlocksize = beta
+          
+          if keepTracking and not foundSecret:
+            unsolved = self.__copyReduction( basis, tracking, beta )
+        
+        firstTour = 0
+      
+      if exhausted is not None:
+        self.__vPrint("Stopping reduction, since the %s budget is exhausted." % exhausted)
+      
+      shortestIndex = secretIndex if foundSecret else 0
+      self.shortestVector = np.array(basis[shortestIndex])
+    
+    if keepTracking:
+      if tracking is None:
+        tracking = self.__trackingOf(basis)
+      
+      self.basis = basis
+      self.__tracking = tracking
+      self.__reducedHintCounts = ( len(self.__perfectHints), len(self.__modHints), len(self.__approximateHints), len(self.__weightedHints) )
+      self.__reducedBlocksize = reachedBlocksize
+      
+      if not foundSecret:
+        self.__unsolvedReduction = ( basis, tracking, reachedBlocksize )
+      elif unsolved is not None and unsolved[1] is None:
+        self.__unsolvedReduction = ( unsolved[0], self.__trackingOf(unsolved[0]), unsolved[2] )
+      else:
+        self.__unsolvedReduction = unsolved
+    
+    self.reductionTime = time.time() - start
+    
+    if self.__rotatedKey is not None:
+      self.s = self.__rotatedKey
+    else:
+      if noKannanEmbedding:
+        self.s = self.__secretsWithoutEmbedding( np.array( [self.shortestVector] ) )[0]
+      elif tracking is not None:
+        self.s = self.__recoverFromTracking( np.array( tracking[shortestIndex] ) )
+      else:
+        self.s = self.__recoverFromTracking( self.__vectorTracking( np.array( [self.shortestVector] ) )[0] )
+      
+      self.s = self.__fullSecret(self.s)
+    
+    return {
+      "success": foundSecret,
+      "budgetExhausted": exhausted,
+      "s": self.s,
+      "shortestVector": self.shortestVector,
+      "successBlocksize": self.successBlocksize,
+      "reachedBlocksize": reachedBlocksize,
+      "reductionTime": self.reductionTime,
+      "timings": timings,
+      "samples": self.__m
+    }
+  
+  """
+    Copy of a reduced basis, its tracking matrix (or None) and the blocksize, up to which it is reduced.
+  """
+  def __copyReduction(self, basis, tracking, blocksize):
+    return IntegerMatrix(basis), None if tracking is None else IntegerMatrix(tracking), blocksize
+  
+  """
+    Tracking matrix of a reduced basis of the general Kannan embedding, recovered exactly from its vectors (see __exactTracking).
+  """
+  def __trackingOf(self, basis):
+    return IntegerMatrix.from_matrix( self.__exactTracking( np.array( [ list(v) for v in basis ], dtype=object ) ).tolist() )
+  
+  """
+    Result of reduce(), if perfect hints have substituted every coordinate of s, which determines s without a lattice.
+    The shortest vector is the error e = b - s*A mod q.
+  """
+  def __substitutedResult(self):
+    self.__vPrint("Every coordinate of s has been substituted by perfect hints.")
+    
+    q = self.__q
+    e = self.__b % q
+    e[e > q//2] -= q
+    
+    self.s = self.__fullSecret( np.zeros( 0, dtype=int ) )
+    self.shortestVector = e
+    self.successBlocksize = 0
+    self.reductionTime = 0
+    
+    return {
+      "success": True,
+      "budgetExhausted": None,
+      "s": self.s,
+      "shortestVector": self.shortestVector,
+      "successBlocksize": 0,
+      "reachedBlocksize": 0,
+      "reductionTime": 0,
+      "timings": { "lll": 0, "bkz": {} },
+      "samples": self.__m
+    }
+  
+  """
+    Sets the budgets of reduce(). The deadline is the earlier one of deadline and maxSeconds from now.
+  """
+  def __setBudget(self, deadline, maxSeconds, maxRss):
+    if maxSeconds is not None:
+      if deadline is None:
+        deadline = time.time() + maxSeconds
+      else:
+        deadline = min( deadline, time.time() + maxSeconds )
+    
+    self.__deadline = deadline
+    self.__maxRss = maxRss
+  
+  """
+    Returns "time" or "memory", if the corresponding budget is exhausted, and None otherwise.
+    The memory is measured as the maximal resident set size of the process so far.
+  """
+  def __checkBudget(self):
+    if self.__deadline is not None and time.time() >= self.__deadline:
+      return "time"
+    
+    if self.__maxRss is not None:
+      rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+      
+      #Linux reports kilobytes, macOS bytes.
+      if sys.platform != "darwin":
+        rss *= 1024
+      
+      if rss >= self.__maxRss:
+        return "memory"
+    
+    return None
+  
+  """
+    Writes the state of the reduction, i.e., basis, tracking, hints and parameters, to the checkpoint file,
+    where tours BKZ tours with blocksize beta have been completed.
+    The file is replaced atomically, such that an interruption leaves the previous checkpoint intact.
+  """
+  def __writeCheckpoint(self, basis, tracking, beta, tours, noKannanEmbedding, terminateAtGH, targetLength, maxBlocksize, schedule):
+    if self.__checkpointPath is None:
+      return
+    
+    data = {
+      "A": self.__A.tolist(),
+      "b": self.__b.tolist(),
+      "q": int(self.__q),
+      "perfectHints": { "vectors": self.__perfectHints.vectors.tolist(), "values": self.__perfectHints.values.tolist() },
+      "modHints": { "vectors": self.__modHints.vectors.tolist(), "values": self.__modHints.values.tolist(), "moduli": self.__modHints.moduli.tolist() },
+      "approximateHints": { "vectors": self.__approximateHints.vectors.tolist(), "values": self.__approximateHints.values.tolist() },
+      "weightedHints": { "vectors": self.__weightedHints.vectors.tolist(), "values": self.__weightedHints.values.tolist(), "variances": self.__hintVariances },
+      "secretVariance": self.__secretVariance,
+      "ntruRing": self.__ntruRing,
+      "substitution": {
+        "fullDimension": int(self.__fullDimension),
+        "remainingCoordinates": self.__remainingCoordinates.tolist(),
+        "matrix": self.__substitutionMatrix.tolist() if self.__substitutionMatrix is not None else None,
+        "offset": self.__substitutionOffset.tolist()
+      },
+      "warmStart": self.__warmStart,
+      "kernelSublattice": self.__kernelSublattice,
+      "dualSublattice": self.__dualSublattice,
+      "basis": [ list(v) for v in basis ],
+      "tracking": [ list(v) for v in tracking ] if tracking is not None else None,
+      "trackingLayout": self.__trackingLayout,
+      "noKannanEmbedding": bool(noKannanEmbedding),
+      "blocksize": int(beta),
+      "tours": tours,
+      "terminateAtGH": terminateAtGH,
+      "targetLength": targetLength,
+      "maxBlocksize": int(maxBlocksize),
+      "schedule": vars(schedule),
+      "predictedBlocksize": self.predictedBlocksize,
+      "reductionTime": self.reductionTime
+    }
+    
+    with open(self.__checkpointPath + ".tmp", "w") as f:
+      json.dump(data, f)
+    
+    os.replace( self.__checkpointPath + ".tmp", self.__checkpointPath )
+  
+  """
+    Chooses the cheapest float type for the GSO, which is expected to be precise enough for the dimension
+    and the entry sizes of basis, and the int type long instead of mpz for entries of at most 30 bits.
+    fplll does not check long entries for overflows. LLL and BKZ keep the entries of basis small, but not the ones of tracking,
+    which is not size-reduced. Hence, long is used only without a tracking matrix, which warm start keeps only,
+    if its coefficients can't be recovered from the reduced basis (see __exactTracking).
+    Returns basis and tracking, converted to the chosen int type.
+  """
+  def __selectNumericTypes(self, basis, tracking):
+    bits = ceil( log( max( max( v.norm() for v in basis ), 2 ), 2 ) )
+    if tracking is not None:
+      bits = max( bits, ceil( log( max( max( v.norm() for v in tracking ), 2 ), 2 ) ) )
+    
+    self.__floatTypes = [
+      floatType for floatType, maxDimension, maxBits in FLOAT_TYPES
+      if FLOAT_TYPE_NAMES[floatType] in float_types
+      and ( maxDimension is None or basis.nrows <= maxDimension )
+      and ( maxBits is None or bits <= maxBits )
+    ]
+    self.floatType = self.__floatTypes.pop(0)
+    
+    if tracking is None and bits <= 30:
+      self.intType = "long"
+    else:
+      self.intType = "mpz"
+    
+    self.__vPrint("Using float type %s and int type %s." % (self.floatType, self.intType))
+    
+    basis = IntegerMatrix.from_matrix( basis, int_type=self.intType )
+    if tracking is not None:
+      tracking = IntegerMatrix.from_matrix( tracking, int_type=self.intType )
+    
+    return basis, tracking
+  
+  def __bkzReduction(self, basis, tracking):
+    if tracking is None:
+      M = GSO.Mat( basis, float_type=self.floatType )
+    else:
+      M = GSO.Mat( basis, float_type=self.floatType, U=tracking )
+    M.update_gso()
+    
+    return BKZReduction(M)
+  
+  """
+    Runs reduction(bkz). If fplll fails numerically, then basis and tracking are reset to their state before,
+    and reduction is repeated with the next more precise float type.
+    Returns the BKZ object, basis and tracking to continue with, and the return value of reduction.
+  """
+  def __runWithFallback(self, bkz, basis, tracking, reduction):
+    fallback = False
+    
+    while True:
+      basisCopy = IntegerMatrix.from_matrix( basis, int_type=self.intType )
+      if tracking is not None:
+        trackingCopy = IntegerMatrix.from_matrix( tracking, int_type=self.intType )
+      
+      try:
+        #The reset basis is LLL-reduced again with the new float type, which may fail as well.
+        if fallback:
+          bkz.lll_obj()
+        
+        result = reduction(bkz)
+        return bkz, basis, tracking, result
+      
+      except ReductionError as error:
+        if len(self.__floatTypes) == 0:
+          raise
+        
+        failedFloatType = self.floatType
+        self.floatType = self.__floatTypes.pop(0)
+        self.__vPrint("Float type %s failed (%s). Switching to %s." % (failedFloatType, error, self.floatType))
+        
+        basis = basisCopy
+        if tracking is not None:
+          tracking = trackingCopy
+        
+        bkz = self.__bkzReduction(basis, tracking)
+        fallback = True
+  
+  """
+    Dimensions and logarithmic volumes of the lattices, which __constructBasis and __constructSubLattice build
+    for the given numbers of samples, with the first counts perfect hints (all of them, if counts is not set) and all modular hints.
+    Perfect hint i takes the column of the i-th coordinate of s in the order of the lattice with the first k perfect hints
+    (see __coordinateOrder), as sweep() builds it, which is removed together with the hint column in the sublattice.
+    Thus, every perfect hint lowers the dimension by one, and the perfect hints multiply the volume by the leading principal minor
+    of their vectors in this order, i.e., the determinant of the first k coordinates of the first k hint vectors.
+    Every modular hint multiplies the volume by its modulus. If only modular hints are integrated, then the dimension reduction
+    eliminates one coordinate of s per mod-q hint instead, which leaves the volume unchanged, and every hint with a modulus
+    not dividing q is assumed to require an auxiliary coordinate (see __modQDimRed). Approximate hints without a variance are
+    not taken into account. Those with a variance multiply the volume by sqrt(det(I + W*V*V^T*W)) for their vectors V
+    and the diagonal matrix W of their weights, as in DDGR's approach, neglecting the perfect hints.
+  """
+  def __latticeParameters(self, samples, counts = None):
+    if counts is None:
+      counts = len(self.__perfectHints)
+
+    counts = np.asarray(counts)
+
+    if self.__useModQDimRed():
+      #There are no perfect hints, i.e., all counts are zero.
+      k, auxiliary = self.__modQHintCounts()
+      moduli = self.__modHints.moduli
+      logVol = ( samples + auxiliary ) * log(self.__q) + np.sum( np.log( moduli[moduli != self.__q] ) )
+      
+      return samples + self.__n - k + auxiliary + 1 - counts, logVol + 0.0*counts
+
+    #The order of the coordinates is either the natural one, or starts with the first k pivots of all hints (see __pivotOrder).
+    V = self.__perfectHints.vectors
+    natural = np.vectorize( lambda k: self.__naturalOrder( V[:k] ) )(counts)
+    logMinors = self.__logLeadingMinors(V)[counts]
+    
+    if not natural.all():
+      logMinors = np.where( natural, logMinors, self.__logLeadingMinors( V[:,self.__pivotOrder(V)] )[counts] )
+
+    dims = samples + self.__n + 1 - counts
+    logVols = samples * log(self.__q) + np.sum( np.log( self.__modHints.moduli ) ) + logMinors
+    
+    if len(self.__weightedHints) > 0:
+      W = self.__weightedHints.vectors * np.sqrt( self.__secretVariance / np.array(self.__hintVariances) )[:,np.newaxis]
+      logVols = logVols + np.linalg.slogdet( np.identity( len(W) ) + W.dot(W.T) )[1] / 2
+
+    return dims, logVols
+
+  """
+    Logarithms of the absolute values of the leading principal minors of the square matrix V[:,:len(V)],
+    from the empty one to the full one. Gaussian elimination without pivoting yields all of them at once,
+    since the k-th minor is the product of the first k pivots.
+  """
+  def __logLeadingMinors(self, V):
+    h = len(V)
+    U = V[:,:h].astype(float)
+    logMinors = np.zeros( h+1 )
+
+    for i in range(h):
+      if U[i,i] == 0:
+        #Elimination without pivoting breaks down. The remaining minors are computed one by one.
+        logMinors[i+1:] = [ np.linalg.slogdet( V[:k,:k].astype(float) )[1] for k in range(i+1, h+1) ]
+        break
+
+      logMinors[i+1] = logMinors[i] + log( abs( U[i,i] ) )
+      U[i+1:,i+1:] -= np.outer( U[i+1:,i] / U[i,i], U[i,i+1:] )
+
+    return logMinors
+
+  """
+    Predicts the blocksizes, at which the secret is found in lattices with the given dimensions and logarithmic volumes,
+    if the coordinates of s and e have standard deviation sigma. This is the smallest blocksize beta, for which
+    sqrt(beta)*sigma <= delta(beta)^(2*beta-d) * Vol^(1/d), as in the estimate of Alkim, Ducas, Poeppelmann and Schwabe.
+    Returns NaN for lattices, for which no blocksize up to the dimension suffices.
+  """
+  def __predictBlocksize(self, dims, logVols, sigma):
+    betas = np.arange( 2, np.max(dims)+1 )
+
+    #Root hermite factor. The asymptotic formula is used for beta >= 50. Below, log(delta) is interpolated linearly to LLL.
+    logDeltas = np.log( (pi*betas)**(1/betas) * betas / (2*pi*e) ) / ( 2*(betas-1) )
+    logDelta50 = log( (pi*50)**(1/50) * 50 / (2*pi*e) ) / 98
+    small = betas < 50
+    logDeltas[small] = log(1.0219) + ( betas[small] - 2 ) / 48 * ( logDelta50 - log(1.0219) )
+
+    dims = np.reshape( dims, (-1,1) )
+    logVols = np.reshape( logVols, (-1,1) )
+
+    success = ( log(sigma) + np.log(betas)/2 <= ( 2*betas - dims ) * logDeltas + logVols / dims ) & ( betas <= dims )
+
+    return np.where( success.any(axis=1), betas[ np.argmax(success, axis=1) ], np.nan )
+
+  """
+    Indices of the vectors of the basis of bkz, which may be shorter than targetLength, or secretBound if targetLength is not set.
+    Every basis vector is at least as long as its Gram-Schmidt vector, so the GSO norms rule out most vectors at once.
+  """
+  def __candidateRows(self, bkz, targetLength, secretBound):
+    bound = targetLength if targetLength is not None else secretBound
+    
+    if bound is None:
+      return []
+    
+    bkz.M.update_gso()
+    
+    return np.flatnonzero( np.array( bkz.M.r() ) <= bound**2 )
+  
+  """
+    Returns the first index in rows, such that the corresponding vector of basis reveals the secret, or None.
+    If targetLength is set, then this is the first vector of norm < targetLength.
+    Otherwise, if secretBound is set, then s is reconstructed from all vectors of norm < secretBound with coefficient c_b = +-1
+    at b at once. Such a vector is (e,s,-1) up to sign and the columns of the hints, so its coordinates are bounded by its norm.
+    The secret of the full instance additionally comprises coordinates, which are not part of the vector, i.e., the ones
+    substituted by hints, eliminated by the dimension reduction or recovered via the hints (see __vectorTracking).
+    The secret is found, if all its coordinates are smaller than q/4, and the centred error b - s*A mod q is shorter than secretBound,
+    as e is part of the vector. Thus, no other short vector is mistaken for the secret.
+    For NTRU instances, the secret is also found, if one of these vectors contains a rotation of the key (see __findRotatedKey).
+  """
+  def __findSecret(self, basis, tracking, noKannanEmbedding, rows, targetLength, secretBound):
+    if targetLength is not None:
+      for i in rows:
+        if basis[i].norm() < targetLength:
+          if self.__ntruRing is not None:
+            self.__findRotatedKey( basis, tracking, noKannanEmbedding, np.array( [i], dtype=int ) )
+          
+          return i
+      
+      return None
+    
+    if secretBound is None:
+      return None
+    
+    q = self.__q
+    rows = np.array( [ i for i in rows if basis[i].norm() < secretBound ], dtype=int )
+    
+    if len(rows) == 0:
+      return None
+    
+    indices, X = self.__candidateSecrets( basis, tracking, noKannanEmbedding, rows )
+    S = X if self.__substitutionMatrix is None else X.dot( self.__substitutionMatrix ) + self.__substitutionOffset
+    
+    small = ( np.abs(S) < q/4 ).all(axis=1)
+    indices, X = indices[small], X[small]
+    
+    if len(indices) > 0:
+      E = ( self.__b - mulMod( X % q, self.__A % q, q ) ) % q
+      E[E > q/2] -= q
+      
+      #The columns of e are scaled by the weight of the lattice (see __hintWeights).
+      small = np.flatnonzero( ( E.astype(float)**2 ).sum(axis=1) < ( secretBound / self.__hintWeights()[0] )**2 )
+      
+      if len(small) > 0:
+        return int( indices[small[0]] )
+    
+    if self.__ntruRing is not None:
+      return self.__findRotatedKey( basis, tracking, noKannanEmbedding, rows )
+    
+    return None
+  
+  """
+    Searches the vectors of basis with the given indices for a rotation X^i*(g,f) of the key of an NTRU instance, or its negation.
+    Unlike (g,f) itself, these are not of the form (e,s,-1), if they violate the hints, but lattice vectors with coefficient c_b = 0
+    at b, which satisfy the hints with values 0. Their coordinates x of s satisfy x*A = x*P*H mod q for the substitution matrix P,
+    and thus, x*P is a key, if both x*P and x*A mod q are smaller than q/4. Then the rotation of x*P, that satisfies the hints,
+    is stored in rotatedKey (see __rotationOfKey).
+    Returns the index of the first vector containing a key, or None.
+  """
+  def __findRotatedKey(self, basis, tracking, noKannanEmbedding, rows):
+    q = self.__q
+    
+    if noKannanEmbedding:
+      V = np.array( [ list(basis[i]) for i in rows ], dtype=int ).reshape( len(rows), basis.ncols )
+      X = self.__secretsWithoutEmbedding(V)
+    
+    else:
+      rows, C = self.__coefficients( basis, tracking, rows, [0] )
+      X = C[:,:-1]
+    
+    keys = X if self.__substitutionMatrix is None else X.dot( self.__substitutionMatrix )
+    
+    small = ( np.abs(keys) < q/4 ).all(axis=1) & ( keys != 0 ).any(axis=1)
+    rows, X, keys = rows[small], X[small], keys[small]
+    
+    if len(rows) == 0:
+      return None
+    
+    G = mulMod( X % q, self.__A % q, q )
+    G[G > q/2] -= q
+    
+    small = np.flatnonzero( ( np.abs(G) < q/4 ).all(axis=1) )
+    
+    if len(small) == 0:
+      return None
+    
+    self.__vPrint("Found a rotation of the key.")
+    self.__rotatedKey = self.__rotationOfKey( keys[small[0]] )
+    
+    return int( rows[small[0]] )
+  
+  """
+    Returns the rotation X^i*x or its negation, which satisfies the coordinate, perfect and modular hints,
+    and is closest to the approximate hints, for i = 0, ..., n-1. All 2n of them are checked at once.
+    If none of them satisfies the hints, then x is returned, which is a key of the instance nevertheless.
+  """
+  def __rotationOfKey(self, x):
+    R = rotMatrix( x, self.__ntruRing )
+    R = np.vstack( [R, -R] )
+    S = R[:,self.__remainingCoordinates]
+    
+    consistent = np.ones( len(R), dtype=bool )
+    
+    if self.__substitutionMatrix is not None:
+      consistent &= ( S.dot( self.__substitutionMatrix ) + self.__substitutionOffset == R ).all(axis=1)
+    
+    perfect, modular = self.__perfectHints, self.__modHints
+    consistent &= ( S.dot( perfect.vectors.T ) == perfect.values ).all(axis=1)
+    consistent &= ( ( S.dot( modular.vectors.T ) - modular.values ) % np.maximum( modular.moduli, 1 ) == 0 ).all(axis=1)
+    
+    if not consistent.any():
+      self.__vPrint("No rotation of the key satisfies the hints.")
+      return x
+    
+    #Approximate hints without a variance are weighted as if their variance was 1.
+    hints = np.vstack( [ self.__approximateHints.hints, self.__weightedHints.hints ] )
+    variances = np.array( [1.0] * len(self.__approximateHints) + self.__hintVariances )
+    errors = ( ( S.dot( hints[:,:-1].T ) - hints[:,-1] )**2 / variances ).sum(axis=1)
+    
+    candidates = np.flatnonzero(consistent)
+    
+    return R[ candidates[ np.argmin( errors[candidates] ) ] ]
+  
+  """
+    Reconstructs s from the vectors of basis with the given indices, which may contain the secret.
+    These are all vectors without Kannan embedding, and otherwise the vectors with coefficient c_b = +-1 at b.
+    Returns the indices of these vectors, and the candidates for s as rows of a matrix.
+  """
+  def __candidateSecrets(self, basis, tracking, noKannanEmbedding, rows):
+    if noKannanEmbedding:
+      V = np.array( [ list(basis[i]) for i in rows ], dtype=int ).reshape( len(rows), basis.ncols )
+      
+      return rows, self.__secretsWithoutEmbedding(V)
+    
+    rows, C = self.__coefficients( basis, tracking, rows, [-1,1] )
+    
+    return rows, -C[:,-1:] * C[:,:-1]
+  
+  """
+    Tracking coefficients (c_s, c_b) of the vectors of basis with the given indices, whose coefficient c_b at b is one of values.
+    They are read from the tracking matrix, or computed from the vectors, if there is none (see __vectorTracking).
+    Returns the indices of these vectors, and their coefficients as rows of a matrix.
+  """
+  def __coefficients(self, basis, tracking, rows, values):
+    if tracking is not None:
+      C = np.array( [ list(tracking[i]) for i in rows ], dtype=int ).reshape( len(rows), self.__n+1 )
+      selected = np.isin( C[:,-1], values )
+      
+      return rows[selected], C[selected]
+    
+    V = np.array( [ list(basis[i]) for i in rows ], dtype=int ).reshape( len(rows), basis.ncols )
+    selected = np.isin( V[:,-1] // self.__hintWeights()[0], values )
+    
+    return rows[selected], self.__vectorTracking( V[selected] )
+  
+  """
+    Secrets s for the rows of V, which are lattice vectors (e, s) without Kannan embedding.
+    The columns of weighted hints follow s, and all columns are scaled (see __constructBasis).
+  """
+  def __secretsWithoutEmbedding(self, V):
+    m = self.__m + len(self.__modHints)
+    
+    return V[:,m:m+self.__n] // self.__hintWeights()[0]
+  
+  def __constructBasis(self):
+        
+    if not self.__useModQDimRed():
+      A = self.__A
+      b = self.__b
+      
+      m = self.__m
+      n = self.__n
+    
+      modHints = self.__modHints
+      ctrModHints = len(self.__modHints)
+      ctrPerfectHints = len(self.__perfectHints)
+      ctrApproximateHints = len(self.__approximateHints)
+      ctrWeightedHints = len(self.__weightedHints)
+      
+    else:
+      self.__vPrint("Only modular hints have been integrated. Eliminating mod-q hints to go to smaller LWE dimension.")
+      A,b,modHints = self.__modQDimRed()
+      
+      n,m = A.shape
+      
+      ctrModHints = len(modHints)
+      ctrPerfectHints = 0
+      ctrApproximateHints = 0
+      ctrWeightedHints = 0
+      
+    dim = m + ctrModHints + n + 1
+    
+    #First row of the A-block. The hint columns share these rows.
+    r = m + ctrModHints
+    
+    B = np.identity(dim, dtype=int)
+    
+    #Columns of the coordinates of s. The perfect and approximate hints take the columns of the first coordinates (see __coordinateOrder).
+    order = self.__coordinateOrder() if ctrPerfectHints > 0 else np.arange(n)
+    B[r:r+n,r:r+n] = np.identity( n, dtype=int )[:,order]
+    
+    #q-block
+    B[range(m),range(m)] = self.__q
+    
+    #A
+    B[r:r+n,:m] = A
+    
+    #Modular hints
+    if ctrModHints > 0:
+      B[r:r+n+1,m:r] = modHints.hints.T
+      B[range(m,r),range(m,r)] = modHints.moduli
+          
+    #Perfect hints
+    if ctrPerfectHints > 0:
+      B[r:r+n+1,r:r+ctrPerfectHints] = self.__perfectHints.hints.T
+              
+    #Approximate hints
+    ctrUsableApproximateHints = min( ctrApproximateHints, n - ctrPerfectHints )
+    
+    if ctrUsableApproximateHints < ctrApproximateHints:
+      warnings.warn("Ignoring approximate hint, since there are already enough many perfect hints.", RuntimeWarning)
+    
+    if ctrUsableApproximateHints > 0:
+      c = r + ctrPerfectHints
+      B[r:r+n+1,c:c+ctrUsableApproximateHints] = self.__approximateHints.hints[:ctrUsableApproximateHints].T
+      
+    #b  
+    B[r+n,:m] = b
+    
+    #Approximate hints with a variance. All columns are scaled, and the weighted hint columns precede the last column.
+    #The row of b holds the target, i.e., the posterior mean of s and the hint values <v,mean> (see __posteriorMean).
+    if ctrWeightedHints > 0:
+      scaling, weights = self.__hintWeights()
+      mean = self.__posteriorMean()
+      
+      B *= scaling
+      
+      c = r + ctrPerfectHints + ctrUsableApproximateHints
+      B[r+n,c:r+n] = np.rint( scaling * mean[order][c-r:] )
+      
+      W = np.zeros( (dim, ctrWeightedHints), dtype=int )
+      W[r:r+n] = self.__weightedHints.vectors.T * weights
+      W[r+n] = np.rint( self.__weightedHints.vectors.dot(mean) * weights )
+      
+      B = np.hstack( [ B[:,:-1], W, B[:,-1:] ] )
+    
+    return IntegerMatrix.from_matrix( B.tolist() )
+    
+  """
+    Removes the hint columns of the basis by constructing the sublattice, whose vectors satisfy the hints.
+    The q-block is scaled together with all other columns, if approximate hints with a variance are integrated.
+    After the dimension reduction, only the hints on the reduced instance are removed. Its tracking matrix
+    would refer to the reduced instance, and is omitted, since the secret is contained in the lattice vectors.
+  """
+  def __constructSubLattice(self,basis):
+    dimRed = self.__useModQDimRed()
+    ctrModHints = self.__modQEmbeddedHints if dimRed else len(self.__modHints)
+    ctrPerfectHints = len(self.__perfectHints)
+    ctrHints = ctrModHints + ctrPerfectHints
+    
+    if dimRed and ctrHints == 0:
+      return basis, None
+    
+    elif ctrHints == 0:
+      tracking = np.zeros( (basis.nrows, self.__n+1), dtype=int )
+      tracking[-self.__n-1:] = np.identity( self.__n+1, dtype=int )
+      
+      return basis, IntegerMatrix.from_matrix( tracking.tolist() )
+    
+    elif self.__kernelSublattice or self.__dualSublattice:
+      m = self.__m
+      n = basis.nrows - m - ctrModHints - 1
+      q = self.__q * self.__hintWeights()[0]
+      
+      #The rows of bottom are the last n+ctrModHints+1 rows. Its first ctrHints columns after the q-block are the hint columns.
+      bottom = np.array( [ list(v) for v in basis[m:] ], dtype=object )
+      
+      K = self.__hintKernel( bottom[:,m:m+ctrHints] )
+      dim_bottom = len(K)
+      
+      B = np.zeros( (m+dim_bottom, basis.ncols-ctrHints), dtype=object )
+      B[range(m),range(m)] = q
+      B[m:,:m] = K.dot( bottom[:,:m] ) % q
+      B[m:,m:] = K.dot( bottom[:,m+ctrHints:] )
+      
+      #The rows of bottom belonging to s and b are the last n+1 rows.
+      tracking = np.zeros( (m+dim_bottom, n+1), dtype=object )
+      tracking[m:] = K[:,ctrModHints:]
+      
+      return IntegerMatrix.from_matrix( B.tolist() ), None if dimRed else IntegerMatrix.from_matrix( tracking.tolist() )
+    
+    else:
+      m = self.__m
+      n = basis.nrows - m - ctrModHints - 1
+      q = self.__q * self.__hintWeights()[0]
+      
+      #Split basis as
+      #  [
+      #    top
+      #    bottom_left | bottom_right
+      #  ].
+      top = basis[:m]
+      bottom = basis[m:]
+      bottom_left = bottom.submatrix(0,0,n+ctrModHints+1,m)
+      bottom_right = bottom.submatrix(0,m,n+ctrModHints+1,basis.ncols)
+    
+      #Zero forcing of the hint columns
+      U = self.__forceZero( bottom_right, ctrHints, self.__gaussianHeuristic(bottom_right) )
+    
+      #Construct new basis
+      bottom_left = U * bottom_left
+      bottom_left = bottom_left[:-ctrHints]
+      bottom_left = bottom_left % q
+    
+      dim_bottom = bottom_left.nrows
+      cols_right = bottom_right.ncols - ctrHints
+    
+      B = IntegerMatrix(m+dim_bottom, m+cols_right)
+    
+      for i in range(m):
+        B[i,i] = q
+    
+      for i in range(dim_bottom):
+        for j in range(m):
+          B[m+i,j] = bottom_left[i,j]
+        for j in range(cols_right):
+          B[m+i,m+j] = bottom_right[i,j+ctrHints]
+      
+      #The rows of bottom belonging to s and b are the last n+1 rows.
+      tracking = IntegerMatrix(m+dim_bottom, n+1)
+      for i in range(dim_bottom):
+        for j in range(n+1):
+          tracking[m+i,j] = U[i,ctrModHints+j]
+      
+      return B, None if dimRed else tracking
+  
+  """
+    Integer weights of the approximate hints with a variance, and the common scaling of all other columns of the lattice.
+    Hint i has the weight sqrt(secretVariance / variance_i), which is multiplied by the scaling and rounded.
+    The scaling is the smallest integer, for which the scaling and all scaled weights are at least WEIGHT_PRECISION,
+    such that rounding the weights and the posterior mean of s (see __constructBasis) is precise.
+  """
+  def __hintWeights(self):
+    if len(self.__weightedHints) == 0:
+      return 1, np.zeros( 0, dtype=int )
+    
+    weights = np.sqrt( self.__secretVariance / np.array(self.__hintVariances) )
+    scaling = ceil( WEIGHT_PRECISION / min( 1, np.min(weights) ) )
+    
+    return scaling, np.rint( scaling * weights ).astype(int)
+  
+  """
+    Mean of s given the approximate hints with a variance, if the coordinates of s are independent with mean 0 and variance secretVariance,
+    and the errors of the hints are independent and normally distributed. For the hint vectors V, the weights W and the hint values l,
+    this is (I + V^T*W^2*V)^(-1) * V^T*W^2*l = V^T*W * (I + W*V*V^T*W)^(-1) * W*l, as in DDGR's approach.
+  """
+  def __posteriorMean(self):
+    V = self.__weightedHints.vectors.astype(float)
+    w = np.sqrt( self.__secretVariance / np.array(self.__hintVariances) )
+    
+    WV = V * w[:,np.newaxis]
+    
+    return WV.T.dot( np.linalg.solve( np.identity( len(V) ) + WV.dot(WV.T), w * self.__weightedHints.values ) )
+  
+  """
+    Order of the coordinates of s in the columns of the embedding. For k perfect hints, the i-th perfect hint takes the column
+    of the i-th coordinate, which requires the hint vectors to be non-singular on the first k coordinates. This holds for the
+    natural order, unless, e.g., the hints are rotations of a polynomial with few non-zero coefficients (see ringHints).
+    Otherwise, the first k coordinates are the pivots of Gaussian elimination on the hint vectors,
+    where every hint is eliminated at its entry of largest absolute value.
+    If k is set, then only the first k perfect hints are taken into account.
+  """
+  def __coordinateOrder(self, k = None):
+    V = self.__perfectHints.vectors[:k]
+    
+    if self.__naturalOrder(V):
+      return np.arange(self.__n)
+    
+    return self.__pivotOrder(V)
+  
+  """
+    Whether the hint vectors V are non-singular on the first len(V) coordinates, such that __coordinateOrder keeps the natural order.
+  """
+  def __naturalOrder(self, V):
+    k = len(V)
+    
+    return k == 0 or np.linalg.matrix_rank( V[:,:k] ) == k
+  
+  """
+    Pivots of Gaussian elimination on the hint vectors V (see __coordinateOrder), followed by the remaining coordinates.
+    The i-th pivot only depends on the first i+1 hints, i.e., the order for the first k hints starts with the first k pivots.
+  """
+  def __pivotOrder(self, V):
+    n, k = self.__n, len(V)
+    U = V.astype(float)
+    pivots = []
+    
+    for i in range(k):
+      j = int( np.argmax( np.abs( U[i] ) ) )
+      pivots.append(j)
+      U[i+1:] -= np.outer( U[i+1:,j] / U[i,j], U[i] )
+    
+    return np.concatenate( [ pivots, np.delete( np.arange(n), pivots ) ] )
+  
+  """
+    Returns an LLL-reduced basis of the integer kernel { x : x*W = 0 } of the matrix W, as rows of a numpy array.
+    The columns of W are processed one after another. The values of the current kernel basis at the column
+    are reduced by the smallest non-zero one, until a single non-zero value (their gcd) remains,
+    whose basis vector is removed. Whenever entries exceed 32 bits, and at the end,
+    the kernel basis is LLL-reduced to keep its entries small.
+  """
+  def __integerKernel(self, W):
+    K = np.identity( len(W), dtype=object )
+    W = W.astype(object)
+    
+    for j in range(W.shape[1]):
+      t = K.dot( W[:,j] )
+      nonZero = np.flatnonzero(t)
+      
+      if len(nonZero) == 0:
+        continue
+      
+      while len(nonZero) > 1:
+        pivot = nonZero[ np.argmin( np.abs( t[nonZero] ) ) ]
+        others = nonZero[ nonZero != pivot ]
+        
+        factors = t[others] // t[pivot]
+        K[others] -= np.outer( factors, K[pivot] )
+        t[others] -= factors * t[pivot]
+        
+        nonZero = np.flatnonzero(t)
+      
+      K = np.delete( K, nonZero[0], axis=0 )
+      
+      if j < W.shape[1]-1 and max( abs( K.min() ), K.max() ) < 2**32:
+        continue
+      
+      K = self.__reduceRows(K)
+    
+    return K
+  
+  """
+    Returns an LLL-reduced basis of the integer kernel of W via __dualKernel, if dualSublattice is set
+    and W has more columns than its kernel has dimensions, and via __integerKernel otherwise, or if __dualKernel fails.
+  """
+  def __hintKernel(self, W):
+    if self.__dualSublattice and 2*W.shape[1] > len(W):
+      K = self.__dualKernel(W)
+      
+      if K is not None:
+        return K
+      
+      self.__vPrint("Dual sublattice construction failed. Falling back to the integer kernel.")
+    
+    return self.__integerKernel(W)
+  
+  """
+    Returns an LLL-reduced basis of the integer kernel { x : x*W = 0 } of the matrix W, as rows of a numpy array,
+    by integrating the columns of W on the dual side.
+    Modulo word-size primes, Gauss-Jordan elimination applies one rank-1 update per column of W, which yields
+    W*G = [I; Y] w.r.t. the rows pivots and the remaining rows free. Over the rationals, Y = Z/d for d = det(W[pivots])
+    and Z = W[free]*adj(W[pivots]), which are recovered by the chinese remainder theorem from their Hadamard bounds.
+    The kernel consists of the vectors x with x[free] = c and x[pivots] = -c*Z/d, where c is in the lattice
+    { c : c*Z = 0 mod d }. Only this lattice is LLL-reduced (see __congruenceLattice), whose dimension is the one of the kernel,
+    while __integerKernel LLL-reduces a basis of almost dimension len(W), whenever its entries exceed 32 bits.
+    Returns None, if the columns of W are linearly dependent, or if the elimination differs between the primes.
+  """
+  def __dualKernel(self, W):
+    W = W[:, np.any( W != 0, axis=0 )].astype(object)
+    dim, k = W.shape
+    
+    if k == 0:
+      return self.__integerKernel(W)
+    
+    Wf = W.astype(float)
+    bits = np.log2( np.linalg.norm( Wf, axis=0 ) ).sum() + log2( k * np.abs(Wf).max() ) + 2
+    primes = wordPrimes(bits)
+    
+    Y, dets, pivots = [], [], None
+    
+    for i in range(0, len(primes), DUAL_PRIME_BATCH):
+      result = self.__eliminateHints( W, primes[i:i+DUAL_PRIME_BATCH], pivots )
+      
+      if result is None:
+        return None
+      
+      Y_p, pivots, dets_p = result
+      Y.append(Y_p)
+      dets.append(dets_p)
+    
+    free = np.delete( np.arange(dim), pivots )
+    
+    if len(free) == 0:
+      return np.zeros( (0,dim), dtype=object )
+    
+    Y = np.concatenate(Y)
+    dets = np.concatenate(dets)
+    
+    d = int( crt( dets, primes ) )
+    Z = crt( Y[:,free] * dets[:,np.newaxis,np.newaxis] % np.array(primes)[:,np.newaxis,np.newaxis], primes )
+    
+    C = self.__congruenceLattice( Z, abs(d) )
+    
+    X = -C.dot(Z)
+    if np.any( X % d != 0 ):
+      return None
+    
+    K = np.zeros( (len(C), dim), dtype=object )
+    K[:,free] = C
+    K[:,pivots] = X // d
+    
+    return self.__reduceRows(K)
+  
+  """
+    Eliminates the columns of W modulo the given primes (see eliminateModPrimes).
+    Returns the rows of W*G modulo every prime, pivots and the determinants of W[pivots] modulo every prime,
+    or None, if W has not full column rank modulo the primes, or if the pivots differ from the given ones.
+  """
+  def __eliminateHints(self, W, primes, pivots):
+    result = eliminateModPrimes( W, primes )
+    
+    if result is None:
+      return None
+    
+    Y, pivots_p, dets = result
+    
+    if len(pivots_p) < W.shape[1] or ( pivots is not None and pivots_p != pivots ):
+      return None
+    
+    return Y, pivots_p, dets
+  
+  """
+    Returns an LLL-reduced basis of the lattice { c : c*Z = 0 mod d }, as rows of a numpy array.
+    As in __integerKernel, the columns of Z are processed one after another. The values of the current basis at the column
+    are reduced mod d by the smallest non-zero one, until a single non-zero value v remains,
+    whose basis vector is multiplied by d/gcd(v,d). Most columns vanish mod d already after a few columns.
+    As in __integerKernel, the basis is LLL-reduced at the end, and before only whenever entries exceed 32 bits.
+  """
+  def __congruenceLattice(self, Z, d):
+    C = np.identity( len(Z), dtype=object )
+    
+    for j in range(Z.shape[1]):
+      t = C.dot( Z[:,j] ) % d
+      nonZero = np.flatnonzero(t)
+      
+      if len(nonZero) == 0:
+        continue
+      
+      while len(nonZero) > 1:
+        pivot = nonZero[ np.argmin( t[nonZero] ) ]
+        others = nonZero[ nonZero != pivot ]
+        
+        factors = t[others] // t[pivot]
+        C[others] -= np.outer( factors, C[pivot] )
+        t[others] -= factors * t[pivot]
+        
+        nonZero = np.flatnonzero(t)
+      
+      C[nonZero[0]] *= d // gcd( int(t[nonZero[0]]), d )
+      
+      if max( abs( C.min() ), C.max() ) >= 2**32:
+        C = self.__reduceRows(C)
+    
+    return self.__reduceRows(C)
+  
+  """
+    Returns the LLL-reduced rows of the integer matrix K, as rows of a numpy array of Python integers.
+  """
+  def __reduceRows(self, K):
+    B = IntegerMatrix.from_matrix( K.tolist() )
+    LLL.reduction(B)
+    
+    K = [ [0]*B.ncols for i in range(B.nrows) ]
+    B.to_matrix(K)
+    
+    return np.array( K, dtype=object )
+  
+  """
+    Integrates the hints of lattice into self, where self has been created from the instance of lattice,
+    i.e., from the remaining coordinates, after coordinate hints have been substituted.
+  """
+  def __integrateHintsOf(self, lattice):
+    self.__substituteHints = False
+    
+    if len(lattice.__perfectHints) > 0:
+      self.integratePerfectHints( lattice.__perfectHints.vectors, lattice.__perfectHints.values )
+    if len(lattice.__modHints) > 0:
+      self.integrateModularHints( lattice.__modHints.vectors, lattice.__modHints.values, lattice.__modHints.moduli )
+    for i in range(len(lattice.__approximateHints)):
+      self.integrateApproximateHint( lattice.__approximateHints.vectors[i], lattice.__approximateHints.values[i] )
+    for i in range(len(lattice.__weightedHints)):
+      self.integrateApproximateHint( lattice.__weightedHints.vectors[i], lattice.__weightedHints.values[i], lattice.__hintVariances[i] )
+    
+    self.__substituteHints = True
+    self.__validator = deepcopy(lattice.__validator)
+    self.__fullDimension = lattice.__fullDimension
+    self.__remainingCoordinates = lattice.__remainingCoordinates
+    self.__substitutionMatrix = lattice.__substitutionMatrix
+    self.__substitutionOffset = lattice.__substitutionOffset
+    self.__ntruRing = lattice.__ntruRing
+  
+  """
+    Checks hints (V,L) on the secret of the full instance for dependencies and contradictions (see HintValidator).
+    Hints on the remaining coordinates, which are integrated internally, have been checked before, and are kept as they are.
+    Returns the hints and their moduli, which are not implied by the previous hints, and warns about the others.
+  """
+  def __validateHints(self, V, L, moduli):
+    if not self.__substituteHints:
+      return V, L, moduli
+    
+    keep = self.__validator.append(V, L, moduli)
+    
+    if not keep.all():
+      warnings.warn("Ignoring %d hints, which are implied by the previously integrated hints." % np.count_nonzero(~keep), RuntimeWarning)
+    
+    if np.ndim(moduli) > 0:
+      moduli = np.array(moduli)[keep]
+    
+    return np.array(V)[keep], np.array(L)[keep], moduli
+  
+  """
+    Maps hints (V,L) on the secret of the full instance to hints on the remaining coordinates.
+    Since the secret of the full instance is s*P + c for the substitution matrix P and offset c,
+    a hint <v,s*P + c> = l becomes <P*v,s> = l - <c,v>.
+  """
+  def __toRemainingCoordinates(self, V, L):
+    V = np.array(V, dtype=int)
+    L = np.array(L, dtype=int)
+    
+    if self.__substitutionMatrix is None:
+      return V, L
+    
+    return V.dot( self.__substitutionMatrix.T ), L - V.dot( self.__substitutionOffset )
+  
+  """
+    Substitutes perfect hints with support of size at most SPARSE_HINT_SUPPORT, one of whose coefficients is +-1,
+    into the LWE instance, which eliminates one coordinate of s per hint (see __substituteCoordinate).
+    While a reduced basis is kept for warm start, no hints are substituted.
+    Returns the remaining hints (V,L), which are not substituted.
+  """
+  def __substituteSparseHints(self, V, L):
+    keep = np.ones( len(V), dtype=bool )
+    
+    for j in range(len(V)):
+      v = V[j]
+      support = np.flatnonzero(v)
+      
+      if len(support) == 0:
+        if L[j] != 0:
+          raise ValueError("Got perfect hint with zero vector and non-zero value %d." % L[j])
+        keep[j] = False
+        continue
+      
+      units = support[ np.abs( v[support] ) == 1 ]
+      
+      #A reduced basis kept for warm start refers to the current coordinates. Its lattice is intersected with the hint instead.
+      if len(support) > SPARSE_HINT_SUPPORT or len(units) == 0 or self.__tracking is not None:
+        continue
+      
+      #s_i = l/v_i - <f,s> for f = v/v_i without coordinate i
+      i = units[0]
+      f = v * v[i]
+      f[i] = 0
+      value = L[j] * v[i]
+      
+      self.__substituteCoordinate( i, f, value )
+      
+      #Remaining hints of this batch
+      L = L - V[:,i] * value
+      V = np.delete( V - np.outer( V[:,i], f ), i, axis=1 )
+      keep[j] = False
+    
+    return V[keep], L[keep]
+  
+  """
+    Eliminates coordinate i of s via s_i = value - <f,s>, where f_i = 0.
+    Then s*A = <f',s> with rows A_j - f_j*A_i of A and b - value*A_i instead of b, which costs O(m) per non-zero entry of f.
+    The hints and the substitution matrix and offset are updated in the same way.
+  """
+  def __substituteCoordinate(self, i, f, value):
+    q = self.__q
+    support = np.flatnonzero(f)
+    
+    self.__vPrint("Substituting coordinate %d of s." % self.__remainingCoordinates[i])
+    
+    A = self.__A.copy()
+    A[support] = ( A[support] - np.outer( f[support], A[i] ) ) % q
+    self.__b = ( self.__b - value * A[i] ) % q
+    self.__A = np.delete( A, i, axis=0 )
+    
+    if self.__substitutionMatrix is None:
+      self.__substitutionMatrix = np.identity( self.__fullDimension, dtype=int )
+    
+    P = self.__substitutionMatrix
+    self.__substitutionOffset = self.__substitutionOffset + value * P[i]
+    P[support] -= np.outer( f[support], P[i] )
+    self.__substitutionMatrix = np.delete( P, i, axis=0 )
+    
+    for hints in [ self.__perfectHints, self.__modHints, self.__approximateHints, self.__weightedHints ]:
+      hints.substitute( i, f, value )
+    
+    self.__remainingCoordinates = np.delete( self.__remainingCoordinates, i )
+    self.__n -= 1
+  
+  """
+    Returns the secret of the full instance for the secret s of the remaining coordinates.
+  """
+  def __fullSecret(self, s):
+    if self.__substitutionMatrix is None:
+      return s
+    
+    return np.array(s, dtype=int).dot( self.__substitutionMatrix ) + self.__substitutionOffset
+  
+  """
+    Integrates the hints start, ..., stop-1 of a sweep.
+  """
+  def __integrateSweepHints(self, V, L, moduli, start, stop):
+    if stop > start:
+      V = np.array(V)[start:stop]
+      L = np.array(L)[start:stop]
+      
+      if moduli is None:
+        self.integratePerfectHints(V, L)
+      elif np.ndim(moduli) == 0:
+        self.integrateModularHints(V, L, moduli)
+      else:
+        self.integrateModularHints(V, L, np.array(moduli)[start:stop])
+  
+  """
+    Given a reduced lattice with a superset of the hints of self, returns a basis of the lattice of self,
+    whose first vectors are the reduced basis vectors of lattice, together with its tracking matrix.
+    The vectors of lattice are embedded via their tracking coefficients c_s, c_b:
+    Apart from the first m coordinates, every coordinate of self is a linear combination of c_s and c_b,
+    given by the rows of s and b of the embedding, e.g., a coordinate of s, an approximate hint <c_s,v> + c_b*l or c_b itself.
+    Returns None, if self does not use the general Kannan embedding.
+  """
+  def __extendReducedBasis(self, lattice):
+    basis, tracking, noKannanEmbedding = self.__prepareBasis()
+    
+    if tracking is None:
+      return None
+    
+    self.__vPrint("Extending reduced basis.")
+    self.__clock()
+    
+    m = self.__m
+    n = self.__n
+    ctrPerfectHints = len(self.__perfectHints)
+    
+    T = np.array( [ list(c) for c in lattice.__tracking ], dtype=object )
+    R = np.array( [ list(v) for v in lattice.basis ], dtype=object )
+    
+    #Rows of s and b of the embedding, restricted to the columns, which are kept in the sublattice.
+    E = np.array( [ list(v) for v in self.__constructBasis() ], dtype=object )[-n-1:,m+len(self.__modHints)+ctrPerfectHints:]
+    
+    lifted = np.hstack( [ R[:,:m], T.dot(E) ] )
+    
+    B = IntegerMatrix.from_matrix( lifted.tolist() + [ list(v) for v in basis ] )
+    U = IntegerMatrix.from_matrix( T.tolist() + [ list(c) for c in tracking ] )
+    
+    M = GSO.Mat( B, U=U )
+    M.update_gso()
+    LLL.Reduction(M)()
+    
+    #Remove zero vectors, which arise from linear dependencies
+    rows = [ i for i in range(B.nrows) if not B[i].is_zero() ]
+    
+    self.__clock()
+    self.__vPrint("Finished extension. Time: %fs." % self.__time)
+    
+    return IntegerMatrix.from_matrix( [ list(B[i]) for i in rows ] ), IntegerMatrix.from_matrix( [ list(U[i]) for i in rows ] )
+  
+  """
+    Zero forcing: Scales the first k columns of B by 2^((dim-1)/2)*gh for the gaussian heuristic gh of the lattice,
+    and LLL-reduces B in place, such that only its last k vectors are non-zero on these columns.
+    The other vectors then span the sublattice of vectors, which vanish on the first k columns.
+    Returns the unimodular transformation.
+  """
+  def __forceZero(self, B, k, gh):
+    dim = B.nrows
+    scaling = ceil( (2)**((dim-1)/2) * gh )
+    
+    for i in range(dim):
+      for j in range(k):
+        B[i,j] *= scaling
+    
+    U = IntegerMatrix.identity(dim)
+    LLL.reduction(B, U)
+    
+    #Check if heuristics hold
+    zero_block = B.submatrix(0,0,dim-k,k)
+    for v in zero_block:
+      if not v.is_zero():
+        raise RuntimeError("Heuristics for Construct-Sublattice failed.")
+    
+    return U
+  
+  """
+    Warm start is possible, if all hints integrated since the last reduction
+    are perfect or modular hints, and the last reduction used the general Kannan embedding.
+  """
+  def __canWarmStart(self):
+    return len(self.__approximateHints) == self.__reducedHintCounts[2] and len(self.__weightedHints) == self.__reducedHintCounts[3]
+  
+  """
+    Intersects the previously reduced lattice with the hyperplanes given by the new hints.
+    For every new hint (v,l), the tracking matrix yields the column of values <c_s,v> + c_b*l
+    of all basis vectors, which has to vanish (mod the modulus of the hint) in the sublattice.
+    With zero forcing (unless kernelSublattice or dualSublattice is set), the derived basis remains LLL-reduced.
+    If kernel is set, then the integer kernel of these values is used instead, which is much faster, since zero forcing
+    LLL-reduces the whole basis with hint columns scaled by about 2^(dim/2), but loses part of the reduction.
+  """
+  def __deriveFromReducedBasis(self, kernel = False):
+    ctrPerfectHints, ctrModHints, _, _ = self.__reducedHintCounts
+    
+    newModHints = self.__modHints.hints[ctrModHints:]
+    newModuli = self.__modHints.moduli[ctrModHints:]
+    newHints = np.vstack( [ newModHints, self.__perfectHints.hints[ctrPerfectHints:] ] )
+    
+    basis = self.basis
+    tracking = self.__tracking
+    
+    k = len(newHints)
+    
+    if k == 0:
+      return basis, tracking
+    
+    rows = basis.nrows
+    dim = rows + len(newModHints)
+    
+    #Python integers, since entries of the tracking matrix may be large.
+    T = np.zeros( (dim, self.__n+1), dtype=object )
+    T[:rows] = [ list(v) for v in tracking ]
+    
+    if kernel or self.__kernelSublattice or self.__dualSublattice:
+      W = T.dot( newHints.astype(object).T )
+      W[range(rows,dim),range(len(newModHints))] = newModuli.astype(object)
+      
+      K = self.__hintKernel(W)
+      
+      B = K[:,:rows].dot( np.array( [ list(v) for v in basis ], dtype=object ) )
+      
+      return IntegerMatrix.from_matrix( B.tolist() ), IntegerMatrix.from_matrix( K.dot(T).tolist() )
+    
+    B = np.zeros( (dim, k+basis.ncols), dtype=object )
+    B[:,:k] = T.dot( newHints.astype(object).T )
+    B[range(rows,dim),range(len(newModHints))] = newModuli.astype(object)
+    B[:rows,k:] = [ list(v) for v in basis ]
+    
+    B = IntegerMatrix.from_matrix( B.tolist() )
+    U = self.__forceZero( B, k, self.__gaussianHeuristic(basis) )
+    
+    tracking = U.submatrix(0,0,dim-k,dim) * IntegerMatrix.from_matrix( T.tolist() )
+    
+    return B.submatrix(0,k,dim-k,B.ncols), tracking
+  
+  """
+    Every tracked vector with coefficient c_b = -1 at b has coefficients s at the rows of s.
+  """
+  def __recoverFromTracking(self, c):
+    if self.shortestVector[-1] > 0:
+      self.shortestVector *= -1
+    
+    c_s = c[:-1]
+    c_b = c[-1]
+    
+    return -c_b * c_s
+  
+  """
+    Tracking coefficients (c_s, c_b) of the lattice vectors V, if no tracking matrix is kept. The last coordinate is c_b,
+    scaled like all other columns (see __constructBasis). After the dimension reduction, c_s is computed from the remaining
+    coordinates (see __modQSecrets). Otherwise, c_s is recovered exactly from the hints (see __exactTracking), if possible,
+    and else, c_s is the solution of the linear system mod q of the LWE samples
+    c_s*A = e' - c_b*b for the first m coordinates e' of the vector, the coordinates of c_s in the vector,
+    the approximate hints <c_s,v> = epsilon - c_b*l, the perfect hints <c_s,v> = -c_b*l and the mod-q hints.
+  """
+  def __vectorTracking(self, V):
+    c_b = V[:,-1:] // self.__hintWeights()[0]
+    
+    if self.__useModQDimRed():
+      C_s = self.__modQSecrets(V)
+    elif self.__recoversTracking():
+      return self.__exactTracking( V.astype(object) ).astype(int)
+    else:
+      C_s = np.array( [ self.__solveCoefficients( v, int(c) ) for v, c in zip( V, c_b[:,0] ) ], dtype=int ).reshape( len(V), self.__n )
+    
+    return np.hstack( [ C_s, c_b ] )
+  
+  """
+    Exact tracking coefficients (c_s, c_b) of the lattice vectors V of the general Kannan embedding, whose columns contain c_b
+    and the coordinates order[k+a:] of c_s for the k perfect and a approximate hints of the tracking layout (see __constructBasis).
+    After a warm start, these are the hints of the lattice, whose reduced basis has been intersected with the new hints. The other coordinates c_D,
+    for D = order[:k+a], solve the perfect hints <c_s,v> = -c_b*l and the approximate hints <c_s,v> = epsilon - c_b*l over the rationals,
+    which is possible, if the hint vectors are non-singular on D (see __recoversTracking).
+  """
+  def __exactTracking(self, V):
+    m = self.__m
+    n = self.__n
+    k, a = self.__trackingLayout
+    scaling = self.__hintWeights()[0]
+    coordinates, offset = self.__coordinateColumns(k, a)
+    
+    C = np.zeros( (len(V), n+1), dtype=object )
+    C[:,-1] = V[:,-1] // scaling
+    C[:,coordinates] = ( V[:,m+a:m+n-k] - np.outer( C[:,-1], offset.astype(object) ) ) // scaling
+    
+    if k+a == 0:
+      return C
+    
+    D = self.__coordinateOrder(k)[:k+a]
+    H = np.vstack( [ self.__perfectHints.hints[:k], self.__approximateHints.hints[:a] ] ).astype(object)
+    
+    #Right-hand sides of H_D*c_D = y - <c,h>, where c_D = 0 so far, and y = 0 for perfect hints.
+    Y = np.zeros( (len(V), k+a), dtype=object )
+    Y[:,k:] = V[:,m:m+a] // scaling
+    
+    M = np.hstack( [ H[:,D], ( Y - C.dot(H.T) ).T ] )
+    M = np.vectorize(Fraction, otypes=[object])(M)
+    
+    #Gauss-Jordan elimination over the rationals
+    for i in range(k+a):
+      pivot = i + np.flatnonzero( M[i:,i] != 0 )[0]
+      M[[i,pivot]] = M[[pivot,i]]
+      M[i] = M[i] / M[i,i]
+      
+      for j in range(k+a):
+        if j != i and M[j,i] != 0:
+          M[j] = M[j] - M[j,i] * M[i]
+    
+    if any( x.denominator != 1 for x in M[:,k+a:].flat ):
+      raise RuntimeError("Tracking coefficients are not integral.")
+    
+    C[:,D] = np.vectorize( lambda x: x.numerator, otypes=[object] )( M[:,k+a:] ).T
+    
+    return C
+  
+  """
+    Whether __exactTracking recovers the tracking coefficients of lattice vectors,
+    i.e., the perfect and approximate hint vectors are non-singular on the coordinates, whose columns they take.
+  """
+  def __recoversTracking(self):
+    k, a = self.__trackingLayout
+    
+    if k+a == 0:
+      return True
+    
+    D = self.__coordinateOrder(k)[:k+a]
+    H = np.vstack( [ self.__perfectHints.vectors[:k], self.__approximateHints.vectors[:a] ] )
+    
+    return np.linalg.matrix_rank( H[:,D].astype(float) ) == k+a
+  
+  """
+    Coordinates of s, whose columns remain in the lattice vectors for the first k perfect and a approximate hints (see __constructBasis),
+    and their offsets in the lattice vectors. The coordinates are shifted by the rounded, scaled posterior mean of s,
+    if approximate hints with a variance are integrated, such that the coefficient c_b contributes c_b*offset to them.
+  """
+  def __coordinateColumns(self, k, a):
+    coordinates = self.__coordinateOrder(k)[k+a:]
+    
+    if len(self.__weightedHints) == 0:
+      return coordinates, np.zeros( len(coordinates), dtype=int )
+    
+    return coordinates, np.rint( self.__hintWeights()[0] * self.__posteriorMean()[coordinates] ).astype(int)
+  
+  """
+    Coefficients c_s of the lattice vector v with coefficient c_b at b, via Gaussian elimination mod q (see __vectorTracking).
+  """
+  def __solveCoefficients(self, v, c_b):
+    m = self.__m
+    n = self.__n
+    q = self.__q
+    ctrPerfectHints = len(self.__perfectHints)
+    ctrApproximateHints = min( len(self.__approximateHints), n - ctrPerfectHints )
+    scaling = self.__hintWeights()[0]
+    coordinates, offset = self.__coordinateColumns(ctrPerfectHints, ctrApproximateHints)
+    
+    modQ = np.flatnonzero( self.__modHints.moduli == q )
+    a = ctrApproximateHints
+    
+    cols = m+n+len(modQ)
+    M = np.zeros( (n, cols), dtype=int )
+    y = np.zeros( cols, dtype=int )
+    
+    #LWE samples
+    M[:,:m] = self.__A
+    y[:m] = v[:m] // scaling - c_b * self.__b
+    
+    #Approximate hints
+    M[:,m:m+a] = self.__approximateHints.vectors[:a].T
+    y[m:m+a] = v[m:m+a] // scaling - c_b * self.__approximateHints.values[:a]
+    
+    #Coordinates in the vector
+    cols_ = np.arange( m+a, m+n-ctrPerfectHints )
+    M[coordinates,cols_] = 1
+    y[cols_] = ( v[cols_] - c_b * offset ) // scaling
+    
+    #Perfect hints
+    M[:,m+n-ctrPerfectHints:m+n] = self.__perfectHints.vectors.T
+    y[m+n-ctrPerfectHints:m+n] = -c_b * self.__perfectHints.values
+    
+    #Mod-q hints. Hints with other moduli are left out.
+    M[:,m+n:] = self.__modHints.vectors[modQ].T
+    y[m+n:] = -c_b * self.__modHints.values[modQ]
+    
+    M,y,_ = gaussianElimination( M % q, y % q, n, q, blockSize=self.__eliminationBlockSize(n) )
+    
+    c_s = y[:n]
+    c_s[c_s > q/2] -= q
+    
+    return c_s
+  
+  """
+    The dimension reduction applies, if only modular hints have been integrated,
+    and it eliminates more coordinates of s than it may add as auxiliary coordinates.
+  """
+  def __useModQDimRed(self):
+    if not self.__modularHintsOnly or len(self.__modHints) == 0:
+      return False
+    
+    k, auxiliary = self.__modQHintCounts()
+    
+    return k > auxiliary
+  
+  """
+    Number of mod-q hints, and number of hints, whose modulus does not divide q.
+  """
+  def __modQHintCounts(self):
+    moduli = self.__modHints.moduli
+    
+    return np.count_nonzero( moduli == self.__q ), np.count_nonzero( self.__q % moduli != 0 )
+  
+  """
+    Eliminates one coordinate of s per mod-q hint via Gaussian elimination mod q. This yields an LWE instance (A,b)
+    on the remaining coordinates s_1, and the eliminated coordinates are s_2 = T[-1] - s_1*T[:-1] mod q
+    for the transformation matrix T. Coordinates in the support of the other hints are eliminated last.
+    A hint <v_1,s_1> + <v_2,s_2> = l mod p is mapped to a hint on s_1, if p divides q or v_2 = 0 mod p.
+    Otherwise, the auxiliary coordinate t = <v_2,s_2> is appended to s_1, where v_2 is centered mod p, such that t is small.
+    The hint becomes <v_1,s_1> + t = l mod p, together with the mod-q hint <T[:-1]*v_2,s_1> + t = <T[-1],v_2> mod q.
+    Returns A and b, extended by zero rows for the auxiliary coordinates, and the hints, which are embedded into the lattice.
+  """
+  def __modQDimRed(self):
+    n = self.__n
+    m = self.__m
+    q = self.__q
+    
+    moduli = self.__modHints.moduli
+    modQ = np.flatnonzero( moduli == q )
+    others = np.flatnonzero( moduli != q )
+    k = len(modQ)
+    
+    V = self.__modHints.vectors[others]
+    P = moduli[others,np.newaxis]
+    order = np.argsort( ( V % P != 0 ).any(axis=0), kind="stable" )
+    
+    cols = k+m
+    
+    M = np.zeros( (n,cols), dtype=int )
+    y = np.zeros( cols, dtype=int )
+    
+    M[:,:k] = self.__modHints.vectors[modQ].T
+    y[:k] = self.__modHints.values[modQ]
+    
+    M[:,k:] = self.__A
+    y[k:] = self.__b
+    
+    M,y,pivots = gaussianElimination(M[order],y,k,q,k,blockSize=self.__eliminationBlockSize(k))
+    
+    remaining = np.delete( np.arange(n), pivots )
+    
+    transformationMatrix = np.vstack( [ M[remaining,0:k], y[0:k] ] )
+    A = M[remaining,k:]
+    b = y[k:]
+    
+    self.__modQEliminatedCoordinates = order[pivots]
+    self.__modQRemainingCoordinates = order[remaining]
+    self.__modQTransformationMatrix = transformationMatrix
+    
+    #Hints with other moduli
+    V_1 = V[:,self.__modQRemainingCoordinates]
+    V_2 = ( V[:,self.__modQEliminatedCoordinates] + P//2 ) % P - P//2
+    L = self.__modHints.values[others]
+    U = mulMod( transformationMatrix % q, V_2.T % q, q ).T
+    
+    divisors = ( q % P[:,0] == 0 )
+    V_1[divisors] = ( V_1[divisors] - U[divisors,:-1] ) % P[divisors]
+    L[divisors] = ( L[divisors] - U[divisors,-1] ) % P[divisors,0]
+    
+    auxiliary = np.flatnonzero( ~divisors & ( V_2 != 0 ).any(axis=1) )
+    a = len(auxiliary)
+    r = n-k
+    
+    H = np.zeros( (len(others)+a, r+a), dtype=int )
+    H[:len(others),:r] = V_1
+    H[auxiliary,r+np.arange(a)] = 1
+    H[len(others):,:r] = U[auxiliary,:-1]
+    H[len(others):,r:] = np.identity( a, dtype=int )
+    
+    hints = HintStore(r+a, len(H))
+    hints.append( H, np.concatenate( [ L, U[auxiliary,-1] ] ), np.concatenate( [ P[:,0], np.full( a, q ) ] ) )
+    self.__modQEmbeddedHints = len(hints)
+    
+    return np.vstack( [ A, np.zeros( (a,m), dtype=int ) ] ), b, hints
+  
+  """
+    Secrets of the full instance for the rows of V, which are lattice vectors (e, s_1, t, -1) after the dimension reduction,
+    where s_1 are the remaining and t the auxiliary coordinates.
+  """
+  def __modQSecrets(self, V):
+    q = self.__q
+    m = self.__m
+    r = len(self.__modQRemainingCoordinates)
+    
+    S_1 = np.hstack( [ V[:,m:m+r], V[:,-1:] ] )
+    S_2 = ( -mulMod( S_1 % q, self.__modQTransformationMatrix % q, q ) ) % q
+    S_2[S_2 > q/2] -= q
+    
+    S = np.zeros( (len(V), self.__n), dtype=int )
+    S[:,self.__modQEliminatedCoordinates] = S_2
+    S[:,self.__modQRemainingCoordinates] = S_1[:,:-1]
+    
+    return S
+  
+  """
+    Returns whether the instance is an NTRU instance, i.e., A is the rotation matrix rotMatrix(h, cyclotomic) of some h mod q,
+    and b = 0 mod q, as for the instances of ntruGen() (cyclotomic = False) and falconGen() (cyclotomic = True), and None otherwise.
+    Then every rotation X^i*(f,g) of the key (f,g) and its negation is a key as well.
+  """
+  def __detectNTRURing(self, A, b, q):
+    n, m = A.shape
+    
+    if n != m or n < 2 or ( np.array(b) % q != 0 ).any():
+      return None
+    
+    for cyclotomic in [False, True]:
+      if ( ( rotMatrix( A[0], cyclotomic ) - A ) % q == 0 ).all():
+        return cyclotomic
+    
+    return None
+  
+  def __checkHintFormat(self, v):
+    if len(v) != self.__fullDimension:
+      raise ValueError("Expected hint of dimension %d, but got %d." % (self.__fullDimension, len(v)))
+  
+  def __checkHintsFormat(self, V, L):
+    if np.ndim(V) != 2:
+      raise ValueError("Expected hint vectors as rows of a two-dimensional array.")
+    
+    if np.shape(V)[1] != self.__fullDimension:
+      raise ValueError("Expected hints of dimension %d, but got %d." % (self.__fullDimension, np.shape(V)[1]))
+    
+    if len(V) != len(L):
+      raise ValueError("Got %d hint vectors, but %d hint values." % (len(V), len(L)))
+   
+  """
+    Gaussian heuristic of the lattice spanned by basis, which bounds the norm of the vector containing the secret.
+    The determinant is computed via its logarithm, as get_root_det of fpylll returns the root of the Gram determinant.
+  """
+  def __gaussianHeuristic(self, basis):
+    dim = basis.nrows
+    
+    M = GSO.Mat(basis)
+    M.update_gso()
+    
+    root_det = exp( M.get_log_det(0,dim) / ( 2*dim ) )
+    
+    if not np.isfinite(root_det):
+      self.__vPrint("fpylll failed to compute root_det. Resort to approximation via Hadamard bound.")
+      
+      #Approximate root_det by Hadamard bound.
+      log_root_hadamard = 0
+      for v in basis:
+        log_root_hadamard += log(v.norm()) / dim
+      log_root_hadamard = ceil(log_root_hadamard)
+      root_det = e**log_root_hadamard
+    
+    gh = sqrt( dim / (2*pi*e) ) * root_det
+    
+    return gh
+  
+  """
+    Elimination of many coordinates is done blockwise,
+    which replaces most rank-1 updates by matrix products.
+  """
+  def __eliminationBlockSize(self, k):
+    if k >= 64:
+      return 32
+    else:
+      return None
+  
+  def __clock(self):
+    if self.__clockTicking:
+      self.__time = time.time() - self.__time
+      self.__clockTicking = False
+    else:
+      self.__time = time.time()
+      self.__clockTicking = True
   
   def __vPrint(self, s):
     if self.__verbose:
       print(str(s))
-    
\ No newline at end of file
+
+
+"""
+  Reduces a randomized copy of a basis in a worker process of LWELattice.reduceParallel().
+  Returns the lattice with the state after the reduction, and the result of the reduction.
+"""
+def _reduceVariant(task):
+  lattice, variant, basis, tracking, noKannanEmbedding, params, schedule = task
+  
+  result = lattice._LWELattice__reduceBasis( basis, tracking, noKannanEmbedding, 0, *params, schedule )
+  result["variant"] = variant
+  
+  return lattice, result
+
+"""
+  Decodes a chunk of guesses for the hybrid attack LWELattice.reduceHybrid() in a worker process.
+  Returns the number of decoded guesses and the secret s, if one of them revealed it, or None.
+"""
+def _decodeGuesses(task):
+  decoder, instance, guesses = task
+  A, b, q, coordinates, remaining, V, L = instance
+  
+  B = ( b - guesses.dot( A[coordinates] ) ) % q
+  L = L - guesses.dot( V[:,coordinates].T )
+  
+  for guess, s_ in zip( guesses, decoder.solveMany(B, L) ):
+    if s_ is None:
+      continue
+    
+    s = np.zeros( len(A), dtype=int )
+    s[coordinates] = guess
+    s[remaining] = s_
+    
+    e = ( b - s.dot(A) ) % q
+    e[e > q/2] -= q
+    
+    if ( np.abs(s) < q/4 ).all() and ( np.abs(e) < q/4 ).all():
+      return len(guesses), s
+  
+  return len(guesses), None
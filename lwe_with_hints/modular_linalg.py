@@ -0,0 +1,274 @@
+import numpy as np
+from functools import lru_cache
+from math import gcd
+
+"""
+  Linear algebra over Z_q on numpy arrays.
+  All arrays are expected to be of dtype int. Entries are kept in [0,q),
+  so products of two entries fit into 64 bits for all q < 2^31.
+"""
+
+"""
+  Returns a^(-1) mod q, or None if a is not invertible mod q.
+  Results are cached, since elimination over Z_q repeatedly inverts the same values.
+"""
+@lru_cache(maxsize=1<<16)
+def modInverse(a, q):
+  if gcd(a, q) != 1:
+    return None
+  return pow(a, -1, q)
+
+"""
+  Returns X*Y mod q for matrices X, Y with entries in [0,q).
+  If possible, the product is computed in floating point arithmetic (BLAS),
+  splitting the inner dimension into chunks, such that all intermediate results are exact.
+"""
+def mulMod(X, Y, q):
+  inner = X.shape[1]
+
+  if (q-1)**2 < 2**53:
+    dtype = float
+    chunk = 2**52 // max( (q-1)**2, 1 )
+  else:
+    dtype = object
+    chunk = inner
+
+  Z = np.zeros( (X.shape[0], Y.shape[1]), dtype=dtype )
+
+  for i in range(0, max(inner,1), chunk):
+    Z += X[:,i:i+chunk].astype(dtype) @ Y[i:i+chunk].astype(dtype)
+    Z %= q
+
+  return Z.astype(int)
+
+"""
+  Run Gaussian elimination over Z_q on a linear system of equations
+      x*M = y
+  to eliminate k coordinates of x.
+  If the optional parameter restrictColumns is set,
+  then the algorithm uses only the first restrictColumns columns
+  to eliminate coordinates.
+  If the optional parameter blockSize is set, then blockSize rows of M
+  are eliminated at once, which replaces blockSize rank-1 updates of the
+  full matrix by a single matrix product. This pays off for large k.
+
+  Returns M', y', pivots, such that
+      x * M' = y',
+  where the rows pivots of M' are eliminated, i.e., row pivots[i] of M' is the i-th unit vector.
+"""
+def gaussianElimination(M, y, k, q, restrictColumns = None, blockSize = None):
+  rows, cols = M.shape
+
+  if k > rows:
+    raise IndexError("Value of k has to be <= than dimension of unknown. Got k=%d, but was expecting k<%d" % (k,rows))
+
+  if restrictColumns == None:
+    restrictColumns = cols
+
+  M_ = np.vstack( [M, y] ) % q
+  pivots = []
+
+  if blockSize == None:
+    rowCtr = 0
+    while rowCtr < rows and len(pivots) < k:
+      if _eliminateRow(M_, rowCtr, len(pivots), restrictColumns, q) != None:
+        pivots.append(rowCtr)
+      rowCtr += 1
+
+  else:
+    for panelStart in range(0, rows, blockSize):
+      if len(pivots) >= k:
+        break
+
+      M_, panelPivots = _eliminatePanel(M_, panelStart, min(panelStart+blockSize, rows), k - len(pivots), len(pivots), restrictColumns, q)
+      pivots += panelPivots
+
+  if len(pivots) < k:
+    #Arises when columns are not linearly independent.
+    raise RuntimeError("Gaussian elimination failed. Could only eliminate %d coordinates, instead of %d." % (len(pivots),k))
+
+  return M_[:-1], M_[-1], pivots
+
+"""
+  Eliminates coordinate row of x in place, using the first column in [col, restrictColumns),
+  whose entry in this row is invertible mod q. The pivot column is moved to position col.
+  Returns the pivot column, or None if there is no invertible entry.
+"""
+def _eliminateRow(M_, row, col, restrictColumns, q):
+  candidates = np.flatnonzero( np.gcd( M_[row,col:restrictColumns], q ) == 1 )
+
+  if len(candidates) == 0:
+    return None
+
+  pivot = col + candidates[0]
+
+  M_[:,pivot] = ( M_[:,pivot] * modInverse( int(M_[row,pivot]), q ) ) % q
+
+  if pivot != col:
+    M_[:,[col,pivot]] = M_[:,[pivot,col]]
+
+  factors = M_[row].copy()
+  factors[col] = 0
+  nonZero = np.flatnonzero(factors)
+
+  M_[:,nonZero] = ( M_[:,nonZero] - np.outer( M_[:,col], factors[nonZero] ) ) % q
+
+  return pivot
+
+"""
+  Eliminates the rows [start, stop) of M_, but at most k of them.
+  The elimination is carried out on the panel of these rows only, while
+  keeping track of the column transformation G, such that panel' = panel * G.
+  G equals a permutation matrix, except in the rows of the pivot columns,
+  which are stored in R. Eventually, the remaining rows are updated by a single product.
+  Returns M_*G and the list of eliminated rows.
+"""
+def _eliminatePanel(M_, start, stop, k, eliminated, restrictColumns, q):
+  cols = M_.shape[1]
+  size = stop - start
+
+  #Panel, augmented by the rows R of G.
+  W = np.vstack( [ M_[start:stop], np.zeros( (size,cols), dtype=int ) ] )
+  permutation = np.arange(cols)
+  pivotColumns = []
+  pivots = []
+
+  for row in range(size):
+    if len(pivots) >= k:
+      break
+
+    col = eliminated + len(pivots)
+    candidates = np.flatnonzero( np.gcd( W[row,col:restrictColumns], q ) == 1 )
+
+    if len(candidates) > 0:
+      #The column at position pivot has not been a pivot column so far.
+      #Thus, its row in G is the unit vector at position pivot.
+      pivot = col + candidates[0]
+      W[size+len(pivots),pivot] = 1
+
+      _eliminateRow(W, row, col, restrictColumns, q)
+
+      pivotColumns.append( permutation[pivot] )
+      permutation[[col,pivot]] = permutation[[pivot,col]]
+      pivots.append( start + row )
+
+  if len(pivots) == 0:
+    return M_, pivots
+
+  R = W[size:size+len(pivots)]
+
+  M_new = M_[:,permutation]
+  M_new[:,eliminated:eliminated+len(pivots)] = 0
+  M_new = ( M_new + mulMod( M_[:,pivotColumns], R, q ) ) % q
+
+  return M_new, pivots
+
+"""
+  Deterministic Miller-Rabin test, which is correct for all p < 2^32.
+"""
+def _isPrime(p):
+  if p < 2:
+    return False
+
+  for a in [2, 3, 5, 7]:
+    if p % a == 0:
+      return p == a
+
+  d, r = p-1, 0
+  while d % 2 == 0:
+    d //= 2
+    r += 1
+
+  for a in [2, 3, 5, 7]:
+    x = pow(a, d, p)
+    if x == 1 or x == p-1:
+      continue
+    for i in range(r-1):
+      x = x*x % p
+      if x == p-1:
+        break
+    else:
+      return False
+
+  return True
+
+"""
+  Returns the largest primes below 2^31, whose product is at least 2^bits.
+"""
+def wordPrimes(bits):
+  primes = []
+  p = 2**31
+
+  while sum( np.log2(primes) ) < bits:
+    p -= 1
+    if _isPrime(p):
+      primes.append(p)
+
+  return primes
+
+"""
+  Returns the integers in (-P/2, P/2], where P is the product of primes, that are congruent to R[i] mod primes[i].
+  The residues R[i] are given as integer arrays, which are stacked along the first axis of R.
+"""
+def crt(R, primes):
+  P = 1
+  for p in primes:
+    P *= p
+
+  X = np.zeros( np.shape(R[0]), dtype=object )
+  for i, p in enumerate(primes):
+    c = P // p
+    X += np.array( R[i] ).astype(object) * ( c * pow(c, -1, p) )
+
+  X %= P
+  X[X > P // 2] -= P
+
+  return X
+
+"""
+  Gauss-Jordan elimination of the columns of M modulo several primes at once.
+  For every row, the first column, that is no pivot column so far and whose entry in this row is invertible
+  modulo all primes, is scaled to a unit in this row and eliminated from all other columns by one rank-1 update.
+  This yields
+      M*G = M'
+  for an invertible matrix G, where row pivots[i] of M' is the i-th unit vector.
+  Returns M' modulo every prime (stacked along the first axis), pivots, and the determinants of the rows pivots of M
+  modulo every prime. Returns None, if the entries of a row are neither zero nor invertible modulo all primes.
+"""
+def eliminateModPrimes(M, primes):
+  P = np.array( primes, dtype=np.int64 )[:,np.newaxis,np.newaxis]
+  M_ = np.stack( [ ( M % p ).astype(np.int64) for p in primes ] )
+  rows, cols = M.shape
+  pivots = []
+  dets = np.ones( len(primes), dtype=np.int64 )
+
+  for row in range(rows):
+    col = len(pivots)
+    if col == cols:
+      break
+
+    candidates = np.flatnonzero( np.all( M_[:,row,col:] != 0, axis=0 ) )
+
+    if len(candidates) == 0:
+      if M_[:,row,col:].any():
+        return None
+      continue
+
+    pivot = col + candidates[0]
+    if pivot != col:
+      M_[:,:,[col,pivot]] = M_[:,:,[pivot,col]]
+      dets = -dets
+
+    a = M_[:,row,col]
+    dets = dets * a % P[:,0,0]
+    inverses = np.array( [ modInverse( int(a[i]), p ) for i, p in enumerate(primes) ], dtype=np.int64 )
+    M_[:,row:,col] = M_[:,row:,col] * inverses[:,np.newaxis] % P[:,:,0]
+
+    #Rows before row are zero in column col, hence they are not changed.
+    factors = M_[:,row].copy()
+    factors[:,col] = 0
+    M_[:,row:] = ( M_[:,row:] - M_[:,row:,col,np.newaxis] * factors[:,np.newaxis] ) % P
+
+    pivots.append(row)
+
+  return M_, pivots, dets
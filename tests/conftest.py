@@ -0,0 +1,50 @@
+import random
+import numpy as np
+import pytest
+
+from lwe_with_hints import generateToyInstance
+
+"""
+  Toy instance with n = 20, m = 30, which LLL solves.
+"""
+@pytest.fixture
+def easyInstance():
+  random.seed(1)
+  return generateToyInstance(20,30,521,1)
+
+"""
+  Toy instance with n = 30, m = 40.
+"""
+@pytest.fixture
+def smallInstance():
+  random.seed(3)
+  return generateToyInstance(30,40,521,2)
+
+"""
+  Toy instance of dimension 151 with n = 70, m = 80, which BKZ solves at a small blocksize.
+"""
+@pytest.fixture
+def toyInstance():
+  random.seed(5)
+  return generateToyInstance(70,80,521,2)
+
+"""
+  The toy instance with 15 perfect hints (V, L), whose blocksizes differ for 0, 5, 10 and 15 hints.
+"""
+@pytest.fixture
+def toyInstanceWithHints(toyInstance):
+  A,b,q,s,e = toyInstance
+  V = np.array([ [ random.randrange(q) for _ in range(70) ] for _ in range(15) ])
+  
+  return A,b,q,s,V,V.dot(s)
+
+"""
+  Toy instance with the power of two q = 512, and 14 random hint vectors V.
+"""
+@pytest.fixture
+def powerOfTwoInstance():
+  random.seed(13)
+  A,b,q,s,e = generateToyInstance(30,40,512,2)
+  V = np.array([ [ random.randrange(q) for _ in range(30) ] for _ in range(14) ])
+  
+  return A,b,q,s,V
@@ -0,0 +1,25 @@
+from lwe_with_hints import LWELattice
+
+"""
+  A secret found by LLL is a success, even if the time budget is exhausted afterwards.
+"""
+def test_success_does_not_exhaust_budget(easyInstance):
+  A,b,q,s,e = easyInstance
+  
+  result = LWELattice(A,b,q).reduce( maxSeconds = 0 )
+  
+  assert result["success"]
+  assert result["budgetExhausted"] is None
+  assert ( result["s"] == s ).all()
+
+"""
+  Without the secret, a zero time budget stops the reduction before BKZ.
+"""
+def test_exhausted_budget_stops_reduction(toyInstance):
+  A,b,q,s,e = toyInstance
+  
+  result = LWELattice(A,b,q).reduce( maxSeconds = 0 )
+  
+  assert not result["success"]
+  assert result["budgetExhausted"] == "time"
+  assert result["timings"]["bkz"] == {}
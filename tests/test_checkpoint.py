@@ -0,0 +1,43 @@
+import json
+
+from lwe_with_hints import LWELattice
+
+"""
+  Budget check, that reports an exhausted time budget at its third call, i.e., after the first BKZ tour with blocksize 3.
+"""
+def exhaustAtThirdCheck():
+  calls = []
+  
+  def checkBudget(self):
+    calls.append(None)
+    return "time" if len(calls) == 3 else None
+  
+  return checkBudget
+
+"""
+  A reduction stopped by its time budget resumes from the checkpoint after the last completed tour, and finds the secret.
+"""
+def test_resume_after_interruption(toyInstance, tmp_path, monkeypatch, capsys):
+  A,b,q,s,e = toyInstance
+  path = str( tmp_path / "checkpoint.json" )
+  
+  monkeypatch.setattr( LWELattice, "_LWELattice__checkBudget", exhaustAtThirdCheck() )
+  result = LWELattice(A,b,q).reduce( checkpoint = path, maxSeconds = 3600 )
+  monkeypatch.undo()
+  
+  assert not result["success"]
+  assert result["budgetExhausted"] == "time"
+  
+  with open(path) as f:
+    data = json.load(f)
+  
+  assert data["blocksize"] == result["reachedBlocksize"] + 1
+  assert data["tours"] == 1
+  
+  lattice = LWELattice.resume( path, verbose = True )
+  out = capsys.readouterr().out
+  
+  assert "Resuming at blocksize %d after 1 tours." % data["blocksize"] in out
+  assert out.split("Starting BKZ")[1].startswith(" with blocksize %d." % data["blocksize"])
+  assert lattice.successBlocksize >= data["blocksize"]
+  assert ( lattice.s == s ).all()
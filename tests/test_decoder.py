@@ -0,0 +1,63 @@
+import random
+import numpy as np
+import pytest
+
+from lwe_with_hints import LWEDecoder
+from lwe_with_hints.lwe_gen import binomial_vec
+
+"""
+  Several toy instances b_i = s_i*A + e_i mod q with one matrix A.
+"""
+def sharedInstances(count):
+  random.seed(7)
+  n, m, q = 20, 30, 521
+  A = np.array([ [ random.randrange(q) for _ in range(m) ] for _ in range(n) ])
+  S = np.array([ binomial_vec(n,1) for _ in range(count) ])
+  E = np.array([ binomial_vec(m,1) for _ in range(count) ])
+  
+  return A, ( S.dot(A) + E ) % q, q, S
+
+"""
+  Every instance is decoded with the reduced basis of A.
+"""
+def test_decoder_solves_shared_instances():
+  A,B,q,S = sharedInstances(5)
+  
+  decoder = LWEDecoder(A,q, blocksize = 10, enumerate = True)
+  secrets = decoder.solveMany(B)
+  
+  for s, secret in zip(secrets, S):
+    assert s is not None
+    assert ( s == secret ).all()
+  
+  assert ( decoder.solve(B[0]) == S[0] ).all()
+
+"""
+  Perfect and modular hint values are passed per instance.
+"""
+def test_decoder_with_hints():
+  A,B,q,S = sharedInstances(3)
+  V = np.array([ np.eye(20, dtype=int)[0], np.ones(20, dtype=int) ])
+  moduli = [0, 2]
+  L = np.array([ S.dot(V[0]), S.dot(V[1]) % 2 ]).T
+  
+  decoder = LWEDecoder(A,q, hintVectors = V, hintModuli = moduli, blocksize = 10, enumerate = True)
+  secrets = decoder.solveMany(B, L)
+  
+  for s, secret in zip(secrets, S):
+    assert s is not None
+    assert ( s == secret ).all()
+
+"""
+  Modular hint values are reduced mod their moduli, and weighted hint values beyond 64 bits are rejected.
+"""
+def test_decoder_hint_magnitudes():
+  A,B,q,S = sharedInstances(1)
+  V = np.array([ np.eye(20, dtype=int)[0], np.ones(20, dtype=int) ])
+  
+  decoder = LWEDecoder(A,q, hintVectors = V, hintModuli = [0, q], blocksize = 10, enumerate = True)
+  
+  assert ( decoder.solve( B[0], [ S[0,0], int( S[0].sum() ) + 2**70 * q ] ) == S[0] ).all()
+  
+  with pytest.raises(ValueError):
+    decoder.solve( B[0], [ 2**70, 0 ] )
@@ -0,0 +1,19 @@
+import numpy as np
+
+from lwe_with_hints import LWELattice
+
+"""
+  Parity hints and a hint mod 3 do not prevent the elimination of the coordinates of the mod-q hints.
+  The parity hints map to the remaining coordinates, and the hint mod 3 adds an auxiliary coordinate.
+"""
+def test_mixed_moduli_keep_dimension_reduction(capsys, powerOfTwoInstance):
+  A,b,q,s,V = powerOfTwoInstance
+  moduli = np.array( [q]*10 + [2]*3 + [3] )
+  
+  lattice = LWELattice(A,b,q, verbose = True)
+  lattice.integrateModularHints( V, V.dot(s) % moduli, moduli )
+  result = lattice.reduce()
+  
+  assert "Eliminating mod-q hints" in capsys.readouterr().out
+  assert result["success"]
+  assert ( lattice.s == s ).all()
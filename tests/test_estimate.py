@@ -0,0 +1,124 @@
+import random
+import numpy as np
+import pytest
+
+from lwe_with_hints import LWELattice, generateToyInstance
+
+"""
+  The reduction uses the selected number of samples.
+"""
+def test_select_samples(smallInstance):
+  A,b,q,s,e = smallInstance
+  
+  lattice = LWELattice(A,b,q)
+  assert lattice.selectSamples( samples = 35 ) == 35
+  
+  result = lattice.reduce()
+  
+  assert result["success"]
+  assert result["samples"] == 35
+  assert ( lattice.s == s ).all()
+  
+  with pytest.raises(ValueError):
+    lattice.selectSamples( samples = 36 )
+
+"""
+  The selected number of samples does not raise the predicted cost above the one of all samples.
+"""
+def test_select_samples_minimizes_cost(toyInstance):
+  A,b,q,s,e = toyInstance
+  
+  lattice = LWELattice(A,b,q)
+  samples = lattice.selectSamples( sigma = 1 )
+  
+  assert 1 <= samples <= 80
+  assert lattice.estimate(1)["dimension"] == samples + 70 + 1
+  assert lattice.estimate(1)["logCost"] <= LWELattice(A,b,q).estimate(1)["logCost"]
+
+"""
+  Every perfect hint lowers the dimension by one, and more hints never raise the predicted blocksize.
+"""
+def test_estimate_counts(toyInstanceWithHints):
+  A,b,q,s,V,L = toyInstanceWithHints
+  
+  lattice = LWELattice(A,b,q)
+  lattice.integratePerfectHints( V, L )
+  estimate = lattice.estimate( 1, counts = [0,5,10,15] )
+  
+  assert list( estimate["dimension"] ) == [151, 146, 141, 136]
+  assert ( np.diff( estimate["blocksize"] ) <= 0 ).all()
+  assert estimate["blocksize"][0] > estimate["blocksize"][-1]
+  assert lattice.estimate(1)["blocksize"] == estimate["blocksize"][-1]
+  
+  with pytest.raises(ValueError):
+    lattice.estimate( 1, counts = [16] )
+
+"""
+  Approximate hints with a variance lower the predicted blocksize, and the secret is found at a smaller blocksize than without
+  hints on each of four instances with n = 70, m = 45 and 35 coordinate hints. The same hints without a variance are ignored by
+  estimate(). With many more samples, the instances are solved at tiny blocksizes, at which the hints do not help (see README).
+"""
+def test_weighted_hints_lower_blocksize():
+  blocksizes = { None: [], 2/3: [] }
+  
+  for seed in range(4):
+    random.seed(seed)
+    A,b,q,s,e = generateToyInstance(70,45,521,2)
+    errors = np.random.default_rng(seed).integers(-1, 2, 35)
+    
+    estimates = []
+    
+    for variance in [ None, 2/3 ]:
+      lattice = LWELattice(A,b,q, secretVariance = 1)
+      
+      if variance is not None:
+        for i in range(35):
+          lattice.integrateApproximateHint( np.eye(70, dtype=int)[i], s[i] + errors[i], variance )
+      
+      estimates.append( lattice.estimate(1)["blocksize"] )
+      result = lattice.reduce()
+      
+      assert result["success"]
+      assert ( lattice.s == s ).all()
+      blocksizes[variance].append( result["successBlocksize"] )
+    
+    assert estimates[1] < estimates[0]
+    
+    lattice = LWELattice(A,b,q, secretVariance = 1)
+    lattice.integrateApproximateHint( np.eye(70, dtype=int)[0], s[0] + errors[0] )
+    assert lattice.estimate(1)["blocksize"] == estimates[0]
+  
+  assert all( w <= u for w,u in zip( blocksizes[2/3], blocksizes[None] ) )
+  assert sum( blocksizes[2/3] ) < sum( blocksizes[None] )
+
+"""
+  estimate() with counts predicts the lattices, which sweep() builds for the first k hints, and the blocksize, at which selectSamples()
+  predicts them to be solved with all samples. The first hint vanishes at the first coordinate, such that the lattice with one hint
+  takes the columns of the pivots (see __coordinateOrder), but the lattice with all hints the natural order.
+"""
+def test_estimate_counts_match_sweep(toyInstanceWithHints):
+  A,b,q,s,V,L = toyInstanceWithHints
+  V = V.copy()
+  V[0,0] = 0
+  L = V.dot(s)
+  counts = [0,1,2,5,15]
+  
+  lattice = LWELattice(A,b,q)
+  lattice.integratePerfectHints( V, L )
+  estimate = lattice.estimate( 1, counts = counts )
+  
+  assert np.isfinite( estimate["logVolume"] ).all()
+  
+  for i, k in enumerate(counts):
+    sweepLattice = LWELattice(A,b,q)
+    sweepLattice.integratePerfectHints( V[:k], L[:k] )
+    
+    assert sweepLattice.estimate(1) == { key: estimate[key][i] for key in estimate }
+    
+    sweepLattice.selectSamples( sigma = 1 )
+    assert sweepLattice.estimate(1)["logCost"] <= estimate["logCost"][i]
+  
+  blocksizes = LWELattice(A,b,q).sweep( V, L, [5,15] )
+  
+  assert blocksizes[15] <= blocksizes[5]
+  assert estimate["blocksize"][-1] <= estimate["blocksize"][-2]
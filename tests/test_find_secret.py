@@ -0,0 +1,41 @@
+import numpy as np
+
+from lwe_with_hints import LWELattice
+
+"""
+  If the first row of A has entries in {-1,0,1}, then (A_0, 1, 0) for s = (1,0,...,0) is a lattice vector
+  shorter than the secret, which is found among the other reduced basis vectors.
+"""
+def test_secret_behind_shorter_vector(smallInstance):
+  A,b,q,s,e = smallInstance
+  rng = np.random.default_rng(4)
+  A = A.copy()
+  A[0] = rng.integers(-1, 2, 40) % q
+  b = ( s.dot(A) + e ) % q
+  
+  lattice = LWELattice(A,b,q, warmStart = True)
+  result = lattice.reduce( maxBlocksize = 4 )
+  
+  assert result["success"]
+  assert ( lattice.s == s ).all()
+  assert np.linalg.norm( list(lattice.basis[0]) ) < np.linalg.norm( result["shortestVector"] )
+
+"""
+  A vector of norm below the Gaussian heuristic with small coordinates of s is only accepted, if the centred error b - s*A mod q
+  is short as well. Shifting b by q/2 keeps the reduced basis, but leaves no vector, whose error is short.
+"""
+def test_secret_requires_short_error(smallInstance):
+  A,b,q,s,e = smallInstance
+  
+  lattice = LWELattice(A,b,q, warmStart = True)
+  assert lattice.reduce()["success"]
+  
+  basis = lattice.basis
+  bound = lattice._LWELattice__gaussianHeuristic(basis)
+  findSecret = lambda: lattice._LWELattice__findSecret( basis, None, False, range(basis.nrows), None, bound )
+  
+  assert findSecret() is not None
+  
+  lattice._LWELattice__b = ( b + q//2 ) % q
+  
+  assert findSecret() is None
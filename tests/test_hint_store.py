@@ -0,0 +1,62 @@
+import numpy as np
+
+from lwe_with_hints import LWELattice
+from lwe_with_hints.hint_store import HintStore
+
+"""
+  Hints beyond the initial capacity are kept in order, together with their moduli.
+"""
+def test_hint_store_grows():
+  rng = np.random.default_rng(1)
+  V = rng.integers(-5, 5, (10,6))
+  L = rng.integers(-5, 5, 10)
+  
+  hints = HintStore(6, capacity = 3)
+  hints.append( V[:4], L[:4], 7 )
+  hints.append( V[4:], L[4:], np.arange(6) )
+  
+  assert len(hints) == 10
+  assert ( hints.vectors == V ).all()
+  assert ( hints.values == L ).all()
+  assert list( hints.moduli ) == [7]*4 + list( range(6) )
+
+"""
+  Substituting s_i = value - <f,s> keeps <v,s> = l for every hint.
+"""
+def test_hint_store_substitute():
+  rng = np.random.default_rng(2)
+  s = rng.integers(-3, 4, 6)
+  V = rng.integers(-5, 5, (4,6))
+  f = np.array([ 1, 0, 0, 2, 0, -1 ])
+  
+  hints = HintStore(6)
+  hints.append( V, V.dot(s) )
+  hints.substitute( 1, f, s[1] + f.dot(s) )
+  
+  assert hints.vectors.shape == (4,5)
+  assert ( hints.vectors.dot( np.delete(s, 1) ) == hints.values ).all()
+
+"""
+  A batch of hints yields the same lattice as the hints integrated one by one.
+"""
+def test_batch_integration(smallInstance):
+  A,b,q,s,e = smallInstance
+  rng = np.random.default_rng(3)
+  V = rng.integers(0, q, (6,30))
+  
+  single = LWELattice(A,b,q)
+  for v in V[:3]:
+    single.integratePerfectHint( v, v.dot(s) )
+  for v in V[3:]:
+    single.integrateModularHint( v, v.dot(s) % q, q )
+  
+  batch = LWELattice(A,b,q)
+  batch.integratePerfectHints( V[:3], V[:3].dot(s) )
+  batch.integrateModularHints( V[3:], V[3:].dot(s) % q, q )
+  
+  assert single.estimate(1) == batch.estimate(1)
+  
+  result = batch.reduce()
+  
+  assert result["success"]
+  assert ( batch.s == s ).all()
@@ -0,0 +1,127 @@
+import warnings
+import numpy as np
+import pytest
+
+from lwe_with_hints import LWELattice
+from lwe_with_hints.hint_validator import HintValidator
+
+"""
+  Implied hints are reported, for every modulus separately.
+"""
+def test_validator_detects_implied_hints():
+  validator = HintValidator(4)
+  
+  independent = validator.append( np.array([ [1,2,0,0], [0,1,1,0], [1,3,1,0] ]), [3,2,5] )
+  assert list(independent) == [True, True, False]
+  assert validator.rank() == 2
+  
+  independent = validator.append( np.array([ [0,0,1,1], [0,0,2,2], [1,2,0,0] ]), [3,6,3], 7 )
+  assert list(independent) == [True, False, False]
+  assert validator.rank(7) == 3
+
+"""
+  A contradicting hint rejects the whole batch.
+"""
+def test_validator_rejects_contradictions():
+  validator = HintValidator(4)
+  validator.append( np.array([ [1,2,0,0] ]), [3] )
+  
+  with pytest.raises(ValueError):
+    validator.append( np.array([ [0,0,1,0], [2,4,0,0] ]), [1,7] )
+  
+  assert validator.rank() == 1
+
+"""
+  Perfect hints are checked modulo the moduli of modular hints, both before and after these.
+"""
+def test_validator_checks_perfect_hints_mod_q():
+  validator = HintValidator(4)
+  validator.append( np.array([ [1,1,0,0] ]), [1], 2 )
+  
+  with pytest.raises(ValueError):
+    validator.append( np.array([ [1,3,0,0] ]), [4] )
+  
+  validator.append( np.array([ [0,0,1,0] ]), [5] )
+  
+  with pytest.raises(ValueError):
+    validator.append( np.array([ [0,0,1,0] ]), [1], 3 )
+  
+  assert validator.rank() == 1
+  assert validator.rank(2) == 2
+
+"""
+  Moduli of at least 2^31 are reduced with Python integers instead of int64.
+"""
+def test_validator_with_large_modulus():
+  p = 2**61 - 1
+  validator = HintValidator(4)
+  
+  independent = validator.append( np.array([ [p-1,2,0,0], [0,p-2,1,0], [p-1,p,1,0] ]), [3,2,5], p )
+  assert list(independent) == [True, True, False]
+  
+  with pytest.raises(ValueError):
+    validator.append( np.array([ [2*p-2,4,0,0] ]), [7], p )
+  
+  assert validator.rank(p) == 2
+
+"""
+  A batch of more than n perfect hints changes neither the validator nor the lattice.
+"""
+def test_hint_limit_is_checked_first(smallInstance):
+  A,b,q,s,e = smallInstance
+  V = np.eye(30, dtype=int)
+  
+  lattice = LWELattice(A,b,q)
+  lattice.integratePerfectHint( V[0], s[0] )
+  
+  with pytest.raises(ValueError):
+    lattice.integratePerfectHints( V, V.dot(s) )
+  
+  with warnings.catch_warnings():
+    warnings.simplefilter("error")
+    lattice.integratePerfectHints( V[1:-1], V[1:-1].dot(s) )
+  
+  result = lattice.reduce()
+  
+  assert result["success"]
+  assert ( lattice.s == s ).all()
+
+"""
+  The lattice ignores implied hints with a warning and rejects contradicting hints.
+"""
+def test_lattice_validates_hints(smallInstance):
+  A,b,q,s,e = smallInstance
+  v = np.arange(30)
+  
+  lattice = LWELattice(A,b,q)
+  lattice.integratePerfectHint( v, v.dot(s) )
+  
+  with pytest.warns(RuntimeWarning):
+    lattice.integratePerfectHint( 2*v, 2*v.dot(s) )
+  
+  with pytest.raises(ValueError):
+    lattice.integratePerfectHint( 3*v, 3*v.dot(s) + 1 )
+  
+  result = lattice.reduce()
+  
+  assert result["success"]
+  assert ( lattice.s == s ).all()
+
+"""
+  Hints integrated with validate=False are neither checked nor known to the checks of later hints.
+"""
+def test_lattice_without_validation(smallInstance):
+  A,b,q,s,e = smallInstance
+  v = np.arange(30)
+  
+  lattice = LWELattice(A,b,q)
+  lattice.integratePerfectHint( v, v.dot(s), validate = False )
+  
+  with warnings.catch_warnings():
+    warnings.simplefilter("error")
+    lattice.integrateModularHint( 2*v, 2*v.dot(s) % q, q )
+  
+  result = lattice.reduce()
+  
+  assert result["success"]
+  assert ( lattice.s == s ).all()
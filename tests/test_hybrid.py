@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from lwe_with_hints import LWELattice
+
+"""
+  The guessed coordinates refer to the full secret, also after a coordinate before them has been substituted.
+"""
+def test_hybrid_finds_guess(smallInstance):
+  A,b,q,s,e = smallInstance
+  
+  lattice = LWELattice(A,b,q)
+  lattice.integratePerfectHint( np.eye(30, dtype=int)[0], s[0] )
+  result = lattice.reduceHybrid( [1,2], values = range(-2,3), workers = 2, blocksize = 10 )
+  
+  assert result["success"]
+  assert ( result["guess"] == s[1:3] ).all()
+  assert ( result["s"] == s ).all()
+  assert ( lattice.s == s ).all()
+  assert 0 < result["guesses"] <= 25
+
+"""
+  Coordinates, which have been substituted by perfect hints, can't be guessed.
+"""
+def test_hybrid_rejects_substituted_coordinates(smallInstance):
+  A,b,q,s,e = smallInstance
+  
+  lattice = LWELattice(A,b,q)
+  lattice.integratePerfectHint( np.eye(30, dtype=int)[0], s[0] )
+  
+  with pytest.raises(ValueError):
+    lattice.reduceHybrid( [0,1] )
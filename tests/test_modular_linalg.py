@@ -0,0 +1,59 @@
+import numpy as np
+
+from lwe_with_hints.modular_linalg import mulMod, gaussianElimination, wordPrimes, crt, eliminateModPrimes
+
+#Modulus of Kyber
+q = 3329
+
+"""
+  The chunked floating point product agrees with the exact product mod q.
+"""
+def test_mulMod_is_exact():
+  rng = np.random.default_rng(1)
+  X = rng.integers(0, q, (20,300))
+  Y = rng.integers(0, q, (300,15))
+  
+  assert ( mulMod(X,Y,q) == X.astype(object).dot( Y.astype(object) ) % q ).all()
+
+"""
+  The eliminated system x*M' = y' has the same solution x, and the rows pivots of M' are unit vectors.
+"""
+def test_gaussianElimination_keeps_solution():
+  rng = np.random.default_rng(2)
+  M = rng.integers(0, q, (30,40))
+  x = rng.integers(0, q, 30)
+  y = x.dot(M) % q
+  
+  for blockSize in [None, 4]:
+    M_, y_, pivots = gaussianElimination(M, y, 10, q, blockSize = blockSize)
+    
+    assert len(pivots) == 10
+    assert ( x.dot(M_) % q == y_ ).all()
+    assert ( M_[pivots,:10] == np.eye(10, dtype=int) ).all()
+    assert ( M_[pivots,10:] == 0 ).all()
+
+"""
+  Signed integers are recovered from their residues modulo word-size primes.
+"""
+def test_crt_recovers_signed_integers():
+  rng = np.random.default_rng(3)
+  primes = wordPrimes(62)
+  X = rng.integers(-2**60, 2**60, 50).astype(object)
+  
+  assert ( crt( np.stack([ X % p for p in primes ]), primes ) == X ).all()
+
+"""
+  The pivot rows become unit vectors modulo every prime, and the determinant of the eliminated minor is recovered via CRT.
+"""
+def test_eliminateModPrimes():
+  rng = np.random.default_rng(4)
+  primes = wordPrimes(62)
+  M = rng.integers(-50, 50, (6,8))
+  
+  R, pivots, dets = eliminateModPrimes(M, primes)
+  
+  assert pivots == list(range(6))
+  for i in range(len(primes)):
+    assert ( R[i][pivots] == np.eye(6, 8, dtype=int) ).all()
+  
+  assert abs( crt( dets, primes ) ) == abs( round( np.linalg.det( M[:,:6] ) ) )
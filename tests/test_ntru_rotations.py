@@ -0,0 +1,69 @@
+import numpy as np
+
+from falcon_gen.ntt import div_zq
+
+from lwe_with_hints import LWELattice
+from lwe_with_hints.lwe_gen import rotMatrix
+
+"""
+  Falcon-like instance A = H, b = 0 with the key s = f, e = -g of degree 16, built from a fixed seed.
+"""
+def falconInstance():
+  rng = np.random.default_rng(11)
+  n, q = 16, 12289
+  
+  while True:
+    f = rng.integers(-4, 5, n)
+    g = rng.integers(-4, 5, n)
+    
+    try:
+      h = div_zq( [ int(x) for x in g ], [ int(x) for x in f ] )
+      break
+    except ZeroDivisionError:
+      continue
+  
+  A = rotMatrix(h, cyclotomic = True)
+  
+  return A, np.zeros(n, dtype=int), q, f
+
+"""
+  Without hints, any rotation or negation of the key is a solution.
+"""
+def test_rotation_of_key_is_accepted():
+  A,b,q,f = falconInstance()
+  R = rotMatrix(f, cyclotomic = True)
+  
+  lattice = LWELattice(A,b,q)
+  result = lattice.reduce()
+  
+  assert result["success"]
+  assert any( ( lattice.s == r ).all() or ( lattice.s == -r ).all() for r in R )
+
+"""
+  Coordinate hints single out the key itself among its rotations.
+"""
+def test_hints_select_rotation():
+  A,b,q,f = falconInstance()
+  
+  lattice = LWELattice(A,b,q)
+  lattice.integratePerfectHint( np.eye(16, dtype=int)[0], f[0] )
+  lattice.integratePerfectHint( np.eye(16, dtype=int)[1], f[1] )
+  result = lattice.reduce()
+  
+  assert result["success"]
+  assert ( lattice.s == f ).all()
+
+"""
+  Without Kannan embedding, i.e., for b = 0 and weighted hints with value 0, the secret is not scaled with the hint weights.
+"""
+def test_weighted_hints_without_embedding():
+  A,b,q,f = falconInstance()
+  R = rotMatrix(f, cyclotomic = True)
+  
+  lattice = LWELattice(A,b,q, secretVariance = 6.67)
+  for i in np.flatnonzero( f == 0 )[:2]:
+    lattice.integrateApproximateHint( np.eye(16, dtype=int)[i], 0, 1 )
+  result = lattice.reduce()
+  
+  assert result["success"]
+  assert any( ( lattice.s == r ).all() or ( lattice.s == -r ).all() for r in R )
@@ -0,0 +1,77 @@
+from fpylll.util import ReductionError
+
+import lwe_with_hints.lwe_lattice
+from lwe_with_hints import LWELattice
+
+"""
+  LLL, which fails numerically for the float types double and long double.
+"""
+class FailingLLL:
+  def __init__(self, lll, M):
+    self.__lll = lll
+    self.__M = M
+  
+  def __call__(self, *args, **kwargs):
+    if self.__M.float_type in ["double", "long double"]:
+      raise ReductionError("Simulated failure for float type %s." % self.__M.float_type)
+    
+    return self.__lll(*args, **kwargs)
+  
+  def __getattr__(self, name):
+    return getattr(self.__lll, name)
+
+class FailingBKZReduction(lwe_with_hints.lwe_lattice.BKZReduction):
+  def __init__(self, M):
+    super().__init__(M)
+    self.lll_obj = FailingLLL(self.lll_obj, M)
+
+"""
+  Warm start recovers the tracking coefficients from the reduced basis and the hints after the reduction,
+  so the entries of the basis are stored as long, also when the reduced basis is intersected with a new hint.
+"""
+def test_warm_start_recovers_tracking_with_long(easyInstance):
+  A,b,q,s,e = easyInstance
+  
+  lattice = LWELattice(A,b,q, warmStart = True)
+  lattice.integratePerfectHint( [3]*20, 3*sum(s) )
+  result = lattice.reduce()
+  
+  assert result["success"]
+  assert ( result["s"] == s ).all()
+  assert lattice.intType == "long"
+  
+  lattice.integratePerfectHint( [2,3] + [0]*18, 2*s[0] + 3*s[1] )
+  result = lattice.reduce()
+  
+  assert result["success"]
+  assert ( result["s"] == s ).all()
+  assert lattice.intType == "long"
+
+"""
+  Without warm start, no tracking matrix is kept, and the small entries of the basis are stored as long.
+"""
+def test_without_tracking_uses_long(easyInstance):
+  A,b,q,s,e = easyInstance
+  
+  lattice = LWELattice(A,b,q)
+  lattice.integratePerfectHint( [1,2] + [0]*18, s[0] + 2*s[1] )
+  lattice.integratePerfectHint( [3]*20, 3*sum(s) )
+  result = lattice.reduce()
+  
+  assert result["success"]
+  assert ( result["s"] == s ).all()
+  assert lattice.intType == "long"
+
+"""
+  If LLL fails again after switching the float type, then the next float type is tried.
+"""
+def test_fallback_skips_failing_float_types(monkeypatch, easyInstance):
+  monkeypatch.setattr( lwe_with_hints.lwe_lattice, "BKZReduction", FailingBKZReduction )
+  A,b,q,s,e = easyInstance
+  
+  lattice = LWELattice(A,b,q)
+  result = lattice.reduce()
+  
+  assert result["success"]
+  assert ( result["s"] == s ).all()
+  assert lattice.floatType not in ["double", "long double"]
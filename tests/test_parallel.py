@@ -0,0 +1,26 @@
+import pytest
+
+from lwe_with_hints import LWELattice, BKZSchedule
+
+"""
+  The lattice takes the state of the winning worker, which found the secret.
+"""
+def test_reduce_parallel(smallInstance):
+  A,b,q,s,e = smallInstance
+  
+  lattice = LWELattice(A,b,q)
+  result = lattice.reduceParallel( workers = 2, seed = 1 )
+  
+  assert result["success"]
+  assert result["variant"] in [0,1]
+  assert ( lattice.s == s ).all()
+  assert ( result["s"] == s ).all()
+
+"""
+  The number of schedules has to match the number of workers.
+"""
+def test_reduce_parallel_checks_schedules(smallInstance):
+  A,b,q,s,e = smallInstance
+  
+  with pytest.raises(ValueError):
+    LWELattice(A,b,q).reduceParallel( workers = 2, schedules = [ BKZSchedule() ] )
@@ -0,0 +1,39 @@
+import numpy as np
+
+from lwe_with_hints import LWELattice
+from lwe_with_hints.lwe_gen import ringHints, rotMatrix
+
+"""
+  The hints of a relation c*s = l hold for s, mod X^n-1 and mod X^n+1, also for a subset of the coefficients of l
+  and for s consisting of several polynomials.
+"""
+def test_ring_hints_hold():
+  rng = np.random.default_rng(1)
+  c = rng.integers(-3, 4, (2,8))
+  s = rng.integers(-2, 3, (2,8))
+  
+  for cyclotomic in [False, True]:
+    l = s[0].dot( rotMatrix( c[0], cyclotomic ) )
+    V,L = ringHints( c[0], l, cyclotomic )
+    assert ( V.dot( s[0] ) == L ).all()
+    
+    l = s[0].dot( rotMatrix( c[0], cyclotomic ) ) + s[1].dot( rotMatrix( c[1], cyclotomic ) )
+    V,L = ringHints( c, l[[1,5]], cyclotomic, coefficients = [1,5] )
+    assert V.shape == (2,16)
+    assert ( V.dot( s.flatten() ) == L ).all()
+
+"""
+  The hints of a sparse polynomial vanish on the first coordinates, so they take the columns of other coordinates.
+"""
+def test_sparse_ring_hints(smallInstance):
+  A,b,q,s,e = smallInstance
+  c = np.zeros(30, dtype=int)
+  c[10:15] = [1,-2,1,3,-1]
+  coefficients = [0,1,2]
+  
+  lattice = LWELattice(A,b,q)
+  lattice.integrateRingHint( c, s.dot( rotMatrix(c) )[coefficients], coefficients = coefficients )
+  result = lattice.reduce()
+  
+  assert result["success"]
+  assert ( lattice.s == s ).all()
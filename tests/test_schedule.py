@@ -0,0 +1,106 @@
+import time
+import pytest
+from fpylll import BKZ
+
+from lwe_with_hints import LWELattice, BKZSchedule
+
+"""
+  The blocksizes increase by step, starting at the larger of startBlocksize and the reached blocksize,
+  and always end exactly at maxBlocksize.
+"""
+def test_blocksizes_end_at_max_blocksize():
+  schedule = BKZSchedule( step = 3 )
+  
+  assert list( schedule.blocksizes(2, 10) ) == [2, 5, 8, 10]
+  assert list( schedule.blocksizes(2, 11) ) == [2, 5, 8, 11]
+  assert list( schedule.blocksizes(6, 10) ) == [6, 9, 10]
+  assert list( schedule.blocksizes(10, 10) ) == [10]
+  assert list( schedule.blocksizes(12, 10) ) == []
+  
+  assert list( BKZSchedule( startBlocksize = 4 ).blocksizes(0, 7) ) == [4, 5, 6, 7]
+
+"""
+  Invalid schedules are rejected.
+"""
+@pytest.mark.parametrize( "params", [ { "startBlocksize": 1 }, { "step": 0 }, { "tours": 0 }, { "loops": 0 } ] )
+def test_invalid_schedule(params):
+  with pytest.raises(ValueError):
+    BKZSchedule( **params )
+
+"""
+  With autoAbort, BKZ stops by itself, and a blocksize stagnates, as soon as a call does not improve the slope of the GSO profile.
+"""
+def test_auto_abort():
+  schedule = BKZSchedule( autoAbort = True, loops = 4 )
+  par = schedule.parameters( 10, time.time() )
+  
+  assert par.block_size == 10
+  assert par.max_loops == 4
+  assert par.flags & BKZ.AUTO_ABORT
+  assert schedule.stagnates( -0.05, -0.05 )
+  assert schedule.stagnates( -0.05, -0.06 )
+  assert not schedule.stagnates( -0.05, -0.04 )
+  
+  schedule = BKZSchedule()
+  
+  assert not schedule.parameters( 10, time.time() ).flags & BKZ.AUTO_ABORT
+  assert not schedule.stagnates( -0.05, -0.05 )
+
+"""
+  With timePerStep, every call of BKZ gets the remainder of the time budget of its blocksize, and none is left after the budget.
+"""
+def test_time_per_step():
+  schedule = BKZSchedule( timePerStep = 10 )
+  par = schedule.parameters( 10, time.time() - 4 )
+  
+  assert par.flags & BKZ.MAX_TIME
+  assert 0 < par.max_time <= 6
+  assert schedule.parameters( 10, time.time() - 11 ) is None
+  
+  assert not BKZSchedule().parameters( 10, time.time() - 11 ).flags & BKZ.MAX_TIME
+
+"""
+  reduce() runs a non-default schedule: BKZ starts at startBlocksize and increases the blocksize by step.
+"""
+def test_reduce_with_schedule(toyInstance, capsys):
+  A,b,q,s,e = toyInstance
+  
+  lattice = LWELattice(A,b,q, verbose = True)
+  result = lattice.reduce( schedule = BKZSchedule( startBlocksize = 3, step = 2, tours = 2, autoAbort = True ) )
+  
+  out = capsys.readouterr().out
+  blocksizes = [ int( line.split()[-1][:-1] ) for line in out.splitlines() if line.startswith("Starting BKZ with blocksize") ]
+  
+  assert result["success"]
+  assert ( lattice.s == s ).all()
+  assert blocksizes[0] == 3
+  assert all( beta % 2 == 1 for beta in blocksizes )
+  assert set( result["timings"]["bkz"] ) == set(blocksizes)
+  assert result["successBlocksize"] == blocksizes[-1]
+
+"""
+  The simulator predicts a small blocksize from the expected norm of (e,s,1), which is derived from the secret variance.
+"""
+def test_simulator_uses_secret_variance(toyInstance):
+  A,b,q,s,e = toyInstance
+  
+  lattice = LWELattice(A,b,q, secretVariance = 1)
+  result = lattice.reduce( schedule = BKZSchedule( simulate = True ) )
+  
+  assert result["success"]
+  assert lattice.predictedBlocksize is not None
+  assert lattice.predictedBlocksize <= 10
+  assert ( lattice.s == s ).all()
+
+"""
+  Without an expected norm of (e,s,1), no blocksize is predicted.
+"""
+def test_simulator_without_expected_length(toyInstance):
+  A,b,q,s,e = toyInstance
+  
+  lattice = LWELattice(A,b,q)
+  result = lattice.reduce( schedule = BKZSchedule( simulate = True ) )
+  
+  assert result["success"]
+  assert lattice.predictedBlocksize is None
+  assert result["successBlocksize"] <= 10
@@ -0,0 +1,163 @@
+import os
+import random
+import numpy as np
+import pytest
+
+from lwe_with_hints import LWELattice, generateToyInstance, loadLWEInstanceFromFile
+
+TUTORIAL_INSTANCE = os.path.join( os.path.dirname(__file__), "..", "tutorial", "lwe_instance.json" )
+
+"""
+  Returns the error b - s*A, centered mod q.
+"""
+def centeredError(A,b,q,s):
+  e = ( b - s.dot(A) ) % q
+  e[e > q//2] -= q
+  return e
+
+"""
+  Perfect and modular hints with every sublattice construction.
+"""
+@pytest.mark.parametrize( "options", [ {}, { "kernelSublattice": True }, { "dualSublattice": True } ] )
+def test_toy_instance_with_hints(options, smallInstance):
+  A,b,q,s,e = smallInstance
+  V = np.array([ [ random.randrange(q) for _ in range(30) ] for _ in range(4) ])
+  
+  lattice = LWELattice(A,b,q, **options)
+  lattice.integratePerfectHints( V[:2], V[:2].dot(s) )
+  lattice.integrateModularHints( V[2:], V[2:].dot(s) % q, q )
+  lattice.integrateModularHint( np.ones(30, dtype=int), np.sum(s) % 2, 2 )
+  result = lattice.reduce()
+  
+  assert result["success"]
+  assert ( lattice.s == s ).all()
+
+"""
+  Without a tracking matrix, the coordinates of s, which are not part of the lattice vector, are recovered
+  from the perfect, approximate and mod-q hints, also if the columns are scaled for weighted hints.
+"""
+def test_secret_from_lattice_vector(smallInstance):
+  A,b,q,s,e = smallInstance
+  V = np.array([ [ random.randrange(q) for _ in range(30) ] for _ in range(5) ])
+  
+  lattice = LWELattice(A,b,q, secretVariance = 1)
+  lattice.integratePerfectHints( V[:2], V[:2].dot(s) )
+  lattice.integrateApproximateHint( V[2], V[2].dot(s) + 1 )
+  lattice.integrateApproximateHint( V[3], V[3].dot(s) - 1, 2 )
+  lattice.integrateModularHint( V[4], V[4].dot(s) % q, q )
+  result = lattice.reduce()
+  
+  assert result["success"]
+  assert ( lattice.s == s ).all()
+
+"""
+  If coordinate hints determine every coordinate of s, then all of them are substituted, and s is returned without a reduction.
+"""
+def test_coordinate_hints_determine_secret(easyInstance):
+  A,b,q,s,e = easyInstance
+  
+  lattice = LWELattice(A,b,q)
+  for i in range(20):
+    lattice.integratePerfectHint( np.eye(20, dtype=int)[i], s[i] )
+  result = lattice.reduce()
+  
+  assert result["success"]
+  assert ( lattice.s == s ).all()
+  assert ( result["shortestVector"] == e ).all()
+
+"""
+  A hint integrated after a reduction is intersected with the reduced basis.
+"""
+def test_toy_instance_warm_start(smallInstance):
+  A,b,q,s,e = smallInstance
+  
+  lattice = LWELattice(A,b,q, warmStart = True)
+  lattice.integratePerfectHint( np.eye(30, dtype=int)[0], s[0] )
+  lattice.reduce()
+  lattice.integratePerfectHint( np.arange(30), np.arange(30).dot(s) )
+  result = lattice.reduce()
+  
+  assert result["success"]
+  assert ( lattice.s == s ).all()
+
+"""
+  A coordinate hint after a reduction is not substituted, but intersected with the reduced basis as well.
+"""
+def test_warm_start_with_coordinate_hint(smallInstance, capsys):
+  A,b,q,s,e = smallInstance
+  
+  lattice = LWELattice(A,b,q, warmStart = True, verbose = True)
+  lattice.integratePerfectHint( np.arange(30), np.arange(30).dot(s) )
+  lattice.reduce()
+  capsys.readouterr()
+  
+  lattice.integratePerfectHint( np.eye(30, dtype=int)[3], s[3] )
+  result = lattice.reduce()
+  
+  out = capsys.readouterr().out
+  assert "Substituting" not in out
+  assert "Deriving lattice from previously reduced basis." in out
+  assert result["success"]
+  assert ( lattice.s == s ).all()
+
+"""
+  After a failed reduction up to blocksize 4, warm start with further hints reports the blocksize, at which it finds the secret,
+  rather than the blocksize reached before, which is not larger than the one of a cold start with all hints.
+"""
+def test_warm_start_compared_to_cold_start(toyInstanceWithHints):
+  A,b,q,s,V,L = toyInstanceWithHints
+  
+  warm = LWELattice(A,b,q, warmStart = True)
+  warm.integratePerfectHints( V[:2], L[:2] )
+  assert not warm.reduce( maxBlocksize = 4 )["success"]
+  warm.integratePerfectHints( V[2:5], L[2:5] )
+  warmResult = warm.reduce()
+  
+  cold = LWELattice(A,b,q)
+  cold.integratePerfectHints( V[:5], L[:5] )
+  coldResult = cold.reduce()
+  
+  assert warmResult["success"] and coldResult["success"]
+  assert ( warm.s == s ).all() and ( cold.s == s ).all()
+  assert warmResult["successBlocksize"] <= coldResult["successBlocksize"]
+
+"""
+  After a failed reduction up to blocksize 12, warm start with further hints resumes BKZ at blocksize 10 (see WARM_START_OFFSET).
+"""
+def test_warm_start_resumes_below_reached_blocksize(capsys):
+  random.seed(1)
+  A,b,q,s,e = generateToyInstance(70,45,521,2)
+  V = np.array([ [ random.randrange(q) for _ in range(70) ] for _ in range(2) ])
+  
+  lattice = LWELattice(A,b,q, warmStart = True, verbose = True)
+  assert not lattice.reduce( maxBlocksize = 12 )["success"]
+  capsys.readouterr()
+  
+  lattice.integratePerfectHints( V, V.dot(s) )
+  result = lattice.reduce()
+  
+  out = capsys.readouterr().out
+  assert "Starting BKZ with blocksize 10." in out
+  assert "Starting BKZ with blocksize 9." not in out
+  assert result["success"]
+  assert ( lattice.s == s ).all()
+
+"""
+  The attack of tutorial.py with hints.
+"""
+def test_tutorial_instance():
+  A,b,q = loadLWEInstanceFromFile(TUTORIAL_INSTANCE)
+  n = len(A)
+  
+  lattice = LWELattice(A,b,q)
+  lattice.integratePerfectHint( np.eye(n, dtype=int)[0], 0 )
+  lattice.integratePerfectHint( np.eye(n, dtype=int)[1], 0 )
+  lattice.integratePerfectHint( np.eye(n, dtype=int)[2], 2 )
+  lattice.integratePerfectHint( np.eye(n, dtype=int)[3], 1 )
+  lattice.integrateModularHint( np.ones(n, dtype=int), 0, 2 )
+  result = lattice.reduce()
+  
+  assert result["success"]
+  assert list( lattice.s[:4] ) == [0, 0, 2, 1]
+  assert np.sum( lattice.s ) % 2 == 0
+  assert np.max( np.abs( centeredError(A,b,q,lattice.s) ) ) <= 3
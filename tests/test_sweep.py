@@ -0,0 +1,55 @@
+from lwe_with_hints import LWELattice
+
+"""
+  A reduced basis, which contains the secret, must not be reused, since every count would then report blocksize 0.
+"""
+def test_descending_and_ascending_sweeps_agree(toyInstanceWithHints):
+  A,b,q,s,V,L = toyInstanceWithHints
+  counts = [0,5,10,15]
+  
+  descending = LWELattice(A,b,q).sweep( V, L, counts )
+  
+  lattice = LWELattice(A,b,q)
+  ascending = lattice.sweep( V, L, counts, ascending = True )
+  
+  assert descending == ascending
+  assert descending[0] > 0
+  assert ( lattice.s == s ).all()
+
+"""
+  Counts, for which the secret is not found, are reported as None.
+"""
+def test_sweep_reports_failures(toyInstanceWithHints):
+  A,b,q,s,V,L = toyInstanceWithHints
+  
+  blocksizes = LWELattice(A,b,q).sweep( V, L, [0,1,10], maxBlocksize = 3 )
+  
+  assert blocksizes[10] is not None
+  assert blocksizes[0] is None
+
+"""
+  A reused basis is reduced again from the first blocksize of the schedule.
+"""
+def test_sweep_restarts_schedule(toyInstanceWithHints, capsys):
+  A,b,q,s,V,L = toyInstanceWithHints
+  
+  LWELattice(A,b,q, verbose = True).sweep( V, L, [0,1], maxBlocksize = 3 )
+  
+  reused = capsys.readouterr().out.split("Sweep: Reducing lattice with 0 hints.")[1]
+  assert "Starting BKZ with blocksize 2." in reused
+
+"""
+  After a success, an ascending sweep intersects the basis, which is reduced up to the blocksize before successBlocksize,
+  with the additional hints, instead of reducing the lattice from scratch.
+"""
+def test_ascending_sweep_reuses_successful_reduction(toyInstanceWithHints, capsys):
+  A,b,q,s,V,L = toyInstanceWithHints
+  
+  lattice = LWELattice(A,b,q, verbose = True)
+  blocksizes = lattice.sweep( V, L, [0,5], ascending = True )
+  
+  reused = capsys.readouterr().out.split("Sweep: Reducing lattice with 5 hints.")[1]
+  assert "Deriving lattice from previously reduced basis." in reused
+  assert "Reducing lattice with 5 hints from scratch." not in reused
+  assert 0 < blocksizes[5] <= blocksizes[0]
+  assert ( lattice.s == s ).all()